@@ -0,0 +1,44 @@
+import random
+
+
+CATEGORY_NAMES = ("Смартфоны", "Трава газонная", "Продукты")
+
+
+def make_catalog_data(products_per_category: int = 1000, duplicate_ratio: float = 0.1, seed: int = 0) -> list:
+    """
+    Генерирует синтетический каталог в формате products.json.
+
+    :param products_per_category: Количество записей товаров в каждой категории.
+    :param duplicate_ratio: Доля записей, повторяющих наименование уже созданного товара.
+    :param seed: Начальное значение генератора случайных чисел.
+    :return: Список словарей категорий с ключами 'name', 'description' и 'products'.
+    """
+
+    rnd = random.Random(seed)
+    result = []
+
+    for category_name in CATEGORY_NAMES:
+        products = []
+
+        for index in range(products_per_category):
+            if products and rnd.random() < duplicate_ratio:
+                name = rnd.choice(products)["name"]
+            else:
+                name = f"{category_name} {index}"
+
+            prod = {"name": name, "description": f"Описание товара {name}", "price": round(rnd.uniform(10, 100000), 2),
+                    "quantity": rnd.randint(1, 100), "color": rnd.choice(("Черный", "Белый", "Зеленый"))}
+
+            match category_name:
+                case "Смартфоны":
+                    prod.update(efficiency=rnd.randint(1, 10), model_name=f"M{index}",
+                                internal_memory=rnd.choice((64, 128, 256)))
+                case "Трава газонная":
+                    prod.update(origin_country=rnd.choice(("Россия", "Нидерланды", "США")),
+                                germination_period=rnd.randint(5, 30))
+
+            products.append(prod)
+
+        result.append({"name": category_name, "description": f"Категория {category_name}", "products": products})
+
+    return result
@@ -0,0 +1,53 @@
+"""
+Масштабирование загрузки каталога из нескольких файлов поставщиков в зависимости от числа процессов.
+
+Файлы поставщиков генерируются с пересекающимися наименованиями товаров, поэтому при загрузке выполняется слияние.
+
+Запуск из корня проекта:
+    python -m benchmarks.feed_import --files 8 --products 20000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.catalog import make_catalog_data
+from src import feeds
+
+
+def main(files: int, products: int, max_workers: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+
+        for seed in range(files):
+            path = os.path.join(directory, f"supplier-{seed}.json")
+
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(make_catalog_data(products, seed=seed), file, ensure_ascii=False)
+
+            paths.append(path)
+
+        print(f"Файлов: {files}, записей: {files * products * 3}, ядер: {os.cpu_count()}")
+        workers = 1
+        baseline = None
+
+        while workers <= max_workers:
+            start = time.perf_counter()
+            merged = feeds.load_feeds(paths, workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            unique = sum(len(item["products"]) for item in merged)
+            print(f"Процессов: {workers:>3}  {elapsed:>7.2f} с  ускорение {baseline / elapsed:>5.2f}x  "
+                  f"уникальных товаров: {unique}")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--products", type=int, default=20000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    main(args.files, args.products, args.max_workers)
@@ -0,0 +1,54 @@
+"""
+Размер файла, время разбора и пиковая память при загрузке каталога из JSON, CSV и двоичного формата.
+
+Запуск из корня проекта:
+    python -m benchmarks.import_formats --products 50000
+"""
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.catalog import make_catalog_data
+from src import importers
+
+
+def measure(path: str) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    products = sum(len(item["products"]) for item in importers.load_catalog(path))
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return products, elapsed, peak
+
+
+def main(products: int) -> None:
+    data = make_catalog_data(products, duplicate_ratio=0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {extension: os.path.join(directory, f"catalog{extension}") for extension in (".json", ".csv", ".bin")}
+
+        with open(paths[".json"], "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+
+        importers.write_csv(data, paths[".csv"])
+        importers.write_binary(data, paths[".bin"])
+
+        for extension, path in paths.items():
+            count, elapsed, peak = measure(path)
+            print(f"{extension:<6} {os.path.getsize(path) / 2 ** 20:>7.1f} МБ {count / elapsed:>10.0f} товаров/с "
+                  f"пик памяти {peak / 2 ** 20:>7.1f} МБ")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=50000)
+    args = parser.parse_args()
+
+    main(args.products)
@@ -0,0 +1,57 @@
+"""
+Время импорта модулей проекта в отдельном процессе по данным python -X importtime.
+
+Для каждого модуля запускается новый интерпретатор, из отчета importtime берется суммарное время импорта модуля
+вместе с зависимостями, а в таблицу попадает медиана по нескольким запускам. Отдельно выводятся самые дорогие
+зависимости, чтобы было видно, какая подсистема замедляет запуск CLI.
+
+Запуск из корня проекта:
+    python -m benchmarks.import_time --repeat 5
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+MODULES = ("src", "src.utils", "main", "src.persistence", "src.service", "src.sqlite_category", "src.exporters")
+
+
+def import_times(statement: str) -> dict:
+    """
+    Выполняет инструкцию в новом процессе и возвращает суммарное время импорта каждого модуля в микросекундах.
+    """
+
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, check=True)
+    times = {}
+
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative, name = line.split("|")
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def main(repeat: int, top: int) -> None:
+    startup = set(import_times("pass"))
+
+    for module in MODULES:
+        runs = [import_times(f"import {module}") for _ in range(repeat)]
+        total = statistics.median(run[module] for run in runs)
+        names = [name for name in runs[0] if name != module and name not in startup
+                 and ("." not in name or name.startswith("src."))]
+        dependencies = sorted(((statistics.median(run.get(name, 0) for run in runs), name) for name in names),
+                              reverse=True)[:top]
+        print(f"{module:<22} {total / 1000:>7.1f} мс  "
+              + ", ".join(f"{name} {elapsed / 1000:.1f}" for elapsed, name in dependencies))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=3)
+    args = parser.parse_args()
+
+    main(args.repeat, args.top)
@@ -0,0 +1,70 @@
+"""
+Пропускная способность пакетной обработки заказов.
+
+Сравнивает OrderPipeline при разных размерах пакета с оформлением заказов по одному через поиск
+товара перебором категорий, как в utils.get_order.
+
+Запуск из корня проекта:
+    python -m benchmarks.order_throughput --orders 200000
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from benchmarks.catalog import make_catalog_data
+from src import logger
+from src.category import CategoryIter
+from src.order import Order
+from src.order_pipeline import OrderPipeline
+import src.utils as utils
+
+
+def load_catalog(products: int) -> list:
+    data = make_catalog_data(products, duplicate_ratio=0)
+
+    for item in data:
+        for prod in item["products"]:
+            prod["quantity"] = 10 ** 9
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return utils.category_init(data)
+
+
+def naive(categories_list: list, requests: list) -> None:
+    for name, quantity in requests:
+        for item in categories_list:
+            for prod in CategoryIter(item):
+                if prod.name == name:
+                    Order(prod, quantity).place()
+
+
+def main(orders: int, products: int) -> None:
+    logger.set_sink(logger.LogSink(level=logger.WARNING))
+    categories_list = load_catalog(products)
+    names = [prod.name for item in categories_list for prod in item.prod]
+    rnd = random.Random(0)
+    requests = [(rnd.choice(names), rnd.randint(1, 5)) for _ in range(orders)]
+
+    sample = requests[:max(1, orders // 100)]
+    start = time.perf_counter()
+    naive(categories_list, sample)
+    elapsed = time.perf_counter() - start
+    print(f"{'по одному, перебор':<28} {len(sample) / elapsed:>12.0f} заказов/с")
+
+    for batch_size in (64, 1024, 8192):
+        pipeline = OrderPipeline(categories_list, batch_size)
+        start = time.perf_counter()
+        fulfilled = sum(result.fulfilled for result in pipeline.process(requests))
+        elapsed = time.perf_counter() - start
+        print(f"{f'пакет {batch_size}':<28} {orders / elapsed:>12.0f} заказов/с (выполнено {fulfilled})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=200000)
+    parser.add_argument("--products", type=int, default=1000)
+    args = parser.parse_args()
+
+    main(args.orders, args.products)
@@ -0,0 +1,52 @@
+"""
+Стоимость создания одного продукта: create_product по одному против пакетной фабрики create_products.
+
+Запуск из корня проекта:
+    python -m benchmarks.product_factory --products 100000
+"""
+import argparse
+import gc
+import time
+
+from benchmarks.catalog import make_catalog_data
+from src import logger
+import src.utils as utils
+
+
+def measure(function, *args, repeat: int = 3) -> float:
+    best = float("inf")
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main(products: int) -> None:
+    logger.set_sink(logger.LogSink(level=logger.WARNING))
+
+    for item in make_catalog_data(products, duplicate_ratio=0):
+        product_class = utils.get_product_class(item["name"])
+        records = item["products"]
+        columns = {key: [record[key] for record in records] for key in records[0]}
+
+        single = measure(lambda: [product_class.create_product(record) for record in records])
+        batch = measure(product_class.create_products, records)
+        columnar = measure(product_class.create_products, columns)
+
+        print(f"{product_class.__name__}:")
+
+        for title, elapsed in (("create_product", single), ("create_products, словари", batch),
+                               ("create_products, столбцы", columnar)):
+            print(f"    {title:<28} {elapsed / len(records) * 1e9:>8.0f} нс/товар")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=100000)
+    args = parser.parse_args()
+
+    main(args.products)
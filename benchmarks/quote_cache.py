@@ -0,0 +1,71 @@
+"""
+Повторяющиеся запросы расчета заказа («цена за 3 шт. товара X»): Order на каждый запрос против QuoteCache.
+
+Запросы выбираются из небольшого набора популярных пар (товар, количество), часть запросов сопровождается
+изменением остатка, которое сбрасывает расчеты товара.
+
+Запуск из корня проекта:
+    python -m benchmarks.quote_cache --requests 200000
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from benchmarks.catalog import make_catalog_data
+from src import logger
+from src.order import Order
+from src.quote_cache import QuoteCache
+import src.utils as utils
+
+
+def main(requests: int, popular: int, write_ratio: float) -> None:
+    logger.set_sink(logger.LogSink(level=logger.WARNING))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        categories_list = utils.category_init(make_catalog_data(10000, duplicate_ratio=0))
+
+    rnd = random.Random(0)
+    products = [prod for item in categories_list for prod in item.prod]
+    pairs = [(rnd.choice(products), rnd.randint(1, 5)) for _ in range(popular)]
+    workload = [(rnd.choice(pairs), rnd.random() < write_ratio) for _ in range(requests)]
+
+    start = time.perf_counter()
+
+    for (prod, quantity), write in workload:
+        if write:
+            prod.stock_quantity += 1
+
+        order = Order(prod, quantity)
+        order.get_total_price(), order.is_can_buy(), str(order)
+
+    direct = time.perf_counter() - start
+    cache = QuoteCache()
+    cache.attach()
+
+    try:
+        start = time.perf_counter()
+
+        for (prod, quantity), write in workload:
+            if write:
+                prod.stock_quantity += 1
+
+            cache.quote(prod, quantity)
+
+        cached = time.perf_counter() - start
+    finally:
+        cache.detach()
+
+    print(f"Order на каждый запрос: {direct / requests * 1e6:>6.2f} мкс/запрос")
+    print(f"QuoteCache:             {cached / requests * 1e6:>6.2f} мкс/запрос  {cache.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200000)
+    parser.add_argument("--popular", type=int, default=1000)
+    parser.add_argument("--write-ratio", type=float, default=0.01)
+    args = parser.parse_args()
+
+    main(args.requests, args.popular, args.write_ratio)
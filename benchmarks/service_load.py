@@ -0,0 +1,80 @@
+"""
+Нагрузочный тест асинхронного сервиса каталога.
+
+Запуск из корня проекта:
+    python -m benchmarks.service_load --clients 100 --requests 200
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import random
+import statistics
+import time
+
+from benchmarks.catalog import make_catalog_data
+from src import logger
+from src.service import CatalogService
+import src.utils as utils
+
+
+async def run_client(port: int, names: list, requests_count: int, latencies: list, seed: int) -> None:
+    rnd = random.Random(seed)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+    for _ in range(requests_count):
+        kind = rnd.random()
+
+        if kind < 0.7:
+            request = {"op": "price", "name": rnd.choice(names)}
+        elif kind < 0.9:
+            request = {"op": "lookup", "name": rnd.choice(names)}
+        elif kind < 0.99:
+            request = {"op": "order", "name": rnd.choice(names), "quantity": 1}
+        else:
+            request = {"op": "stats"}
+
+        start = time.perf_counter()
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        await reader.readline()
+        latencies.append(time.perf_counter() - start)
+
+    writer.close()
+    await writer.wait_closed()
+
+
+async def main(clients: int, requests_count: int, products: int) -> None:
+    logger.set_sink(logger.LogSink(level=logger.WARNING))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        categories_list = utils.category_init(make_catalog_data(products))
+
+    service = CatalogService(categories_list)
+    server = await service.serve(port=0)
+    port = server.sockets[0].getsockname()[1]
+    names = [prod.name for item in categories_list for prod in item.prod]
+    latencies = []
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_client(port, names, requests_count, latencies, seed) for seed in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    server.close()
+    await server.wait_closed()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"Клиентов: {clients}, запросов: {len(latencies)}, время: {elapsed:.2f} с, "
+          f"{len(latencies) / elapsed:.0f} запросов/с")
+    print(f"p50: {quantiles[49] * 1000:.3f} мс, p99: {quantiles[98] * 1000:.3f} мс")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--products", type=int, default=1000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.clients, args.requests, args.products))
@@ -0,0 +1,81 @@
+"""
+Пиковая память и время загрузки и обхода каталога при разных бюджетах SpillingCatalog.
+
+Каталог из нескольких категорий записывается в двоичный файл и загружается потоковым импортером, после чего все
+категории обходятся по кругу. Бюджет 0 означает обычный utils.category_init без ограничения памяти.
+
+Запуск из корня проекта:
+    python -m benchmarks.spilling_catalog --categories 20 --products 10000
+"""
+import argparse
+import contextlib
+import gc
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.catalog import make_catalog_data
+from src import importers, logger
+from src.category import CategoryIter
+from src.spilling_catalog import SpillingCatalog
+import src.utils as utils
+
+
+def make_feed(path: str, categories: int, products: int) -> None:
+    template = make_catalog_data(products, duplicate_ratio=0)[-1]["products"]
+    importers.write_binary(({"name": f"Категория {index}", "description": "", "products": template}
+                            for index in range(categories)), path)
+
+
+def run(path: str, budget: int, passes: int) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    if budget:
+        catalog = SpillingCatalog(budget)
+        categories_list = catalog.load(importers.load_catalog(path))
+    else:
+        catalog = None
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            categories_list = utils.category_init(importers.load_catalog(path))
+
+    for _ in range(passes):
+        for category in categories_list:
+            for _ in CategoryIter(category):
+                pass
+
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    stats = catalog.stats() if catalog else {}
+
+    if catalog:
+        catalog.close()
+
+    return elapsed, peak, stats
+
+
+def main(categories: int, products: int, passes: int) -> None:
+    logger.set_sink(logger.LogSink(level=logger.WARNING))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "catalog.bin")
+        make_feed(path, categories, products)
+
+        for budget in (0, products * categories // 2, products * 2):
+            elapsed, peak, stats = run(path, budget, passes)
+            print(f"Бюджет {budget or 'нет':>8}: {elapsed:>6.2f} с, пик памяти {peak / 2 ** 20:>7.1f} МБ  {stats}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--products", type=int, default=10000)
+    parser.add_argument("--passes", type=int, default=2)
+    args = parser.parse_args()
+
+    main(args.categories, args.products, args.passes)
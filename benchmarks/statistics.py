@@ -0,0 +1,55 @@
+"""
+Время опроса статистики всех категорий: пересчет при каждом запросе против кэша CatalogStatistics.
+
+Запуск из корня проекта:
+    python -m benchmarks.statistics --products 50000 --polls 100
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from benchmarks.catalog import make_catalog_data
+from src import logger
+from src.stats import CatalogStatistics
+import src.utils as utils
+
+
+def main(products: int, polls: int) -> None:
+    logger.set_sink(logger.LogSink(level=logger.WARNING))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        categories_list = utils.category_init(make_catalog_data(products))
+
+    statistics = CatalogStatistics(categories_list)
+    statistics.attach()
+
+    try:
+        start = time.perf_counter()
+
+        for _ in range(polls):
+            statistics.invalidate()
+            statistics.categories()
+
+        uncached = time.perf_counter() - start
+        start = time.perf_counter()
+
+        for poll in range(polls):
+            categories_list[poll % len(categories_list)].prod[0].stock_quantity += 1
+            statistics.categories()
+
+        cached = time.perf_counter() - start
+    finally:
+        statistics.detach()
+
+    print(f"Пересчет при каждом опросе:          {uncached / polls * 1e3:>8.2f} мс/опрос")
+    print(f"Кэш, одна измененная категория:      {cached / polls * 1e3:>8.2f} мс/опрос")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=50000)
+    parser.add_argument("--polls", type=int, default=100)
+    args = parser.parse_args()
+
+    main(args.products, args.polls)
@@ -0,0 +1,65 @@
+"""
+Поиск товаров с остатком ниже порога: обход всех категорий против индекса StockAlerts, а также стоимость
+обслуживания индекса при изменении остатка.
+
+Запуск из корня проекта:
+    python -m benchmarks.stock_alerts --products 100000 --changes 100000
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from benchmarks.catalog import make_catalog_data
+from src import logger
+from src.stock_alerts import StockAlerts
+import src.utils as utils
+
+
+def main(products: int, changes: int, threshold: int) -> None:
+    logger.set_sink(logger.LogSink(level=logger.WARNING))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        categories_list = utils.category_init(make_catalog_data(products, duplicate_ratio=0))
+
+    all_products = [prod for item in categories_list for prod in item.prod]
+    rnd = random.Random(0)
+    start = time.perf_counter()
+    scanned = [prod for item in categories_list for prod in item.prod if prod.stock_quantity < threshold]
+    scan = time.perf_counter() - start
+
+    alerts = StockAlerts()
+    alerts.track(categories_list)
+    alerts.attach()
+    alerts.subscribe(threshold, lambda batch: None)
+
+    try:
+        start = time.perf_counter()
+        indexed = alerts.below(threshold)
+        query = time.perf_counter() - start
+        start = time.perf_counter()
+
+        for _ in range(changes):
+            rnd.choice(all_products).stock_quantity = rnd.randint(0, 100)
+
+        alerts.flush()
+        update = time.perf_counter() - start
+    finally:
+        alerts.detach()
+
+    assert len(scanned) == len(indexed)
+    print(f"Товаров с остатком ниже {threshold}: {len(indexed)} из {len(all_products)}")
+    print(f"Обход категорий:            {scan * 1e3:>8.2f} мс")
+    print(f"Запрос к индексу:           {query * 1e3:>8.2f} мс")
+    print(f"Изменение остатка с индексом: {update / changes * 1e6:>6.2f} мкс/изменение")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=100000)
+    parser.add_argument("--changes", type=int, default=100000)
+    parser.add_argument("--threshold", type=int, default=5)
+    args = parser.parse_args()
+
+    main(args.products, args.changes, args.threshold)
@@ -1,12 +1,96 @@
+import argparse
+import contextlib
+import os
+import sys
+
 import src.utils as utils
+from src import logger
+from src.change_tracker import ChangeTracker
+from src.exceptions import AddZeroQuantityException
+from src.versioned_catalog import VersionedCatalog
+
+
+def load_catalog(products_file: str, state_dir: str = None) -> tuple:
+    if state_dir:
+        from src.persistence import CatalogStore
+
+        store = CatalogStore(state_dir)
+        import_data = None if os.path.exists(store.snapshot_path) else utils.load_products(products_file)
+
+        try:
+            return store.open(import_data), store
+        except AddZeroQuantityException as err:
+            exit(err)
+
+    try:
+        return utils.category_init(utils.load_products(products_file)), None
+    except AddZeroQuantityException as err:
+        exit(err)
+
+
+def run_batch(script: str, products_file: str, state_dir: str = None) -> None:
+    logger.get_sink().level = logger.WARNING
+
+    with contextlib.redirect_stdout(sys.stderr):
+        categories_list, store = load_catalog(products_file, state_dir)
+
+    try:
+        if script == "-":
+            utils.run_batch(categories_list, sys.stdin, sys.stdout)
+        else:
+            with open(script, encoding="utf-8") as file:
+                utils.run_batch(categories_list, file, sys.stdout)
+    finally:
+        if store:
+            store.close()
+
 
+def export(path: str, products_file: str, state_dir: str = None, category: str = None, in_stock: bool = False) -> None:
+    from src import exporters
 
-def main():
-    import_data = utils.load_products("products.json")
-    categories_list = utils.category_init(import_data)
+    logger.get_sink().level = logger.WARNING
 
+    with contextlib.redirect_stdout(sys.stderr):
+        categories_list, store = load_catalog(products_file, state_dir)
+
+    try:
+        count = exporters.export_catalog(categories_list, path, category, in_stock)
+    finally:
+        if store:
+            store.close()
+
+    print(f"Выгружено товаров: {count}")
+
+
+def main(products_file: str = "products.json", state_dir: str = None):
+    categories_list, store = load_catalog(products_file, state_dir)
+    logger.get_sink().flush()
+
+    try:
+        interactive_loop(categories_list)
+    finally:
+        if store:
+            store.close()
+
+
+def interactive_loop(categories_list: list, page_size: int = 20) -> None:
+    tracker = ChangeTracker()
+    tracker.attach()
+    versions = VersionedCatalog(categories_list)
+    versions.attach()
+    utils.print_statistics_page(versions.current.categories, 1, page_size)
+
+    try:
+        operations_loop(categories_list, tracker, page_size, versions)
+    finally:
+        versions.detach()
+        tracker.detach()
+
+
+def operations_loop(categories_list: list, tracker: ChangeTracker, page_size: int,
+                    versions: VersionedCatalog) -> None:
     while True:
-        utils.print_statistics(categories_list)
+        utils.print_changes(tracker)
 
         match utils.print_operations():
             case '1':
@@ -26,9 +110,30 @@ def main():
                     break
                 else:
                     utils.get_order(categories_list, buying_product_name)
+            case '3':
+                page = input("\033[34m{}\033[0m".format("Введите номер страницы: "))
+                utils.print_statistics_page(versions.current.categories, int(page) if page.isdigit() else 1,
+                                            page_size)
             case _:
                 break
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch", metavar="FILE",
+                        help="Выполнить операции из файла JSON Lines ('-' - стандартный ввод) без диалога")
+    parser.add_argument("--products", default="products.json",
+                        help="Файл каталога в папке src/data (.json, .csv или .bin)")
+    parser.add_argument("--state", metavar="DIR",
+                        help="Папка для сохранения изменений каталога между запусками (снимок и журнал)")
+    parser.add_argument("--export", metavar="FILE", help="Выгрузить каталог в файл .json, .jsonl или .csv")
+    parser.add_argument("--category", help="Выгрузить только указанную категорию")
+    parser.add_argument("--in-stock", action="store_true", help="Выгрузить только товары в наличии")
+    args = parser.parse_args()
+
+    if args.export:
+        export(args.export, args.products, args.state, args.category, args.in_stock)
+    elif args.batch:
+        run_batch(args.batch, args.products, args.state)
+    else:
+        main(args.products, args.state)
@@ -0,0 +1,19 @@
+# Подмодули пакета загружаются при первом обращении к ним как к атрибутам пакета (например, src.stats), поэтому
+# импорт src не тянет за собой хранилища, сервисы и форматы импорта, не нужные короткому запуску CLI. Список
+# подмодулей не ведется вручную: имя атрибута проверяется по модулям, найденным в каталоге пакета. Модули importlib
+# и pkgutil также импортируются только при обращении, чтобы не замедлять импорт src.
+
+
+def __getattr__(name: str):
+    import importlib.util
+
+    if name.startswith("_") or importlib.util.find_spec(f"{__name__}.{name}") is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return importlib.import_module(f"{__name__}.{name}")
+
+
+def __dir__() -> list:
+    import pkgutil
+
+    return sorted(set(globals()) | {module.name for module in pkgutil.iter_modules(__path__)})
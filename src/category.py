@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Callable, Union
 
 
 from src.product import Product, Smartphone, LawnGrass
@@ -15,6 +15,7 @@ class Category:
     prod: list
     total_categories: int = 0
     total_unique_products: int
+    change_listeners: list = []
 
     def __init__(self, name: str, description: str, product: dict = None) -> None:
         """
@@ -33,7 +34,9 @@ class Category:
             - __repr__(self): Возвращает строковое представление объекта категории для отладки.
             - __str__(self): Возвращает строковое представление объекта категории для пользователя.
             - __len__(self): Возвращает общее количество продуктов в категории.
-            - add_prod(self, new_product): Добавляет новый продукт в категорию.
+            - add_prod(self, new_product, allow_zero_quantity=False): Добавляет новый продукт в категорию.
+            - add_change_listener(listener): Классовый метод для подписки на добавление продуктов.
+            - remove_change_listener(listener): Классовый метод для отмены подписки.
             - product (property): Возвращает информацию о всех продуктах в категории в удобочитаемом формате.
             - prod (property): Геттер для доступа к списку продуктов в категории.
             - avg_price(self): Подсчет среднего ценника товаров в категории.
@@ -80,32 +83,53 @@ class Category:
 
         return stock_quantity_count
 
-    def add_prod(self, new_product: Union[Product, Smartphone, LawnGrass]) -> None:
+    def add_prod(self, new_product: Union[Product, Smartphone, LawnGrass], allow_zero_quantity: bool = False) -> None:
         """
         Добавляет новый продукт в категорию.
+
+        Флаг allow_zero_quantity разрешает добавление продукта с нулевым остатком и предназначен для восстановления
+        ранее сохраненного каталога, в котором товар мог быть распродан.
         """
 
         if isinstance(new_product, Product):
-            if new_product.stock_quantity == 0:
+            if new_product.stock_quantity == 0 and not allow_zero_quantity:
                 raise AddZeroQuantityException()
             else:
                 self.__prod.append(new_product)
                 self.total_unique_products += 1
+
+                for listener in Category.change_listeners:
+                    listener(self, new_product)
         else:
             raise ValueError("Тип добавляемого объекта не соответствует категории")
 
+    @classmethod
+    def add_change_listener(cls, listener: Callable[['Category', Product], None]) -> None:
+        """
+        Подписывает обработчик на добавление продуктов во все категории.
+
+        :param listener: Обработчик, вызываемый с аргументами (категория, добавленный продукт).
+        """
+
+        Category.change_listeners.append(listener)
+
+    @classmethod
+    def remove_change_listener(cls, listener: Callable[['Category', Product], None]) -> None:
+        """
+        Отменяет подписку обработчика на добавление продуктов.
+
+        :param listener: Ранее подписанный обработчик.
+        """
+
+        Category.change_listeners.remove(listener)
+
     @property
     def product(self) -> str:
         """
         Возвращает информацию о всех продуктах в категории в удобочитаемом формате.
         """
 
-        result = ""
-
-        for item in self.__prod:
-            result += str(item) + "\n"
-
-        return result.rstrip()
+        return "\n".join(str(item) for item in self.prod).rstrip()
 
     @property
     def prod(self) -> list:
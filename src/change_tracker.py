@@ -0,0 +1,60 @@
+from src.product import Product
+
+
+class ChangeTracker:
+    """
+    Набор измененных продуктов («грязный» набор), пополняемый сеттерами цены и количества.
+
+    Используется для вывода только тех продуктов, которые изменились с момента предыдущего вывода, вместо повторной
+    печати всего каталога.
+    """
+
+    def __init__(self) -> None:
+        """
+        Методы:
+            - attach(self) / detach(self): Подписывает набор на изменения продуктов и отменяет подписку.
+            - mark(self, prod): Отмечает продукт как измененный.
+            - take(self): Возвращает измененные продукты в порядке изменения и очищает набор.
+        """
+
+        self._dirty = {}
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество измененных продуктов.
+        """
+
+        return len(self._dirty)
+
+    def attach(self) -> None:
+        """
+        Подписывает набор на изменения цены и количества всех продуктов.
+        """
+
+        Product.add_change_listener(self._on_product_change)
+
+    def detach(self) -> None:
+        """
+        Отменяет подписку на изменения продуктов.
+        """
+
+        Product.remove_change_listener(self._on_product_change)
+
+    def mark(self, prod: Product) -> None:
+        """
+        Отмечает продукт как измененный.
+        """
+
+        self._dirty[prod] = None
+
+    def take(self) -> list:
+        """
+        Возвращает измененные продукты в порядке первого изменения и очищает набор.
+        """
+
+        dirty, self._dirty = self._dirty, {}
+
+        return list(dirty)
+
+    def _on_product_change(self, product: Product, field: str, old_value: float, new_value: float) -> None:
+        self.mark(product)
@@ -0,0 +1,168 @@
+import csv
+import json
+import os
+from typing import Callable, Iterator, Optional, TextIO
+
+from src.category import Category, CategoryIter
+from src.importers import CSV_COLUMNS
+
+
+BUFFER_SIZE = 1 << 16
+CHUNK_SIZE = 512
+
+exporters = {}
+
+
+def register_exporter(extension: str, exporter: Callable[..., int]) -> None:
+    """
+    Регистрирует функцию экспорта каталога для расширения файла.
+
+    :param extension: Расширение файла с точкой, например '.csv'.
+    :param exporter: Функция, принимающая список категорий, открытый текстовый поток и параметры фильтрации
+                     и возвращающая количество записанных товаров.
+    """
+
+    exporters[extension.lower()] = exporter
+
+
+def export_catalog(categories_list: list, path: str, category: Optional[str] = None, in_stock: bool = False,
+                   buffer_size: int = BUFFER_SIZE) -> int:
+    """
+    Выгружает каталог в файл в формате, выбранном по расширению: .json, .jsonl или .csv.
+
+    Товары записываются по мере обхода категорий порциями по CHUNK_SIZE записей через буферизованный поток, поэтому
+    объем используемой памяти не зависит от размера каталога. Файлы .json и .csv читаются функцией load_products.
+
+    :param categories_list: Список объектов Category.
+    :param path: Путь к файлу выгрузки.
+    :param category: Наименование категории. Если указано, выгружается только эта категория.
+    :param in_stock: Выгружать только товары с ненулевым остатком.
+    :param buffer_size: Размер буфера файла в байтах.
+    :return: Количество выгруженных товаров.
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension not in exporters:
+        raise ValueError(f"Неизвестный формат файла выгрузки: {extension}")
+
+    with open(path, "w", encoding="utf-8", newline="", buffering=buffer_size) as stream:
+        return exporters[extension](categories_list, stream, category, in_stock)
+
+
+def select(categories_list: list, category: Optional[str] = None) -> Iterator[Category]:
+    """
+    Возвращает категории, попадающие в выгрузку.
+
+    :param categories_list: Список объектов Category.
+    :param category: Наименование категории или None для всех категорий.
+    :return: Итератор категорий.
+    """
+
+    return (item for item in categories_list if category is None or item.name == category)
+
+
+def products(category: Category, in_stock: bool = False) -> Iterator[dict]:
+    """
+    Возвращает словари товаров категории в формате products.json, не копируя список товаров.
+
+    :param category: Объект Category.
+    :param in_stock: Пропускать товары с нулевым остатком.
+    :return: Итератор словарей товаров.
+    """
+
+    for prod in CategoryIter(category):
+        if not in_stock or prod.stock_quantity > 0:
+            yield prod.to_dict()
+
+
+def write_json(categories_list: list, stream: TextIO, category: Optional[str] = None, in_stock: bool = False) -> int:
+    """
+    Записывает каталог в поток в формате products.json.
+
+    :return: Количество записанных товаров.
+    """
+
+    count = 0
+    stream.write("[")
+
+    for index, item in enumerate(select(categories_list, category)):
+        header = json.dumps({"name": item.name, "description": item.description}, ensure_ascii=False)
+        stream.write(("," if index else "") + header[:-1] + ', "products": [')
+        count += _write_chunks(stream, (json.dumps(prod, ensure_ascii=False) for prod in products(item, in_stock)),
+                               ", ")
+        stream.write("]}")
+
+    stream.write("]\n")
+
+    return count
+
+
+def write_jsonl(categories_list: list, stream: TextIO, category: Optional[str] = None, in_stock: bool = False) -> int:
+    """
+    Записывает каталог в поток в формате JSON Lines: по одной строке на товар с наименованием категории в ключе
+    'category'.
+
+    :return: Количество записанных товаров.
+    """
+
+    count = 0
+
+    for item in select(categories_list, category):
+        lines = (json.dumps({"category": item.name, **prod}, ensure_ascii=False) + "\n"
+                 for prod in products(item, in_stock))
+        count += _write_chunks(stream, lines, "")
+
+    return count
+
+
+def write_csv(categories_list: list, stream: TextIO, category: Optional[str] = None, in_stock: bool = False) -> int:
+    """
+    Записывает каталог в поток в формате CSV, который читает importers.load_csv.
+
+    :return: Количество записанных товаров.
+    """
+
+    count = 0
+    writer = csv.DictWriter(stream, CSV_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+
+    for item in select(categories_list, category):
+        rows = []
+
+        for prod in products(item, in_stock):
+            rows.append({"category": item.name, "category_description": item.description, **prod})
+
+            if len(rows) >= CHUNK_SIZE:
+                writer.writerows(rows)
+                count += len(rows)
+                rows = []
+
+        writer.writerows(rows)
+        count += len(rows)
+
+    return count
+
+
+def _write_chunks(stream: TextIO, items: Iterator[str], separator: str) -> int:
+    count = 0
+    chunk = []
+
+    for text in items:
+        chunk.append(text)
+
+        if len(chunk) >= CHUNK_SIZE:
+            stream.write((separator if count else "") + separator.join(chunk))
+            count += len(chunk)
+            chunk = []
+
+    if chunk:
+        stream.write((separator if count else "") + separator.join(chunk))
+        count += len(chunk)
+
+    return count
+
+
+register_exporter(".json", write_json)
+register_exporter(".jsonl", write_jsonl)
+register_exporter(".csv", write_csv)
@@ -0,0 +1,88 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional
+
+from src import importers
+from src.product import Product
+import src.utils as utils
+
+
+def parse_feed(path: str) -> list:
+    """
+    Читает файл поставщика и объединяет повторяющиеся товары внутри каждой его категории.
+
+    Функция выполняется в процессе пула, поэтому в основной процесс передаются уже свернутые списки товаров.
+
+    :param path: Путь к файлу каталога (.json, .csv или .bin).
+    :return: Список словарей категорий в формате products.json.
+    """
+
+    return [{**item, "products": Product.check_unique_items(item["products"])}
+            for item in importers.load_catalog(path)]
+
+
+def merge_feeds(feeds: Iterable[list]) -> list:
+    """
+    Объединяет каталоги нескольких поставщиков по правилам check_unique_items.
+
+    Категории сопоставляются по наименованию, товары внутри категории - по наименованию через словарь: для
+    совпадающих товаров берется максимальная цена, а количества складываются. Порядок категорий и товаров
+    соответствует порядку их первого появления.
+
+    :param feeds: Каталоги поставщиков в формате products.json.
+    :return: Объединенный каталог в формате products.json.
+    """
+
+    categories = {}
+
+    for feed in feeds:
+        for item in feed:
+            category = categories.get(item["name"])
+
+            if category is None:
+                category = categories[item["name"]] = {"name": item["name"], "description": item["description"],
+                                                       "products": {}}
+
+            products = category["products"]
+
+            for prod in item["products"]:
+                merged = products.get(prod["name"])
+
+                if merged is None:
+                    products[prod["name"]] = dict(prod)
+                else:
+                    merged["price"] = max(merged["price"], prod["price"])
+                    merged["quantity"] += prod["quantity"]
+
+    return [{**category, "products": list(category["products"].values())} for category in categories.values()]
+
+
+def load_feeds(paths: list, workers: Optional[int] = None) -> list:
+    """
+    Разбирает файлы поставщиков параллельно в пуле процессов и объединяет их в один каталог.
+
+    :param paths: Пути к файлам поставщиков.
+    :param workers: Количество процессов. По умолчанию - количество ядер. При значении 1 файлы разбираются
+                    в текущем процессе.
+    :return: Объединенный каталог в формате products.json.
+    """
+
+    workers = min(workers or os.cpu_count() or 1, len(paths) or 1)
+
+    if workers == 1:
+        return merge_feeds(map(parse_feed, paths))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return merge_feeds(executor.map(parse_feed, paths))
+
+
+def import_feeds(paths: list, workers: Optional[int] = None) -> list:
+    """
+    Загружает каталог из файлов нескольких поставщиков и создает категории один раз по объединенным данным.
+
+    :param paths: Пути к файлам поставщиков.
+    :param workers: Количество процессов для разбора файлов.
+    :return: Список объектов Category.
+    """
+
+    return utils.category_init(load_feeds(paths, workers))
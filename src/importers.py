@@ -0,0 +1,265 @@
+import csv
+import json
+import os
+import struct
+from itertools import groupby
+from typing import Callable, Iterable, Iterator
+
+from src.product import Product, Smartphone, LawnGrass
+
+
+def _number(value: str):
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def _scalar(value: str):
+    try:
+        return _number(value)
+    except ValueError:
+        return value
+
+
+BASE_SCHEMA = {"sku": int, "name": str, "description": str, "price": _number, "quantity": int, "color": str}
+SCHEMAS = {
+    Product: BASE_SCHEMA,
+    Smartphone: {**BASE_SCHEMA, "efficiency": _scalar, "model_name": str, "internal_memory": _number},
+    LawnGrass: {**BASE_SCHEMA, "origin_country": str, "germination_period": int},
+}
+CSV_COLUMNS = ["category", "category_description"] + list(
+    dict.fromkeys(column for schema in SCHEMAS.values() for column in schema))
+
+_LENGTH = struct.Struct("<I")
+_STRING_LENGTH = struct.Struct("<I")
+_NONE = 0xFFFFFFFF
+_FLOAT = struct.Struct("<d")
+_INT = struct.Struct("<q")
+_CATEGORY = b"C"
+_PRODUCT = b"P"
+
+importers = {}
+
+
+def register_importer(extension: str, importer: Callable[[str], Iterable[dict]]) -> None:
+    """
+    Регистрирует функцию импорта каталога для расширения файла.
+
+    :param extension: Расширение файла с точкой, например '.csv'.
+    :param importer: Функция, принимающая путь к файлу и возвращающая категории в формате products.json.
+    """
+
+    importers[extension.lower()] = importer
+
+
+def load_catalog(path: str) -> Iterable[dict]:
+    """
+    Загружает каталог из файла с помощью импортера, выбранного по расширению файла.
+
+    Результат передается в utils.category_init. Импортеры CSV и двоичного формата читают файл по мере обхода
+    и возвращают категории по одной.
+
+    :param path: Путь к файлу каталога.
+    :return: Итерируемый объект словарей категорий с ключами 'name', 'description' и 'products'.
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension not in importers:
+        raise ValueError(f"Неизвестный формат файла каталога: {extension}")
+
+    return importers[extension](path)
+
+
+def schema_for(category_name: str) -> dict:
+    """
+    Возвращает схему столбцов {ключ: функция преобразования} для продуктов категории.
+    """
+
+    from src.utils import get_product_class
+
+    return SCHEMAS[get_product_class(category_name)]
+
+
+def load_json(path: str) -> list:
+    """
+    Загружает каталог из JSON-файла в формате products.json.
+    """
+
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def load_csv(path: str) -> Iterator[dict]:
+    """
+    Читает каталог из CSV-файла, в котором каждая строка - продукт.
+
+    Столбцы 'category' и 'category_description' задают категорию, остальные столбцы - характеристики продукта.
+    Значения преобразуются по схеме типа продукта категории. Пустые ячейки числовых и необязательных строковых
+    столбцов (optional_factory_keys) пропускаются, а в обязательных строковых столбцах сохраняются как пустая
+    строка. Строки одной категории должны идти подряд: категория возвращается, как только прочитаны все ее строки.
+
+    :param path: Путь к CSV-файлу.
+    :return: Итератор словарей категорий.
+    """
+
+    from src.utils import get_product_class
+
+    with open(path, encoding="utf-8", newline="") as file:
+        rows = csv.DictReader(file)
+
+        for (name, description), group in groupby(rows, key=lambda row: (row["category"],
+                                                                           row["category_description"])):
+            product_class = get_product_class(name)
+            schema = SCHEMAS[product_class]
+            keep_empty = {key for key, convert in schema.items()
+                          if convert is str and key not in product_class.optional_factory_keys}
+            products = [{key: convert(row[key]) for key, convert in schema.items()
+                         if key in row and (row[key] or key in keep_empty)}
+                        for row in group]
+
+            yield {"name": name, "description": description, "products": products}
+
+
+def write_csv(categories: Iterable[dict], path: str) -> None:
+    """
+    Записывает каталог в формате products.json в CSV-файл, читаемый load_csv.
+
+    :param categories: Итерируемый объект словарей категорий.
+    :param path: Путь к CSV-файлу.
+    """
+
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, CSV_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+
+        for item in categories:
+            writer.writerows({"category": item["name"], "category_description": item["description"], **prod}
+                             for prod in item["products"])
+
+
+def load_binary(path: str) -> Iterator[dict]:
+    """
+    Читает каталог из компактного двоичного файла с записями, предваренными длиной.
+
+    Файл состоит из записей вида <длина: uint32><тип: 1 байт><данные>. Запись категории ('C') содержит наименование,
+    описание и количество продуктов, за ней следуют записи продуктов ('P'), поля которых закодированы по схеме типа
+    продукта категории: строки - длиной uint32 и байтами UTF-8 (значение 0xFFFFFFFF обозначает отсутствие строки),
+    остальные значения - байтом типа и значением (int64, float64 или строка).
+
+    :param path: Путь к двоичному файлу.
+    :return: Итератор словарей категорий.
+    """
+
+    with open(path, "rb") as file:
+        while header := file.read(_LENGTH.size):
+            record = file.read(_LENGTH.unpack(header)[0])
+            offset = 1
+            name, offset = _read_string(record, offset)
+            description, offset = _read_string(record, offset)
+            count = _INT.unpack_from(record, offset)[0]
+            schema = schema_for(name)
+            products = []
+
+            for _ in range(count):
+                record = file.read(_LENGTH.unpack(file.read(_LENGTH.size))[0])
+                products.append(_decode_product(record, schema))
+
+            yield {"name": name, "description": description, "products": products}
+
+
+def write_binary(categories: Iterable[dict], path: str) -> None:
+    """
+    Записывает каталог в формате products.json в двоичный файл, читаемый load_binary.
+
+    :param categories: Итерируемый объект словарей категорий.
+    :param path: Путь к двоичному файлу.
+    """
+
+    with open(path, "wb") as file:
+        for item in categories:
+            schema = schema_for(item["name"])
+            chunks = [_frame(_CATEGORY + _encode_string(item["name"]) + _encode_string(item["description"]) +
+                             _INT.pack(len(item["products"])))]
+            chunks.extend(_frame(_PRODUCT + _encode_product(prod, schema)) for prod in item["products"])
+            file.write(b"".join(chunks))
+
+
+def _frame(payload: bytes) -> bytes:
+    return _LENGTH.pack(len(payload)) + payload
+
+
+def _encode_string(value) -> bytes:
+    if value is None:
+        return _STRING_LENGTH.pack(_NONE)
+
+    data = str(value).encode()
+
+    if len(data) >= _NONE:
+        raise ValueError(f"Строка длиной {len(data)} байт не помещается в двоичный формат каталога")
+
+    return _STRING_LENGTH.pack(len(data)) + data
+
+
+def _read_string(record: bytes, offset: int) -> tuple:
+    size = _STRING_LENGTH.unpack_from(record, offset)[0]
+    offset += _STRING_LENGTH.size
+
+    if size == _NONE:
+        return None, offset
+
+    return record[offset:offset + size].decode(), offset + size
+
+
+def _encode_product(prod: dict, schema: dict) -> bytes:
+    chunks = []
+
+    for key, convert in schema.items():
+        value = prod.get(key)
+
+        if convert is str:
+            chunks.append(_encode_string(value))
+        elif value is None:
+            chunks.append(b"n")
+        elif isinstance(value, str):
+            chunks.append(b"s" + _encode_string(value))
+        elif isinstance(value, int):
+            chunks.append(b"i" + _INT.pack(value))
+        else:
+            chunks.append(b"f" + _FLOAT.pack(value))
+
+    return b"".join(chunks)
+
+
+def _decode_product(record: bytes, schema: dict) -> dict:
+    prod = {}
+    offset = 1
+
+    for key, convert in schema.items():
+        if convert is str:
+            value, offset = _read_string(record, offset)
+        else:
+            kind = record[offset:offset + 1]
+            offset += 1
+
+            if kind == b"i":
+                value = _INT.unpack_from(record, offset)[0]
+                offset += _INT.size
+            elif kind == b"f":
+                value = _FLOAT.unpack_from(record, offset)[0]
+                offset += _FLOAT.size
+            elif kind == b"s":
+                value, offset = _read_string(record, offset)
+            else:
+                value = None
+
+        if value is not None:
+            prod[key] = value
+
+    return prod
+
+
+register_importer(".json", load_json)
+register_importer(".csv", load_csv)
+register_importer(".bin", load_binary)
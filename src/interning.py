@@ -0,0 +1,111 @@
+import sys
+
+
+class StringTable:
+    """
+    Таблица интернирования строк каталога.
+
+    Для каждого уникального значения хранится один экземпляр строки, который возвращается при повторных обращениях.
+    Одинаковые наименования, описания, цвета и страны происхождения у разных товаров ссылаются на один объект,
+    что уменьшает расход памяти, а сравнение интернированных строк сводится к сравнению ссылок.
+
+    Строки не поддерживают слабые ссылки, поэтому таблица сама освобождает строки, на которые больше никто
+    не ссылается: метод collect вызывается автоматически, когда количество строк удваивается с момента предыдущей
+    очистки (но не чаще, чем раз в collect_threshold новых строк), поэтому таблица не растет бесконечно при замене
+    каталога или выгрузке его частей.
+    """
+
+    collect_threshold: int
+
+    def __init__(self, collect_threshold: int = 4096) -> None:
+        """
+        Атрибуты:
+            - collect_threshold (int): Наименьшее количество строк, при котором выполняется автоматическая очистка.
+
+        Методы:
+            - intern(self, value): Возвращает канонический экземпляр строки.
+            - collect(self): Удаляет строки, на которые ссылается только таблица.
+            - release(self, values): Удаляет строки набора, на которые ссылаются только таблица и набор.
+            - clear(self): Очищает таблицу.
+        """
+
+        self.collect_threshold = max(1, collect_threshold)
+        self._strings = {}
+        self._collect_at = self.collect_threshold
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество уникальных строк в таблице.
+        """
+
+        return len(self._strings)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._strings
+
+    def intern(self, value):
+        """
+        Возвращает канонический экземпляр строки. Значения, не являющиеся строками, возвращаются без изменений.
+
+        :param value: Строка или другое значение атрибута.
+        :return: Экземпляр строки из таблицы либо исходное значение.
+        """
+
+        if not isinstance(value, str):
+            return value
+
+        result = self._strings.setdefault(value, value)
+
+        if len(self._strings) >= self._collect_at:
+            self.collect()
+
+        return result
+
+    def collect(self) -> int:
+        """
+        Удаляет из таблицы строки, на которые не ссылается ничего, кроме самой таблицы.
+
+        Для строки в таблице есть две ссылки (ключ и значение словаря), еще три добавляют копия списка ключей,
+        переменная цикла и аргумент sys.getrefcount. Строки, используемые товарами или другим кодом, остаются
+        в таблице. Ключи копируются в список, чтобы одновременный вызов intern из другого потока не нарушил обход.
+
+        :return: Количество удаленных строк.
+        """
+
+        unused = [value for value in list(self._strings) if sys.getrefcount(value) <= 5]
+
+        for value in unused:
+            self._strings.pop(value, None)
+
+        self._collect_at = max(self.collect_threshold, 2 * len(self._strings))
+
+        return len(unused)
+
+    def release(self, values: set) -> int:
+        """
+        Удаляет из таблицы строки набора values, на которые не ссылается ничего, кроме таблицы и самого набора.
+
+        В отличие от collect, проверяются только переданные строки, поэтому метод подходит для частой выгрузки
+        части каталога: вызывающий код собирает строки выгружаемых объектов, освобождает объекты и передает набор.
+
+        :param values: Множество значений. Значения, которых нет в таблице, пропускаются.
+        :return: Количество удаленных строк.
+        """
+
+        unused = [value for value in values if self._strings.get(value) is value and sys.getrefcount(value) <= 5]
+
+        for value in unused:
+            self._strings.pop(value, None)
+
+        return len(unused)
+
+    def clear(self) -> None:
+        """
+        Очищает таблицу. Уже созданные объекты сохраняют ссылки на свои строки.
+        """
+
+        self._strings.clear()
+        self._collect_at = self.collect_threshold
+
+
+strings = StringTable()
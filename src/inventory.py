@@ -0,0 +1,321 @@
+import threading
+from collections import deque
+from typing import Iterable
+
+from src.product import Product
+from src.exceptions import AddZeroQuantityException
+
+
+def is_available(buying_quantity: int, stock_quantity: int) -> bool:
+    """
+    Проверяет, достаточно ли остатка для покупки указанного количества товара.
+
+    :param buying_quantity: Закупаемое количество.
+    :param stock_quantity: Остаток товара на складе.
+    :return: True, если покупка возможна.
+    """
+
+    return buying_quantity <= stock_quantity
+
+
+class Reservation:
+    """
+    Резерв товара под заказ.
+
+    Атрибуты:
+        - prod (Product): Резервируемый товар.
+        - requested (int): Запрошенное количество.
+        - reserved (int): Количество, удерживаемое на складе под заказ.
+        - backordered (int): Количество, ожидающее поступления товара.
+        - committed (int): Количество, уже списанное со склада.
+    """
+
+    prod: Product
+    requested: int
+    reserved: int
+    backordered: int
+    committed: int
+
+    def __init__(self, prod: Product, requested: int) -> None:
+        self.prod = prod
+        self.requested = requested
+        self.reserved = 0
+        self.backordered = 0
+        self.committed = 0
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}({self.prod.name}, {self.requested}, {self.reserved}, {self.backordered}, "
+                f"{self.committed})")
+
+    @property
+    def is_fulfilled(self) -> bool:
+        """
+        Возвращает True, если все запрошенное количество зарезервировано или списано.
+        """
+
+        return self.reserved + self.committed == self.requested
+
+
+class Inventory:
+    """
+    Учет остатков с резервами под заказы.
+
+    Для каждого товара поддерживаются три величины: остаток на складе (stock_quantity товара), зарезервированное
+    количество и доступное количество (остаток минус резерв). Счетчики резервов изменяются инкрементально, поэтому
+    проверка и резервирование выполняются за O(1). Все операции выполняются под блокировкой, так что одновременные
+    заказы не могут зарезервировать один и тот же товар дважды.
+
+    Все способы оформления заказа (Order.place, OrderPipeline, пакетный режим и сервис каталога) списывают товар
+    через учет, по умолчанию - через общий учет get_inventory(), поэтому зарезервированное количество не может быть
+    продано повторно.
+
+    Заказы могут выполняться частично, а недостающее количество - ставиться в очередь ожидания (backorder), которая
+    заполняется при увеличении остатка товара после вызова attach.
+    """
+
+    def __init__(self) -> None:
+        """
+        Методы:
+            - attach(self) / detach(self): Подписывает учет на пополнение остатков и отменяет подписку.
+            - on_hand(self, prod): Остаток товара на складе.
+            - reserved(self, prod): Зарезервированное количество товара.
+            - available(self, prod): Доступное для резервирования количество товара.
+            - reserve(self, prod, quantity, allow_partial, backorder): Резервирует товар под заказ.
+            - commit(self, reservation): Списывает зарезервированное количество со склада.
+            - release(self, reservation): Снимает резерв и убирает заказ из очереди ожидания.
+            - purchase(self, prod, quantity): Списывает доступное количество товара без резерва.
+            - purchase_many(self, orders): Списывает товары по списку заказов под одной блокировкой.
+        """
+
+        self._reserved = {}
+        self._backorders = {}
+        self._lock = threading.RLock()
+
+    def attach(self) -> None:
+        """
+        Подписывает учет на изменения остатков для заполнения очереди ожидания при пополнении.
+        """
+
+        Product.add_change_listener(self._on_product_change)
+
+    def detach(self) -> None:
+        """
+        Отменяет подписку на изменения остатков.
+        """
+
+        Product.remove_change_listener(self._on_product_change)
+
+    def on_hand(self, prod: Product) -> int:
+        """
+        Возвращает остаток товара на складе.
+        """
+
+        return prod.stock_quantity
+
+    def reserved(self, prod: Product) -> int:
+        """
+        Возвращает зарезервированное количество товара.
+        """
+
+        return self._reserved.get(prod, 0)
+
+    def available(self, prod: Product) -> int:
+        """
+        Возвращает количество товара, доступное для резервирования.
+        """
+
+        return prod.stock_quantity - self._reserved.get(prod, 0)
+
+    def reserve(self, prod: Product, quantity: int, allow_partial: bool = False,
+                backorder: bool = False) -> Reservation:
+        """
+        Резервирует товар под заказ.
+
+        Если доступного количества не хватает, при allow_partial резервируется все доступное количество, а при
+        backorder недостающее количество ставится в очередь ожидания. Без этих флагов резерв не создается, и у
+        возвращаемого объекта is_fulfilled равно False.
+
+        :param prod: Резервируемый товар.
+        :param quantity: Запрошенное количество.
+        :param allow_partial: Разрешает частичное резервирование.
+        :param backorder: Разрешает ожидание поступления недостающего количества.
+        :return: Объект Reservation.
+        """
+
+        if quantity == 0:
+            raise AddZeroQuantityException()
+        elif quantity < 0:
+            raise ValueError("Количество товара должно быть положительным")
+
+        reservation = Reservation(prod, quantity)
+
+        with self._lock:
+            available = max(0, self.available(prod))
+
+            if is_available(quantity, available):
+                take = quantity
+            elif allow_partial:
+                take = available
+            else:
+                take = 0
+
+            reservation.reserved = take
+            self._reserved[prod] = self._reserved.get(prod, 0) + take
+
+            if backorder and take < quantity:
+                reservation.backordered = quantity - take
+                self._backorders.setdefault(prod, deque()).append(reservation)
+
+        return reservation
+
+    def commit(self, reservation: Reservation) -> bool:
+        """
+        Списывает зарезервированное количество со склада и снимает соответствующий резерв.
+
+        Если остаток на складе был уменьшен в обход учета и его не хватает на резерв, списание не выполняется,
+        а резерв остается в силе.
+
+        :param reservation: Объект Reservation.
+        :return: True, если количество списано.
+        """
+
+        with self._lock:
+            prod = reservation.prod
+            quantity = reservation.reserved
+
+            if not is_available(quantity, prod.stock_quantity):
+                return False
+
+            reservation.reserved = 0
+            self._release(prod, quantity)
+            reservation.committed += quantity
+
+            if quantity:
+                prod.stock_quantity -= quantity
+
+            return True
+
+    def release(self, reservation: Reservation) -> None:
+        """
+        Снимает резерв и убирает заказ из очереди ожидания.
+
+        :param reservation: Объект Reservation.
+        """
+
+        with self._lock:
+            prod = reservation.prod
+            self._release(prod, reservation.reserved)
+            reservation.reserved = 0
+
+            if reservation.backordered:
+                self._backorders[prod].remove(reservation)
+                reservation.backordered = 0
+
+                if not self._backorders[prod]:
+                    del self._backorders[prod]
+
+    def purchase(self, prod: Product, quantity: int) -> bool:
+        """
+        Списывает товар со склада без резерва, если доступного количества (остаток за вычетом резервов) хватает.
+
+        :param prod: Товар.
+        :param quantity: Закупаемое количество.
+        :return: True, если количество списано.
+        """
+
+        return self.purchase_many([(prod, quantity)])[0]
+
+    def purchase_many(self, orders: Iterable[tuple]) -> list:
+        """
+        Проверяет заказы по доступному количеству в порядке поступления и списывает выполнимые.
+
+        Проверка и списание всего списка выполняются под одной блокировкой, а остаток каждого товара изменяется
+        одним присваиванием stock_quantity. Количества проверяются до списания, как в reserve: нулевое количество
+        возбуждает AddZeroQuantityException, отрицательное - ValueError, и в этом случае ни один заказ не списывается.
+
+        :param orders: Итерируемый объект пар (товар, количество).
+        :return: Список признаков выполнения заказов в том же порядке.
+        """
+
+        orders = list(orders)
+
+        for _, quantity in orders:
+            if quantity == 0:
+                raise AddZeroQuantityException()
+            elif quantity < 0:
+                raise ValueError("Количество товара должно быть положительным")
+
+        results = []
+
+        with self._lock:
+            remaining = {}
+
+            for prod, quantity in orders:
+                available = remaining[prod] if prod in remaining else self.available(prod)
+                fulfilled = is_available(quantity, available)
+                remaining[prod] = available - quantity if fulfilled else available
+                results.append(fulfilled)
+
+            for prod, available in remaining.items():
+                stock_quantity = available + self.reserved(prod)
+
+                if stock_quantity != prod.stock_quantity:
+                    prod.stock_quantity = stock_quantity
+
+        return results
+
+    def _release(self, prod: Product, quantity: int) -> None:
+        reserved = self._reserved.get(prod, 0) - quantity
+
+        if reserved:
+            self._reserved[prod] = reserved
+        else:
+            self._reserved.pop(prod, None)
+
+    def _on_product_change(self, product: Product, field: str, old_value: int, new_value: int) -> None:
+        if field != "stock_quantity" or new_value <= old_value or not self._backorders.get(product):
+            return
+
+        with self._lock:
+            queue = self._backorders[product]
+            available = self.available(product)
+
+            while queue and available > 0:
+                reservation = queue[0]
+                take = min(reservation.backordered, available)
+                reservation.backordered -= take
+                reservation.reserved += take
+                self._reserved[product] = self._reserved.get(product, 0) + take
+                available -= take
+
+                if not reservation.backordered:
+                    queue.popleft()
+
+            if not queue:
+                del self._backorders[product]
+
+
+_inventory = Inventory()
+
+
+def get_inventory() -> Inventory:
+    """
+    Возвращает общий учет остатков, через который по умолчанию оформляются заказы.
+    """
+
+    return _inventory
+
+
+def set_inventory(inventory: Inventory) -> Inventory:
+    """
+    Устанавливает новый общий учет остатков.
+
+    :param inventory: Новый учет остатков.
+    :return: Предыдущий учет остатков.
+    """
+
+    global _inventory
+
+    previous, _inventory = _inventory, inventory
+
+    return previous
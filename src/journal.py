@@ -0,0 +1,402 @@
+import os
+import struct
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Callable, Optional
+
+from src.category import Category
+from src.product import Product
+
+
+PRICE = 0
+STOCK = 1
+_DEFINE = 2
+_BASELINE = 3
+
+_EVENT = struct.Struct("<BdIdd")
+_DEFINE_HEADER = struct.Struct("<BIHH")
+_BASELINE_RECORD = struct.Struct("<BIBd")
+
+
+class Journal:
+    """
+    Журнал изменений цены и остатков товаров, доступный только для дозаписи.
+
+    События сначала накапливаются в буфере, а при сжатии (compact) переносятся в колоночные массивы array,
+    упорядоченные по времени: отдельно для истории цен и остатков каждого товара и для движений остатков каждой
+    категории. Благодаря этому запросы выполняются двоичным поиском, а каждое событие занимает несколько машинных
+    чисел вместо отдельного объекта. Событие с меткой времени меньше последней (например, после перевода системных
+    часов) вставляется на свое место, поэтому массивы всегда остаются упорядоченными. Если указан файл, при сжатии
+    события дописываются в него в компактном двоичном формате, из которого журнал восстанавливается методом load.
+    Сжатие с параметром before сворачивает историю до указанного момента и перезаписывает файл.
+
+    Товары идентифицируются парой (категория, наименование), поэтому одноименные товары разных категорий имеют
+    отдельную историю.
+    """
+
+    path: Optional[str]
+    compact_every: int
+
+    def __init__(self, path: Optional[str] = None, compact_every: int = 4096,
+                 clock: Callable[[], float] = time.time) -> None:
+        """
+        Атрибуты:
+            - path (str): Путь к двоичному файлу журнала. Если не указан, журнал хранится только в памяти.
+            - compact_every (int): Размер буфера событий, при достижении которого выполняется сжатие.
+            - clock (Callable): Источник меток времени.
+
+        Методы:
+            - track(self, categories_list): Запоминает категории товаров для запросов по категориям.
+            - attach(self) / detach(self): Подписывает журнал на изменения товаров и на добавление товаров
+                                           в категории и отменяет подписку.
+            - record(self, name, category, kind, old_value, new_value, timestamp): Добавляет событие в журнал.
+            - compact(self, before): Переносит накопленные события в колоночное хранилище и файл.
+            - price_at(self, name, timestamp, category): Цена товара на момент времени.
+            - stock_at(self, name, timestamp, category): Остаток товара на момент времени.
+            - stock_movements(self, category, start, end): Движения остатков товаров категории за период.
+            - load(cls, path): Восстанавливает журнал из файла.
+        """
+
+        self.path = path
+        self.compact_every = max(1, compact_every)
+        self.clock = clock
+        self._pending = []
+        self._pending_definitions = []
+        self._keys = {}
+        self._name_keys = {}
+        self._names = []
+        self._key_categories = []
+        self._product_categories = {}
+        self._history = ({}, {})
+        self._baseline = ({}, {})
+        self._movements = {}
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество событий в журнале.
+        """
+
+        stored = sum(len(times) for history in self._history for times, _ in history.values())
+
+        return stored + len(self._pending)
+
+    def track(self, categories_list: list) -> None:
+        """
+        Запоминает, к какой категории относится каждый товар из списка категорий.
+
+        :param categories_list: Список объектов Category.
+        """
+
+        for category in categories_list:
+            for prod in category.prod:
+                self._product_categories[prod] = category.name
+
+    def attach(self) -> None:
+        """
+        Подписывает журнал на изменения цены и остатков всех товаров, включая списание при оформлении заказов,
+        и на добавление товаров в категории, чтобы запоминать категорию новых товаров.
+        """
+
+        Product.add_change_listener(self.on_change)
+        Category.add_change_listener(self._on_product_added)
+
+    def detach(self) -> None:
+        """
+        Отменяет подписку журнала на изменения товаров и категорий.
+        """
+
+        Product.remove_change_listener(self.on_change)
+        Category.remove_change_listener(self._on_product_added)
+
+    def on_change(self, product: Product, field: str, old_value: float, new_value: float) -> None:
+        """
+        Обработчик изменений товара, регистрируемый методом attach.
+        """
+
+        kind = PRICE if field == "price" else STOCK
+        self.record(product.name, self._product_categories.get(product), kind, old_value, new_value)
+
+    def record(self, name: str, category: Optional[str], kind: int, old_value: float, new_value: float,
+               timestamp: Optional[float] = None) -> None:
+        """
+        Добавляет событие изменения в журнал.
+
+        :param name: Наименование товара.
+        :param category: Наименование категории товара или None.
+        :param kind: Вид события: PRICE или STOCK.
+        :param old_value: Значение до изменения.
+        :param new_value: Значение после изменения.
+        :param timestamp: Метка времени. По умолчанию берется из clock.
+        """
+
+        key = self._key(name, category)
+        self._pending.append((kind, self.clock() if timestamp is None else timestamp, key, old_value, new_value))
+
+        if len(self._pending) >= self.compact_every:
+            self.compact()
+
+    def compact(self, before: Optional[float] = None) -> None:
+        """
+        Переносит накопленные события в колоночное хранилище и дописывает их в файл журнала.
+
+        Если указан момент before, события ранее него сворачиваются: для каждого товара сохраняется только значение
+        на этот момент, а движения остатков ранее него удаляются. Файл журнала при этом перезаписывается целиком
+        (через временный файл), поэтому его размер перестает расти с числом старых событий. Запросы на моменты
+        не ранее before после сворачивания дают прежние результаты.
+
+        :param before: Момент времени, история до которого сворачивается.
+        """
+
+        if self._pending or self._pending_definitions:
+            pending, self._pending = self._pending, []
+            definitions, self._pending_definitions = self._pending_definitions, []
+
+            if self.path and before is None:
+                chunks = [self._pack_definition(key) for key in definitions]
+                chunks.extend(_EVENT.pack(*event) for event in pending)
+
+                with open(self.path, "ab") as file:
+                    file.write(b"".join(chunks))
+
+            for event in pending:
+                self._apply(*event)
+
+        if before is not None:
+            self._fold(before)
+
+            if self.path:
+                self._rewrite()
+
+    def price_at(self, name: str, timestamp: float, category: Optional[str] = None) -> Optional[float]:
+        """
+        Возвращает цену товара на момент времени.
+
+        :param name: Наименование товара.
+        :param timestamp: Момент времени.
+        :param category: Наименование категории. Можно не указывать, если товар с таким наименованием один.
+        :return: Цена или None, если изменения цены товара не записывались.
+        """
+
+        return self._value_at(PRICE, name, category, timestamp)
+
+    def stock_at(self, name: str, timestamp: float, category: Optional[str] = None) -> Optional[int]:
+        """
+        Возвращает остаток товара на момент времени.
+
+        :param name: Наименование товара.
+        :param timestamp: Момент времени.
+        :param category: Наименование категории. Можно не указывать, если товар с таким наименованием один.
+        :return: Остаток или None, если изменения остатка товара не записывались.
+        """
+
+        value = self._value_at(STOCK, name, category, timestamp)
+
+        return int(value) if value is not None else None
+
+    def stock_movements(self, category: str, start: float, end: float) -> list:
+        """
+        Возвращает движения остатков товаров категории за период [start, end].
+
+        :param category: Наименование категории.
+        :param start: Начало периода.
+        :param end: Конец периода.
+        :return: Список кортежей (метка времени, наименование товара, изменение остатка) в порядке времени.
+        """
+
+        self.compact()
+
+        if category not in self._movements:
+            return []
+
+        times, keys, deltas = self._movements[category]
+        left = bisect_left(times, start)
+        right = bisect_right(times, end)
+
+        return [(times[index], self._names[keys[index]], int(deltas[index])) for index in range(left, right)]
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> 'Journal':
+        """
+        Восстанавливает журнал из двоичного файла. Новые события будут дописываться в тот же файл.
+
+        Неполная последняя запись (например, после аварийного завершения во время дозаписи) отбрасывается, а файл
+        усекается до последней целой записи.
+
+        :param path: Путь к файлу журнала.
+        :return: Восстановленный журнал.
+        """
+
+        journal = cls(path, **kwargs)
+
+        with open(path, "rb") as file:
+            data = file.read()
+
+        offset = 0
+
+        while offset < len(data):
+            tag = data[offset]
+
+            if tag == _DEFINE:
+                if offset + _DEFINE_HEADER.size > len(data):
+                    break
+
+                _, key, name_size, category_size = _DEFINE_HEADER.unpack_from(data, offset)
+                end = offset + _DEFINE_HEADER.size + name_size + category_size
+
+                if end > len(data):
+                    break
+
+                name_end = offset + _DEFINE_HEADER.size + name_size
+                name = data[offset + _DEFINE_HEADER.size:name_end].decode()
+                category = data[name_end:end].decode() if category_size else None
+                journal._define(key, name, category)
+            elif tag == _BASELINE:
+                end = offset + _BASELINE_RECORD.size
+
+                if end > len(data):
+                    break
+
+                _, key, kind, value = _BASELINE_RECORD.unpack_from(data, offset)
+                journal._baseline[kind][key] = value
+                journal._history[kind].setdefault(key, (array("d"), array("d")))
+            else:
+                end = offset + _EVENT.size
+
+                if end > len(data):
+                    break
+
+                journal._apply(*_EVENT.unpack_from(data, offset))
+
+            offset = end
+
+        if offset < len(data):
+            with open(path, "r+b") as file:
+                file.truncate(offset)
+
+        return journal
+
+    def _key(self, name: str, category: Optional[str]) -> int:
+        key = self._keys.get((category, name))
+
+        if key is None:
+            key = len(self._names)
+            self._define(key, name, category)
+            self._pending_definitions.append(key)
+
+        return key
+
+    def _on_product_added(self, category: Category, product: Product) -> None:
+        self._product_categories[product] = category.name
+
+    def _define(self, key: int, name: str, category: Optional[str]) -> None:
+        self._keys[(category, name)] = key
+        self._name_keys.setdefault(name, []).append(key)
+        self._names.append(name)
+        self._key_categories.append(category)
+
+    def _lookup(self, name: str, category: Optional[str]) -> Optional[int]:
+        key = self._keys.get((category, name))
+
+        if key is None and category is None:
+            keys = self._name_keys.get(name, ())
+
+            if len(keys) > 1:
+                raise ValueError(f"Товар {name} есть в нескольких категориях, укажите категорию")
+
+            key = keys[0] if keys else None
+
+        return key
+
+    def _pack_definition(self, key: int) -> bytes:
+        name = self._names[key].encode()
+        category = (self._key_categories[key] or "").encode()
+
+        return _DEFINE_HEADER.pack(_DEFINE, key, len(name), len(category)) + name + category
+
+    def _apply(self, kind: int, timestamp: float, key: int, old_value: float, new_value: float) -> None:
+        history = self._history[kind]
+
+        if key not in history:
+            history[key] = (array("d"), array("d"))
+            self._baseline[kind][key] = old_value
+
+        times, values = history[key]
+
+        if times and timestamp < times[-1]:
+            index = bisect_right(times, timestamp)
+            times.insert(index, timestamp)
+            values.insert(index, new_value)
+        else:
+            times.append(timestamp)
+            values.append(new_value)
+
+        if kind == STOCK:
+            category = self._key_categories[key]
+
+            if category not in self._movements:
+                self._movements[category] = (array("d"), array("I"), array("d"))
+
+            category_times, category_keys, category_deltas = self._movements[category]
+
+            if category_times and timestamp < category_times[-1]:
+                index = bisect_right(category_times, timestamp)
+                category_times.insert(index, timestamp)
+                category_keys.insert(index, key)
+                category_deltas.insert(index, new_value - old_value)
+            else:
+                category_times.append(timestamp)
+                category_keys.append(key)
+                category_deltas.append(new_value - old_value)
+
+    def _fold(self, before: float) -> None:
+        for history, baseline in zip(self._history, self._baseline):
+            for key, (times, values) in history.items():
+                index = bisect_left(times, before)
+
+                if index:
+                    baseline[key] = values[index - 1]
+                    del times[:index]
+                    del values[:index]
+
+        for times, keys, deltas in self._movements.values():
+            index = bisect_left(times, before)
+            del times[:index]
+            del keys[:index]
+            del deltas[:index]
+
+    def _rewrite(self) -> None:
+        chunks = [self._pack_definition(key) for key in range(len(self._names))]
+        events = []
+
+        for kind, (history, baseline) in enumerate(zip(self._history, self._baseline)):
+            for key, (times, values) in history.items():
+                chunks.append(_BASELINE_RECORD.pack(_BASELINE, key, kind, baseline[key]))
+                previous = baseline[key]
+
+                for timestamp, value in zip(times, values):
+                    events.append((kind, timestamp, key, previous, value))
+                    previous = value
+
+        events.sort(key=lambda event: event[1])
+        chunks.extend(_EVENT.pack(*event) for event in events)
+        temporary_path = self.path + ".tmp"
+
+        with open(temporary_path, "wb") as file:
+            file.write(b"".join(chunks))
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_path, self.path)
+
+    def _value_at(self, kind: int, name: str, category: Optional[str], timestamp: float) -> Optional[float]:
+        self.compact()
+        key = self._lookup(name, category)
+
+        if key is None or key not in self._history[kind]:
+            return None
+
+        times, values = self._history[kind][key]
+        index = bisect_right(times, timestamp)
+
+        return values[index - 1] if index else self._baseline[kind][key]
@@ -0,0 +1,261 @@
+import atexit
+import queue
+import sys
+import threading
+from typing import TYPE_CHECKING, Callable, Optional, TextIO
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+
+class LogRecord:
+    """
+    Запись лога с отложенным форматированием.
+
+    Хранит строковое представление объекта, снятое в момент создания записи, и функцию форматирования. Сама запись
+    не удерживает объект, а шаблон сообщения применяется только в момент записи пакета в поток.
+    """
+
+    __slots__ = ("level", "text", "formatter")
+
+    def __init__(self, level: int, text: str, formatter: Callable[[str], str]) -> None:
+        self.level = level
+        self.text = text
+        self.formatter = formatter
+
+    def render(self) -> str:
+        """
+        Форматирует и возвращает сообщение записи.
+        """
+
+        return self.formatter(self.text)
+
+
+class LogSink:
+    """
+    Приёмник логов с фильтрацией по уровню и буферизацией записей.
+
+    Записи накапливаются в буфере и выводятся одним вызовом write() при заполнении буфера, при вызове flush()
+    или при завершении программы.
+    """
+
+    level: int
+    capacity: int
+    stream: Optional[TextIO]
+
+    def __init__(self, level: int = INFO, capacity: int = 64, stream: Optional[TextIO] = None) -> None:
+        """
+        Атрибуты:
+            - level (int): Минимальный уровень записей, попадающих в лог.
+            - capacity (int): Количество записей в буфере, при достижении которого выполняется запись пакета.
+            - stream (TextIO): Поток для вывода. Если не указан, используется текущий sys.stdout.
+
+        Методы:
+            - is_enabled(self, level): Проверяет, будут ли записаны сообщения указанного уровня.
+            - log(self, level, obj, formatter): Добавляет запись в буфер, откладывая форматирование сообщения.
+            - flush(self): Принудительно записывает накопленные записи.
+            - emit(self, batch): Форматирует и записывает пакет записей в поток одним вызовом write().
+        """
+
+        self.level = level
+        self.capacity = max(1, capacity)
+        self.stream = stream
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    def is_enabled(self, level: int) -> bool:
+        """
+        Проверяет, будут ли записаны сообщения указанного уровня.
+        """
+
+        return level >= self.level
+
+    def log(self, level: int, obj: object, formatter: Callable[[str], str] = str) -> None:
+        """
+        Добавляет запись в буфер.
+
+        Строковое представление объекта (repr() для объектов, отличных от строк) снимается сразу, чтобы сообщение
+        отражало состояние объекта на момент вызова. Применение шаблона formatter откладывается до момента записи
+        пакета. Для отфильтрованных по уровню записей repr() не вызывается.
+
+        :param level: Уровень записи.
+        :param obj: Строка или объект, по которому строится сообщение.
+        :param formatter: Функция, превращающая строковое представление объекта в строку сообщения.
+        """
+
+        if level < self.level:
+            return
+
+        record = LogRecord(level, obj if isinstance(obj, str) else repr(obj), formatter)
+        batch = None
+
+        with self._lock:
+            self._buffer.append(record)
+
+            if len(self._buffer) >= self.capacity:
+                batch, self._buffer = self._buffer, []
+
+        if batch:
+            self._dispatch(batch)
+
+    def flush(self) -> None:
+        """
+        Принудительно записывает накопленные записи.
+        """
+
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+
+        if batch:
+            self._dispatch(batch)
+
+    def emit(self, batch: list) -> None:
+        """
+        Форматирует и записывает пакет записей в поток одним вызовом write().
+
+        :param batch: Список записей LogRecord.
+        """
+
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write("".join(record.render() + "\n" for record in batch))
+        stream.flush()
+
+    def _dispatch(self, batch: list) -> None:
+        self.emit(batch)
+
+
+class ThreadedLogSink(LogSink):
+    """
+    Приёмник логов, передающий пакеты записей фоновому потоку.
+
+    Вызывающий код только кладёт пакет в очередь, форматирование и ввод-вывод выполняются в отдельном потоке.
+    """
+
+    def __init__(self, level: int = INFO, capacity: int = 64, stream: Optional[TextIO] = None) -> None:
+        super().__init__(level, capacity, stream)
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def flush(self) -> None:
+        """
+        Записывает накопленные записи и дожидается, пока фоновый поток обработает очередь.
+        """
+
+        super().flush()
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Записывает оставшиеся записи и останавливает фоновый поток.
+        """
+
+        self.flush()
+        self._queue.put(None)
+        self._worker.join()
+
+    def _dispatch(self, batch: list) -> None:
+        self._queue.put(batch)
+
+    def _run(self) -> None:
+        while True:
+            batch = self._queue.get()
+
+            try:
+                if batch is None:
+                    return
+
+                self.emit(batch)
+            finally:
+                self._queue.task_done()
+
+
+class AsyncioLogSink(LogSink):
+    """
+    Приёмник логов, передающий пакеты записей в очередь asyncio.
+
+    Пакеты обрабатываются корутиной run(), которую нужно запустить в цикле событий. Передача пакета потокобезопасна
+    и не блокирует вызывающий код.
+    """
+
+    def __init__(self, loop: 'asyncio.AbstractEventLoop', level: int = INFO, capacity: int = 64,
+                 stream: Optional[TextIO] = None) -> None:
+        import asyncio
+
+        super().__init__(level, capacity, stream)
+        self._loop = loop
+        self._queue = asyncio.Queue()
+
+    async def run(self) -> None:
+        """
+        Обрабатывает пакеты записей до получения сигнала остановки от close().
+        """
+
+        while True:
+            batch = await self._queue.get()
+
+            try:
+                if batch is None:
+                    return
+
+                self.emit(batch)
+            finally:
+                self._queue.task_done()
+
+    async def drain(self) -> None:
+        """
+        Записывает накопленные записи и дожидается обработки очереди.
+        """
+
+        import asyncio
+
+        super().flush()
+        await asyncio.sleep(0)
+        await self._queue.join()
+
+    def close(self) -> None:
+        """
+        Записывает оставшиеся записи и отправляет корутине run() сигнал остановки.
+        """
+
+        super().flush()
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
+
+    def _dispatch(self, batch: list) -> None:
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, batch)
+
+
+_sink = LogSink()
+
+
+def get_sink() -> LogSink:
+    """
+    Возвращает текущий приёмник логов.
+    """
+
+    return _sink
+
+
+def set_sink(sink: LogSink) -> LogSink:
+    """
+    Устанавливает новый приёмник логов. Записи, накопленные в предыдущем приёмнике, записываются.
+
+    :param sink: Новый приёмник логов.
+    :return: Предыдущий приёмник логов.
+    """
+
+    global _sink
+
+    previous, _sink = _sink, sink
+    previous.flush()
+
+    return previous
+
+
+atexit.register(lambda: _sink.flush())
@@ -1,3 +1,6 @@
+from typing import Optional
+
+from src.inventory import Inventory, get_inventory, is_available
 from src.product import Product
 from src.exceptions import AddZeroQuantityException
 
@@ -17,7 +20,36 @@ class Order:
         return self.buying_quantity * self.prod.price
 
     def is_can_buy(self) -> bool:
-        return self.buying_quantity < self.prod.stock_quantity
+        return self.is_available(self.buying_quantity, self.prod.stock_quantity)
+
+    @staticmethod
+    def is_available(buying_quantity: int, stock_quantity: int) -> bool:
+        """
+        Проверяет, достаточно ли остатка для покупки указанного количества товара.
+
+        :param buying_quantity: Закупаемое количество.
+        :param stock_quantity: Остаток товара на складе.
+        :return: True, если покупка возможна.
+        """
+
+        return is_available(buying_quantity, stock_quantity)
+
+    def place(self, inventory: Optional[Inventory] = None) -> bool:
+        """
+        Оформляет заказ, списывая закупаемое количество со склада.
+
+        Списание выполняется через учет резервов: проверяется доступный остаток за вычетом резервов других заказов,
+        а проверка и списание выполняются атомарно.
+
+        :param inventory: Учет резервов. По умолчанию - общий учет inventory.get_inventory().
+        :return: True, если товара достаточно и заказ оформлен. Для отрицательного количества возбуждается
+                 ValueError.
+        """
+
+        if self.buying_quantity < 0:
+            raise ValueError("Количество товара должно быть положительным")
+
+        return (inventory if inventory is not None else get_inventory()).purchase(self.prod, self.buying_quantity)
 
     def __str__(self) -> str:
         if self.is_can_buy():
@@ -0,0 +1,90 @@
+from itertools import islice
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from src.exceptions import AddZeroQuantityException
+from src.inventory import Inventory, get_inventory
+import src.utils as utils
+
+
+class OrderResult(NamedTuple):
+    """
+    Результат обработки заявки на покупку.
+    """
+
+    name: str
+    quantity: int
+    fulfilled: bool
+    total_price: float = 0
+    reason: Optional[str] = None
+
+
+class OrderPipeline:
+    """
+    Конвейер пакетной обработки заявок на покупку.
+
+    Заявки (наименование, количество) разбиваются на пакеты по batch_size. Внутри пакета товары находятся по индексу
+    наименований, заявки проверяются по доступному остатку (за вычетом резервов) учета inventory в порядке
+    поступления, а списание применяется одним присваиванием stock_quantity на товар за пакет. Проверка и списание
+    пакета выполняются под блокировкой учета, поэтому пакеты разных конвейеров и потоков не могут продать одно и то
+    же количество товара дважды.
+
+    Пакет обрабатывается в вызывающем потоке: проверка остатков - работа на чистом Python, которую пул потоков из-за
+    GIL не ускоряет, а под общей блокировкой учета потоки к тому же выполнялись бы по очереди.
+    """
+
+    batch_size: int
+
+    def __init__(self, categories_list: list, batch_size: int = 1024, inventory: Optional[Inventory] = None) -> None:
+        """
+        Атрибуты:
+            - batch_size (int): Количество заявок в пакете.
+            - inventory (Inventory): Учет резервов, через который списывается товар. По умолчанию - общий учет
+                                     inventory.get_inventory().
+
+        Методы:
+            - process(self, requests): Обрабатывает поток заявок и возвращает результаты в порядке поступления.
+        """
+
+        self.batch_size = max(1, batch_size)
+        self.inventory = inventory if inventory is not None else get_inventory()
+        self._index = utils.build_name_index(categories_list)
+
+    def process(self, requests: Iterable[tuple]) -> Iterator[OrderResult]:
+        """
+        Обрабатывает поток заявок.
+
+        :param requests: Итерируемый объект пар (наименование товара, количество).
+        :return: Итератор результатов OrderResult в порядке поступления заявок.
+        """
+
+        requests = iter(requests)
+
+        while batch := list(islice(requests, self.batch_size)):
+            yield from self._process_batch(batch)
+
+    def _process_batch(self, batch: list) -> list:
+        results = [None] * len(batch)
+        orders = []
+
+        for position, (name, quantity) in enumerate(batch):
+            prod = self._index.get(name)
+
+            if prod is None:
+                results[position] = OrderResult(name, quantity, False, reason="Указанный товар не найден")
+            elif not isinstance(quantity, int) or quantity < 0:
+                results[position] = OrderResult(name, quantity, False, reason="Некорректное количество товара")
+            elif quantity == 0:
+                results[position] = OrderResult(name, quantity, False, reason=str(AddZeroQuantityException()))
+            else:
+                orders.append((position, prod, quantity))
+
+        fulfilled = self.inventory.purchase_many((prod, quantity) for _, prod, quantity in orders)
+
+        for (position, prod, quantity), is_fulfilled in zip(orders, fulfilled):
+            if is_fulfilled:
+                results[position] = OrderResult(prod.name, quantity, True, quantity * prod.price)
+            else:
+                results[position] = OrderResult(prod.name, quantity, False,
+                                                reason="Такого количества товара нет на складе")
+
+        return results
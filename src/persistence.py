@@ -0,0 +1,229 @@
+import json
+import os
+from typing import Optional
+
+from src.category import Category
+from src.product import Product
+import src.utils as utils
+
+
+class CatalogStore:
+    """
+    Хранилище каталога с журналом упреждающей записи (WAL) и контрольными точками.
+
+    Изменения цены, остатков и добавление товаров дописываются в журнал wal.jsonl по одной строке на изменение.
+    Вызов fsync выполняется один раз на пакет из fsync_every записей, а каждые checkpoint_every записей состояние
+    каталога сохраняется в snapshot.json в формате products.json, после чего журнал очищается. При запуске
+    загружается снимок и воспроизводятся только записи журнала, сделанные после него.
+    """
+
+    directory: str
+    fsync_every: int
+    checkpoint_every: int
+    categories_list: list
+
+    def __init__(self, directory: str, fsync_every: int = 64, checkpoint_every: int = 10000) -> None:
+        """
+        Атрибуты:
+            - directory (str): Папка для файлов снимка и журнала.
+            - fsync_every (int): Количество записей журнала, после которого выполняется fsync.
+            - checkpoint_every (int): Количество записей журнала, после которого создается контрольная точка.
+            - categories_list (list): Список категорий, восстановленный методом open.
+
+        Методы:
+            - open(self, initial_data): Восстанавливает каталог и начинает запись изменений.
+            - sync(self): Сбрасывает буфер журнала на диск.
+            - checkpoint(self): Сохраняет снимок каталога и очищает журнал.
+            - close(self): Сбрасывает журнал и отменяет подписку на изменения.
+        """
+
+        self.directory = directory
+        self.fsync_every = max(1, fsync_every)
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.categories_list = []
+        self._sequence = 0
+        self._unsynced = 0
+        self._since_checkpoint = 0
+        self._categories = {}
+        self._product_categories = {}
+        self._wal = None
+
+    @property
+    def snapshot_path(self) -> str:
+        return os.path.join(self.directory, "snapshot.json")
+
+    @property
+    def wal_path(self) -> str:
+        return os.path.join(self.directory, "wal.jsonl")
+
+    def open(self, initial_data: Optional[list] = None) -> list:
+        """
+        Восстанавливает каталог из снимка и журнала и подписывается на изменения товаров и категорий.
+
+        :param initial_data: Каталог в формате products.json, используемый при отсутствии снимка. Загруженный
+                             из него каталог сразу сохраняется в первый снимок. Как и в utils.category_init, товар
+                             с нулевым количеством в нем возбуждает AddZeroQuantityException. Распроданные товары
+                             допускаются только при восстановлении из снимка и журнала.
+        :return: Список восстановленных категорий.
+        """
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, encoding="utf-8") as file:
+                snapshot = json.load(file)
+
+            self._sequence = snapshot["sequence"]
+            self._restore(snapshot["categories"], allow_zero_quantity=True)
+            has_snapshot = True
+        else:
+            self._restore([{**item, "products": Product.check_unique_items(item["products"])}
+                           for item in initial_data or []], allow_zero_quantity=False)
+            has_snapshot = False
+
+        self._replay()
+        self._wal = open(self.wal_path, "a", encoding="utf-8")
+        Product.add_change_listener(self._on_product_change)
+        Category.add_change_listener(self._on_product_added)
+
+        if not has_snapshot:
+            self.checkpoint()
+
+        return self.categories_list
+
+    def sync(self) -> None:
+        """
+        Сбрасывает буфер журнала на диск с вызовом fsync.
+        """
+
+        if self._wal is not None and self._unsynced:
+            self._wal.flush()
+            os.fsync(self._wal.fileno())
+            self._unsynced = 0
+
+    def checkpoint(self) -> None:
+        """
+        Сохраняет снимок каталога и очищает журнал.
+
+        Снимок сначала записывается во временный файл и атомарно заменяет предыдущий. Если работа прервется до
+        очистки журнала, записи, вошедшие в снимок, будут пропущены при восстановлении по номеру последовательности.
+        """
+
+        self.sync()
+        temp_path = self.snapshot_path + ".tmp"
+
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"sequence": self._sequence, "categories": self._dump_categories()}, file, ensure_ascii=False)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, self.snapshot_path)
+
+        if self._wal is not None:
+            self._wal.truncate(0)
+
+        self._since_checkpoint = 0
+
+    def close(self) -> None:
+        """
+        Сбрасывает журнал на диск и отменяет подписку на изменения.
+        """
+
+        if self._wal is None:
+            return
+
+        Product.remove_change_listener(self._on_product_change)
+        Category.remove_change_listener(self._on_product_added)
+        self.sync()
+        self._wal.close()
+        self._wal = None
+
+    def _restore(self, categories: list, allow_zero_quantity: bool) -> None:
+        for item in categories:
+            category = self._category(item["name"], item.get("description", ""))
+            product_class = utils.get_product_class(category.name)
+
+            for prod in item["products"]:
+                category.add_prod(product_class.create_product(prod), allow_zero_quantity=allow_zero_quantity)
+                self._product_categories[category.prod[-1]] = category
+
+    def _replay(self) -> None:
+        if not os.path.exists(self.wal_path):
+            return
+
+        index = {(self._product_categories[prod].name, prod.name): prod for prod in self._product_categories}
+
+        valid_size = 0
+
+        with open(self.wal_path, "rb") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.decoder.JSONDecodeError:
+                    break
+
+                if not line.endswith(b"\n"):
+                    break
+
+                valid_size += len(line)
+
+                if record["seq"] <= self._sequence:
+                    continue
+
+                self._sequence = record["seq"]
+
+                if record["op"] == "add":
+                    category = self._category(record["category"], "")
+                    prod = utils.get_product_class(category.name).create_product(record["product"])
+                    category.add_prod(prod, allow_zero_quantity=True)
+                    self._product_categories[prod] = category
+                    index[(category.name, prod.name)] = prod
+                else:
+                    prod = index.get((record["category"], record["name"]))
+
+                    if prod is None:
+                        continue
+
+                    if record["op"] == "price":
+                        prod.update_price(record["value"], confirm_decrease=True)
+                    else:
+                        prod.stock_quantity = record["value"]
+
+        if valid_size < os.path.getsize(self.wal_path):
+            os.truncate(self.wal_path, valid_size)
+
+    def _category(self, name: str, description: str) -> Category:
+        if name not in self._categories:
+            self._categories[name] = Category(name, description)
+            self.categories_list.append(self._categories[name])
+
+        return self._categories[name]
+
+    def _dump_categories(self) -> list:
+        return [{"name": item.name, "description": item.description,
+                 "products": [prod.to_dict() for prod in item.prod]} for item in self.categories_list]
+
+    def _append(self, record: dict) -> None:
+        self._sequence += 1
+        record["seq"] = self._sequence
+        self._wal.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._unsynced += 1
+        self._since_checkpoint += 1
+
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+
+        if self._since_checkpoint >= self.checkpoint_every:
+            self.checkpoint()
+
+    def _on_product_change(self, product: Product, field: str, old_value: float, new_value: float) -> None:
+        category = self._product_categories.get(product)
+
+        if category is not None:
+            self._append({"op": "price" if field == "price" else "stock", "category": category.name,
+                          "name": product.name, "value": new_value})
+
+    def _on_product_added(self, category: Category, product: Product) -> None:
+        if category.name in self._categories and self._categories[category.name] is category:
+            self._product_categories[product] = category
+            self._append({"op": "add", "category": category.name, "product": product.to_dict()})
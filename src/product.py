@@ -1,5 +1,13 @@
-from typing import Union
+import threading
+import weakref
+from typing import Callable, Optional, Union
 from abc import ABC, abstractmethod
+from itertools import repeat
+from operator import itemgetter
+
+from src import logger
+from src.exceptions import AddZeroQuantityException
+from src.interning import strings
 
 
 class AbstractProduct(ABC):
@@ -66,12 +74,20 @@ class MixinCreateLog:
     Генерируемое сообщение включает в себя представление объекта и обрамляется специальными маркерами начала
     и окончания лога. В конструкторе класса автоматически вызывается метод логгирования, что обеспечивает запись лога
     при каждом создании экземпляра класса или его наследников.
+
+    Запись передаётся текущему приёмнику из модуля logger. Представление объекта снимается при создании записи,
+    а шаблон сообщения применяется только при выводе пакета. При отключенном уровне log_level создание объекта
+    не вызывает repr().
     """
 
+    log_level: int = logger.INFO
+
     def __init__(self) -> None:
         """
         Методы:
-            - __init__(self): Инициализирует экземпляр класса, автоматически создавая и печатая лог о создании объекта.
+            - __init__(self): Инициализирует экземпляр класса, автоматически передавая лог о создании объекта
+                              в приёмник логов.
+            - format_log(object_representation): Формирует цветное сообщение лога по представлению объекта.
             - create_log_message(object_representation): Принимает строковое представление объекта и возвращает
                                                          форматированное сообщение лога.
 
@@ -84,7 +100,18 @@ class MixinCreateLog:
             obj = MyObject()
         """
 
-        print("\033[32m{}\033[0m".format(self.create_log_message(repr(self))))
+        logger.get_sink().log(self.log_level, self, self.format_log)
+
+    @classmethod
+    def format_log(cls, object_representation: str) -> str:
+        """
+        Формирует цветное сообщение лога о создании объекта.
+
+        :param object_representation: Строковое представление созданного объекта.
+        :return: Сообщение лога, выделенное цветом.
+        """
+
+        return "\033[32m{}\033[0m".format(cls.create_log_message(object_representation))
 
     @staticmethod
     def create_log_message(object_representation: str) -> str:
@@ -109,13 +136,22 @@ class Product(AbstractProduct, MixinCreateLog):
     Класс Продукт представляет сущность товара на складе или в магазине.
     """
 
+    sku: int
     name: str
     description: str
     price: float
     stock_quantity: int
     color: str
+    change_listeners: list = []
+    factory_keys: tuple = ("name", "description", "price", "quantity", "color")
+    optional_factory_keys: tuple = ("color",)
+    _last_sku: int = 0
+    _sku_lock = threading.Lock()
+    _skus: dict = {}
+    _skus_collect_at: int = 4096
 
-    def __init__(self, name: str, description: str, price: float, stock_quantity: int, color: str = None) -> None:
+    def __init__(self, name: str, description: str, price: float, stock_quantity: int, color: str = None,
+                 *fields, sku: int = None) -> None:
         """
         Атрибуты:
             - name (str): Название продукта.
@@ -123,50 +159,118 @@ class Product(AbstractProduct, MixinCreateLog):
             - price (float): Цена продукта. Доступно только для чтения через декоратор property.
             - stock_quantity (int): Количество товара на складе.
             - color (str): Цвет товара (необязательный атрибут).
+            - sku (int): Целочисленный идентификатор товара. Новому товару присваивается следующий свободный
+                         идентификатор, а товар, восстановленный из сохраненных данных, получает прежний.
+            - fields: Дополнительные характеристики дочерних классов, передаваемые в _init_fields.
 
         Методы:
             - __init__(self, name, description, price, stock_quantity): Конструктор класса. Создает экземпляр товара
                                                                         с заданными параметрами.
+            - _init_fields(self, name, description, price, stock_quantity, color): Заполняет атрибуты товара.
+                                                                                  Вызывается конструктором
+                                                                                  и create_products.
             - __repr__(self): Возвращает строковое представление продукта для отладки.
             - __str__(self): Возвращает строковое представление продукта для пользователя.
+            - invalidate_rendering(self): Сбрасывает кэшированные строковые представления продукта.
+            - __setstate__(self, state): Восстанавливает продукт при распаковке pickle, интернируя его строки.
             - __add__(self, other): Возвращает результирующую сумму (с учетом количества на складе) 2-х объектов типа
                                     Product.
             - create_product(cls, prod): Классовый метод для создания и возвращения нового экземпляра продукта.
+            - create_products(cls, records): Классовый метод для создания списка экземпляров за один вызов.
+            - validate_records(cls, records): Классовый метод, разделяющий записи на корректные и отклоненные.
+            - next_sku(): Статический метод, возвращающий следующий свободный идентификатор товара.
+            - assign_sku(prod, sku): Статический метод, присваивающий товару свободный идентификатор.
+            - to_dict(self): Возвращает словарь с характеристиками товара в формате create_product.
             - check_unique_items(products): Статический метод для проверки списка продуктов на уникальность исходя
                                             из их имени и корректного подсчета общего количества и максимальной цены
                                             для одинаковых имён продуктов.
             - price: Декоратор property для получения цены продукта.
             - price(new_price): Декоратор setter для установки цены продукта. Позволяет установить новую цену с учетом
                                 условий валидации.
+            - update_price(new_price, confirm_decrease): Устанавливает цену без диалога с пользователем.
             - stock_quantity: Декоратор property для получения количествf продукта.
             - stock_quantity(new_stock_quantity): Декоратор setter для установки количества продукта.
+            - add_change_listener(listener): Классовый метод для подписки на изменения цены и количества всех
+                                             продуктов.
+            - remove_change_listener(listener): Классовый метод для отмены подписки.
 
         Примечание:
             Важно учитывать, что при изменении цены продукта через сеттер осуществляется проверка на корректность
             введенной цены и подтверждение операции в случае понижения цены.
+
+            Строковые атрибуты name, description и color интернируются в общей таблице строк каталога
+            (src.interning.strings), поэтому одинаковые значения у разных товаров хранятся в одном экземпляре.
+            Строки продукта, распакованного из pickle, интернируются повторно.
+
+            Строковые представления __str__ и __repr__ кэшируются и сбрасываются при изменении цены или количества
+            через сеттеры. После прямого изменения остальных атрибутов кэш сбрасывается методом invalidate_rendering.
+        """
+
+        self._init_fields(name, description, price, stock_quantity, color, *fields, sku=sku)
+        super().__init__()
+
+    def _init_fields(self, name: str, description: str, price: float, stock_quantity: int,
+                     color: str = None, *, sku: int = None) -> None:
+        """
+        Заполняет атрибуты товара. Дочерние классы дополняют метод своими характеристиками в порядке factory_keys.
         """
 
-        self.name = name
-        self.description = description
+        self.sku = Product.assign_sku(self, sku)
+        self.name = strings.intern(name)
+        self.description = strings.intern(description)
         self.__price = price
         self.__stock_quantity = stock_quantity
-        self.color = color
-        super().__init__()
+        self.color = strings.intern(color)
+        self._rendered_str = None
+        self._rendered_repr = None
 
     def __repr__(self) -> str:
         """
         Возвращает строковое представление продукта для отладки.
         """
 
-        return (f"{self.__class__.__name__}({self.name}, {self.description}, {self.price}, {self.stock_quantity}, "
-                f"{self.color})")
+        if self._rendered_repr is None:
+            self._rendered_repr = self._format_repr()
+
+        return self._rendered_repr
 
     def __str__(self) -> str:
         """
         Возвращает строковое представление продукта для пользователя.
         """
 
-        return f"{self.name}, {self.price} руб. Остаток: {self.stock_quantity} шт."
+        if self._rendered_str is None:
+            self._rendered_str = f"{self.name}, {self.price} руб. Остаток: {self.stock_quantity} шт."
+
+        return self._rendered_str
+
+    def invalidate_rendering(self) -> None:
+        """
+        Сбрасывает кэшированные строковые представления продукта.
+        """
+
+        self._rendered_str = None
+        self._rendered_repr = None
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Восстанавливает атрибуты продукта при распаковке pickle. Строковые значения заменяются экземплярами из таблицы
+        strings, а кэшированные строковые представления сбрасываются. Идентификатор sku регистрируется, если он
+        свободен; копия товара, идентификатор которого занят самим товаром, его не перехватывает.
+        """
+
+        self.__dict__.update((key, strings.intern(value)) for key, value in state.items())
+        self.invalidate_rendering()
+
+        with Product._sku_lock:
+            if Product._sku_owner(self.sku) is None:
+                Product._register_sku(self.sku, self)
+
+            Product._last_sku = max(Product._last_sku, self.sku)
+
+    def _format_repr(self) -> str:
+        return (f"{self.__class__.__name__}({self.name}, {self.description}, {self.price}, {self.stock_quantity}, "
+                f"{self.color})")
 
     def __add__(self, other: Union['Product', 'Smartphone', 'LawnGrass']) -> float:
         """
@@ -178,16 +282,206 @@ class Product(AbstractProduct, MixinCreateLog):
         else:
             raise ValueError("Типы складываемых объектов не совпадают")
 
+    @staticmethod
+    def next_sku() -> int:
+        """
+        Возвращает следующий свободный целочисленный идентификатор товара (SKU).
+
+        Идентификатор присваивается товару при создании, сохраняется в to_dict и восстанавливается при загрузке.
+        """
+
+        with Product._sku_lock:
+            Product._last_sku += 1
+
+            return Product._last_sku
+
+    @staticmethod
+    def assign_sku(prod: 'Product', sku: int = None) -> int:
+        """
+        Возвращает идентификатор для товара и регистрирует товар под ним.
+
+        Сохраненный идентификатор sku используется, если он не занят другим существующим товаром, и резервируется,
+        чтобы next_sku не выдал его новому товару. Если идентификатор занят (например, при объединении выгрузок
+        или загрузке выгрузки рядом с уже созданными товарами) или не указан, выдается следующий свободный. Реестр
+        хранит слабые ссылки, поэтому идентификатор освобождается вместе с товаром; записи освобожденных товаров
+        удаляются, когда размер реестра удваивается.
+
+        :param prod: Товар, которому присваивается идентификатор.
+        :param sku: Ранее выданный идентификатор или None.
+        :return: Идентификатор товара.
+        """
+
+        with Product._sku_lock:
+            if sku is not None:
+                owner = Product._sku_owner(sku)
+
+                if owner is not None and owner is not prod:
+                    sku = None
+                elif sku > Product._last_sku:
+                    Product._last_sku = sku
+
+            if sku is None:
+                Product._last_sku += 1
+                sku = Product._last_sku
+
+            Product._register_sku(sku, prod)
+
+        return sku
+
+    @staticmethod
+    def _sku_owner(sku: int) -> Optional['Product']:
+        ref = Product._skus.get(sku)
+
+        return ref() if ref is not None else None
+
+    @staticmethod
+    def _register_sku(sku: int, prod: 'Product') -> None:
+        skus = Product._skus
+        skus[sku] = weakref.ref(prod)
+
+        if len(skus) >= Product._skus_collect_at:
+            for key in [key for key, ref in skus.items() if ref() is None]:
+                del skus[key]
+
+            Product._skus_collect_at = max(4096, 2 * len(skus))
+
     @classmethod
     def create_product(cls, prod: dict) -> 'Product':
         """
         Создает и возвращает новый экземпляр класса Product.
 
-        :param prod: словарь с характеристиками товара.
+        :param prod: словарь с характеристиками товара. Необязательный ключ 'sku' восстанавливает идентификатор.
         :return: Экземпляр класса Product.
         """
 
-        return cls(prod["name"], prod["description"], prod["price"], prod["quantity"])
+        return cls(prod["name"], prod["description"], prod["price"], prod["quantity"], prod.get("color"),
+                   sku=prod.get("sku"))
+
+    @classmethod
+    def create_products(cls, records: Union[list, dict]) -> list:
+        """
+        Создает список экземпляров класса за один вызов.
+
+        Объекты создаются через cls.__new__, а атрибуты заполняются тем же методом _init_fields, что вызывает
+        конструктор, со значениями ключей factory_keys. Так пропускается только цепочка вызовов __init__ и
+        отдельная запись лога на каждый объект. Наличие обязательных ключей проверяется для всего пакета до создания
+        объектов: для словаря столбцов - один раз, для списка словарей - сравнением множеств ключей записей.
+        При отсутствии ключа возбуждается KeyError, и ни один объект не создается. Если в данных есть ключ 'sku',
+        идентификаторы восстанавливаются. Лог о создании объектов передается в приёмник логов так же, как при вызове
+        конструктора.
+
+        :param records: Список словарей в формате create_product либо словарь столбцов {ключ: список значений}
+                        одинаковой длины.
+        :return: Список созданных объектов.
+        """
+
+        keys = cls.factory_keys
+        required = [key for key in keys if key not in cls.optional_factory_keys]
+
+        if isinstance(records, dict):
+            missing = [key for key in required if key not in records]
+
+            if missing:
+                raise KeyError(f"Отсутствуют столбцы: {', '.join(missing)}")
+
+            size = len(records[required[0]])
+            has_sku = "sku" in records
+            keys = keys + ("sku",) if has_sku else keys
+
+            if any(len(records[key]) != size for key in keys if key in records):
+                raise ValueError("Столбцы имеют разную длину")
+
+            rows = zip(*(records[key] if key in records else repeat(None, size) for key in keys))
+        else:
+            records = records if isinstance(records, list) else list(records)
+            required = set(required)
+            all_keys = set(keys)
+            missing = set()
+            has_sku = False
+            is_complete = True
+
+            for record in records:
+                if not required <= record.keys():
+                    missing |= required - record.keys()
+                elif is_complete and not all_keys <= record.keys():
+                    is_complete = False
+
+                if not has_sku and "sku" in record:
+                    has_sku = True
+
+            if missing:
+                raise KeyError(f"Отсутствуют поля: {', '.join(sorted(missing))}")
+
+            if has_sku:
+                keys = keys + ("sku",)
+                is_complete = is_complete and all("sku" in record for record in records)
+
+            if is_complete and len(keys) > 1:
+                rows = map(itemgetter(*keys), records)
+            else:
+                rows = (tuple(map(record.get, keys)) for record in records)
+
+        new = cls.__new__
+        init_fields = cls._init_fields
+        result = []
+        append = result.append
+
+        if has_sku:
+            for *row, sku in rows:
+                obj = new(cls)
+                init_fields(obj, *row, sku=sku)
+                append(obj)
+        else:
+            for row in rows:
+                obj = new(cls)
+                init_fields(obj, *row)
+                append(obj)
+
+        sink = logger.get_sink()
+
+        if sink.is_enabled(cls.log_level):
+            for obj in result:
+                sink.log(cls.log_level, obj, cls.format_log)
+
+        return result
+
+    @classmethod
+    def validate_records(cls, records: list) -> tuple:
+        """
+        Разделяет записи товаров на корректные и отклоненные без возбуждения исключений.
+
+        Запись отклоняется, если в ней нет обязательного ключа factory_keys (KeyError) или количество товара равно
+        нулю (AddZeroQuantityException). Исключение создается только для отклоненной записи и возвращается вместе
+        с ней, чтобы вызывающий код мог сообщить об ошибке или возбудить его.
+
+        :param records: Список словарей в формате create_product.
+        :return: Кортеж (список корректных записей, список пар (запись, исключение)).
+        """
+
+        required = {key for key in cls.factory_keys if key not in cls.optional_factory_keys}
+        valid = []
+        rejected = []
+
+        for record in records:
+            if not required <= record.keys():
+                missing = ", ".join(sorted(required - record.keys()))
+                rejected.append((record, KeyError(f"Отсутствуют поля: {missing}")))
+            elif record["quantity"] == 0:
+                rejected.append((record, AddZeroQuantityException()))
+            else:
+                valid.append(record)
+
+        return valid, rejected
+
+    def to_dict(self) -> dict:
+        """
+        Возвращает словарь с характеристиками товара в формате, который принимает create_product.
+
+        :return: Словарь с ключами 'sku', 'name', 'description', 'price', 'quantity' и 'color'.
+        """
+
+        return {"sku": self.sku, "name": self.name, "description": self.description, "price": self.price,
+                "quantity": self.stock_quantity, "color": self.color}
 
     @staticmethod
     def check_unique_items(products: list) -> list:
@@ -198,22 +492,18 @@ class Product(AbstractProduct, MixinCreateLog):
         :return: Список словарей уникальных продуктов с обновленными значениями цены и quantity.
         """
 
-        unique_names = []
+        unique_names = {}
 
         for prod in products:
-            is_unique = True
+            item = unique_names.get(prod["name"])
 
-            for index, item in enumerate(unique_names):
-                if item["name"] == prod["name"]:
-                    is_unique = False
-                    unique_names[index]["price"] = max(item["price"], prod["price"])
-                    unique_names[index]["quantity"] += prod["quantity"]
-                    break
+            if item is None:
+                unique_names[prod["name"]] = prod
+            else:
+                item["price"] = max(item["price"], prod["price"])
+                item["quantity"] += prod["quantity"]
 
-            if is_unique:
-                unique_names.append(prod)
-
-        return unique_names
+        return list(unique_names.values())
 
     @property
     def price(self) -> float:
@@ -239,9 +529,26 @@ class Product(AbstractProduct, MixinCreateLog):
             user_answer = input("Новая цена ниже установленной. Подтвердите операцию [y/N]: ")
 
             if user_answer.lower() == "y":
-                self.__price = new_price
+                self.update_price(new_price, confirm_decrease=True)
         else:
-            self.__price = new_price
+            self.update_price(new_price)
+
+    def update_price(self, new_price: float, confirm_decrease: bool = False) -> bool:
+        """
+        Устанавливает новую цену продукта без диалога с пользователем.
+
+        :param new_price: Новая цена продукта.
+        :param confirm_decrease: Подтверждение понижения цены. Без него цена ниже текущей не устанавливается.
+        :return: True, если цена изменена.
+        """
+
+        if new_price <= 0 or (new_price < self.__price and not confirm_decrease):
+            return False
+
+        old_price, self.__price = self.__price, new_price
+        self._notify_change("price", old_price, new_price)
+
+        return True
 
     @property
     def stock_quantity(self) -> int:
@@ -259,7 +566,38 @@ class Product(AbstractProduct, MixinCreateLog):
         :param new_stock_quantity: Новое количество продукта.
         """
 
-        self.__stock_quantity = new_stock_quantity
+        old_stock_quantity, self.__stock_quantity = self.__stock_quantity, new_stock_quantity
+        self._notify_change("stock_quantity", old_stock_quantity, new_stock_quantity)
+
+    @classmethod
+    def add_change_listener(cls, listener: Callable[['Product', str, float, float], None]) -> None:
+        """
+        Подписывает обработчик на изменения цены и количества всех продуктов.
+
+        Обработчик вызывается после изменения с аргументами (продукт, имя поля, старое значение, новое значение),
+        где имя поля - "price" или "stock_quantity".
+
+        :param listener: Обработчик изменений.
+        """
+
+        Product.change_listeners.append(listener)
+
+    @classmethod
+    def remove_change_listener(cls, listener: Callable[['Product', str, float, float], None]) -> None:
+        """
+        Отменяет подписку обработчика на изменения продуктов.
+
+        :param listener: Ранее подписанный обработчик.
+        """
+
+        Product.change_listeners.remove(listener)
+
+    def _notify_change(self, field: str, old_value: float, new_value: float) -> None:
+        self._rendered_str = None
+        self._rendered_repr = None
+
+        for listener in Product.change_listeners:
+            listener(self, field, old_value, new_value)
 
 
 class Smartphone(Product):
@@ -273,9 +611,11 @@ class Smartphone(Product):
     efficiency: float
     model_name: str
     internal_memory: float
+    factory_keys: tuple = Product.factory_keys + ("efficiency", "model_name", "internal_memory")
+    optional_factory_keys: tuple = ()
 
     def __init__(self, name: str, description: str, price: float, stock_quantity: int, color: str,
-                 efficiency: float, model_name: str, internal_memory: float) -> None:
+                 efficiency: float, model_name: str, internal_memory: float, sku: int = None) -> None:
         """
         Атрибуты:
             efficiency (float): Эффективность смартфона, возможно, это может быть мера производительности
@@ -292,23 +632,34 @@ class Smartphone(Product):
             model_name (str): Название модели смартфона.
             internal_memory (float): Внутренняя память смартфона.
             color (str): Цвет смартфона.
+            sku (int): Идентификатор восстанавливаемого товара (необязательный).
 
         Методы:
-            __repr__: Возвращает строковое представление объекта класса Smartphone.
+            _format_repr: Формирует строковое представление объекта класса Smartphone для кэшируемого __repr__.
+            to_dict: Возвращает словарь характеристик в формате create_product.
 
         Классовые методы:
             create_product(cls, prod): Создает и возвращает объект класса Smartphone из полученного словаря параметров
                                        prod.
         """
 
+        super().__init__(name, description, price, stock_quantity, color, efficiency, model_name, internal_memory,
+                         sku=sku)
+
+    def _init_fields(self, name: str, description: str, price: float, stock_quantity: int, color: str,
+                     efficiency: float, model_name: str, internal_memory: float, *, sku: int = None) -> None:
+        """
+        Заполняет атрибуты смартфона.
+        """
+
         self.efficiency = efficiency
         self.model_name = model_name
         self.internal_memory = internal_memory
-        super().__init__(name, description, price, stock_quantity, color)
+        super()._init_fields(name, description, price, stock_quantity, color, sku=sku)
 
-    def __repr__(self) -> str:
+    def _format_repr(self) -> str:
         """
-        Возвращает строковое представление объекта класса Smartphone.
+        Формирует строковое представление объекта класса Smartphone.
 
         Возвращаемое значение:
             str: Строковое представление объекта.
@@ -330,7 +681,18 @@ class Smartphone(Product):
         """
 
         return cls(prod["name"], prod["description"], prod["price"], prod["quantity"], prod["color"],
-                   prod["efficiency"], prod["model_name"], prod["internal_memory"])
+                   prod["efficiency"], prod["model_name"], prod["internal_memory"], sku=prod.get("sku"))
+
+    def to_dict(self) -> dict:
+        """
+        Возвращает словарь с характеристиками смартфона в формате, который принимает create_product.
+
+        Возвращаемое значение:
+            dict: Словарь характеристик товара.
+        """
+
+        return {**super().to_dict(), "efficiency": self.efficiency, "model_name": self.model_name,
+                "internal_memory": self.internal_memory}
 
 
 class LawnGrass(Product):
@@ -343,9 +705,11 @@ class LawnGrass(Product):
 
     origin_country: str
     germination_period: int
+    factory_keys: tuple = Product.factory_keys + ("origin_country", "germination_period")
+    optional_factory_keys: tuple = ()
 
     def __init__(self, name: str, description: str, price: float, stock_quantity: int, color: str,
-                 origin_country: str, germination_period: int) -> None:
+                 origin_country: str, germination_period: int, sku: int = None) -> None:
         """
         Атрибуты:
             origin_country (str): Страна происхождения семян газонной травы.
@@ -359,22 +723,32 @@ class LawnGrass(Product):
             origin_country (str): Страна происхождения семян газонной травы.
             germination_period (int): Период прорастания семян газонной травы.
             color (str): Цвет упаковки или семян.
+            sku (int): Идентификатор восстанавливаемого товара (необязательный).
 
         Методы:
-            __repr__: Возвращает строковое представление объекта класса LawnGrass.
+            _format_repr: Формирует строковое представление объекта класса LawnGrass для кэшируемого __repr__.
+            to_dict: Возвращает словарь характеристик в формате create_product.
 
         Классовые методы:
             create_product(cls, prod): Создает и возвращает объект класса LawnGrass из полученного словаря параметров
                                        prod.
         """
 
-        self.origin_country = origin_country
+        super().__init__(name, description, price, stock_quantity, color, origin_country, germination_period, sku=sku)
+
+    def _init_fields(self, name: str, description: str, price: float, stock_quantity: int, color: str,
+                     origin_country: str, germination_period: int, *, sku: int = None) -> None:
+        """
+        Заполняет атрибуты газонной травы.
+        """
+
+        self.origin_country = strings.intern(origin_country)
         self.germination_period = germination_period
-        super().__init__(name, description, price, stock_quantity, color)
+        super()._init_fields(name, description, price, stock_quantity, color, sku=sku)
 
-    def __repr__(self) -> str:
+    def _format_repr(self) -> str:
         """
-        Возвращает строковое представление объекта класса LawnGrass.
+        Формирует строковое представление объекта класса LawnGrass.
 
         Возвращаемое значение:
             str: Строковое представление объекта.
@@ -396,4 +770,15 @@ class LawnGrass(Product):
         """
 
         return cls(prod["name"], prod["description"], prod["price"], prod["quantity"], prod["color"],
-                   prod["origin_country"], prod["germination_period"])
+                   prod["origin_country"], prod["germination_period"], sku=prod.get("sku"))
+
+    def to_dict(self) -> dict:
+        """
+        Возвращает словарь с характеристиками газонной травы в формате, который принимает create_product.
+
+        Возвращаемое значение:
+            dict: Словарь характеристик товара.
+        """
+
+        return {**super().to_dict(), "origin_country": self.origin_country,
+                "germination_period": self.germination_period}
@@ -0,0 +1,170 @@
+import threading
+import weakref
+from collections import OrderedDict
+from typing import NamedTuple
+
+from src.order import Order
+from src.product import Product
+
+
+class Quote(NamedTuple):
+    """
+    Расчет заказа: итоговая цена, достаточность остатка и текст, который выводит Order.__str__.
+    """
+
+    total_price: float
+    available: bool
+    text: str
+
+
+class QuoteCache:
+    """
+    Кэш расчетов заказов по ключу (товар, количество) с вытеснением давно не использованных записей (LRU).
+
+    Размер кэша ограничен maxsize записями. Для каждого товара хранится набор закэшированных количеств, поэтому при
+    изменении цены или остатка товара через сеттеры удаляются только расчеты этого товара. Изменения отслеживаются
+    обработчиком, подписанным методом attach.
+
+    Для каждого измененного товара хранится номер поколения, который обработчик увеличивает под блокировкой кэша.
+    Расчет выполняется вне блокировки и сохраняется, только если поколение товара не изменилось с начала расчета,
+    поэтому расчет по устаревшим цене или остатку не попадает в кэш.
+    """
+
+    maxsize: int
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """
+        Атрибуты:
+            - maxsize (int): Наибольшее количество хранимых расчетов.
+
+        Методы:
+            - attach(self) / detach(self): Подписывает кэш на изменения товаров и отменяет подписку.
+            - quote(self, prod, quantity): Расчет заказа товара в указанном количестве.
+            - invalidate(self, prod): Удаляет расчеты товара.
+            - clear(self): Очищает кэш.
+            - stats(self): Статистика попаданий и промахов.
+        """
+
+        self.maxsize = max(1, maxsize)
+        self._lock = threading.Lock()
+        self._quotes = OrderedDict()
+        self._quantities = {}
+        self._generations = weakref.WeakKeyDictionary()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество хранимых расчетов.
+        """
+
+        return len(self._quotes)
+
+    def attach(self) -> None:
+        """
+        Подписывает кэш на изменения цены и остатков всех товаров.
+        """
+
+        Product.add_change_listener(self._on_product_change)
+
+    def detach(self) -> None:
+        """
+        Отменяет подписку кэша на изменения товаров.
+        """
+
+        Product.remove_change_listener(self._on_product_change)
+
+    def quote(self, prod: Product, quantity: int) -> Quote:
+        """
+        Возвращает расчет заказа товара в указанном количестве, вычисляя его только при отсутствии в кэше.
+
+        Если во время расчета товар изменился, расчет возвращается, но не сохраняется в кэше.
+
+        :param prod: Товар.
+        :param quantity: Закупаемое количество. При нулевом количестве возбуждается AddZeroQuantityException.
+        :return: Расчет заказа.
+        """
+
+        key = (prod, quantity)
+
+        with self._lock:
+            quote = self._quotes.get(key)
+
+            if quote is not None:
+                self._quotes.move_to_end(key)
+                self._hits += 1
+
+                return quote
+
+            self._misses += 1
+            generation = self._generations.get(prod, 0)
+
+        order = Order(prod, quantity)
+        quote = Quote(order.get_total_price(), order.is_can_buy(), str(order))
+
+        with self._lock:
+            if self._generations.get(prod, 0) != generation or key in self._quotes:
+                return quote
+
+            self._quotes[key] = quote
+            self._quantities.setdefault(prod, set()).add(quantity)
+
+            if len(self._quotes) > self.maxsize:
+                (evicted, evicted_quantity), _ = self._quotes.popitem(last=False)
+                self._discard(evicted, evicted_quantity)
+                self._evictions += 1
+
+        return quote
+
+    def invalidate(self, prod: Product) -> None:
+        """
+        Удаляет все расчеты товара.
+        """
+
+        with self._lock:
+            self._invalidate(prod)
+
+    def clear(self) -> None:
+        """
+        Очищает кэш и счетчики статистики.
+        """
+
+        with self._lock:
+            self._quotes.clear()
+            self._quantities.clear()
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def stats(self) -> dict:
+        """
+        Возвращает статистику кэша.
+
+        :return: Словарь с количеством попаданий ('hits'), промахов ('misses'), долей попаданий ('hit_rate'),
+                 вытесненных ('evictions') и сброшенных при изменении товаров ('invalidations') расчетов, а также
+                 текущим размером кэша ('size').
+        """
+
+        with self._lock:
+            requests = self._hits + self._misses
+
+            return {"hits": self._hits, "misses": self._misses,
+                    "hit_rate": round(self._hits / requests, 4) if requests else 0,
+                    "evictions": self._evictions, "invalidations": self._invalidations, "size": len(self._quotes)}
+
+    def _invalidate(self, prod: Product) -> None:
+        for quantity in self._quantities.pop(prod, ()):
+            del self._quotes[(prod, quantity)]
+            self._invalidations += 1
+
+    def _discard(self, prod: Product, quantity: int) -> None:
+        quantities = self._quantities[prod]
+        quantities.discard(quantity)
+
+        if not quantities:
+            del self._quantities[prod]
+
+    def _on_product_change(self, product: Product, field: str, old_value: float, new_value: float) -> None:
+        with self._lock:
+            self._generations[product] = self._generations.get(product, 0) + 1
+            self._invalidate(product)
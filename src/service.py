@@ -0,0 +1,160 @@
+import asyncio
+import json
+from typing import Optional
+
+import src.utils as utils
+from src.versioned_catalog import VersionedCatalog
+
+
+class CatalogService:
+    """
+    Асинхронный сервис каталога, обслуживающий запросы по протоколу JSON Lines поверх TCP.
+
+    Каждая строка запроса - JSON-объект с полем "op" и параметрами операции, на каждую строку сервер отвечает одной
+    строкой JSON. Поддерживаемые операции:
+        - {"op": "lookup", "name": ...}: Информация о товаре. Вместо "name" можно указать идентификатор "sku".
+        - {"op": "price", "name": ...}: Цена товара. Запросы цены, пришедшие в течение batch_window секунд,
+                                        обрабатываются одним пакетом.
+        - {"op": "stats"}: Статистика по категориям.
+        - {"op": "order", "name": ..., "quantity": ...}: Оформление заказа со списанием товара со склада.
+
+    Все операции выполняются в одном цикле событий, поэтому изменения остатков не требуют блокировок. Если передан
+    каталог с версиями catalog, запросы lookup, price и stats читают его текущую версию и не зависят от изменений,
+    которые в это время вносят другие потоки.
+    """
+
+    categories_list: list
+    batch_window: float
+    catalog: Optional[VersionedCatalog]
+
+    def __init__(self, categories_list: list, batch_window: float = 0.001,
+                 catalog: Optional[VersionedCatalog] = None) -> None:
+        """
+        Атрибуты:
+            - categories_list (list): Список объектов Category, по которым выполняются запросы.
+            - batch_window (float): Время накопления запросов цены в пакет, в секундах.
+            - catalog (VersionedCatalog): Каталог с версиями над categories_list для запросов чтения.
+
+        Методы:
+            - handle(self, request): Выполняет один запрос и возвращает ответ.
+            - get_price(self, name): Возвращает цену товара, объединяя одновременные запросы в пакеты.
+            - serve(self, host, port): Запускает TCP-сервер.
+        """
+
+        self.categories_list = categories_list
+        self.batch_window = batch_window
+        self.catalog = catalog
+        self._index = utils.build_name_index(categories_list)
+        self._sku_index = utils.build_sku_index(categories_list)
+        self._price_waiters = []
+        self._price_flush: Optional[asyncio.TimerHandle] = None
+
+    async def handle(self, request: dict) -> dict:
+        """
+        Выполняет один запрос и возвращает ответ.
+
+        :param request: Словарь запроса с ключом "op".
+        :return: Словарь ответа с ключом "ok" и результатом операции либо описанием ошибки в ключе "error".
+        """
+
+        match request.get("op"):
+            case "lookup":
+                if self.catalog is not None:
+                    prod = self.catalog.current.find(request["sku"] if "sku" in request else request.get("name"))
+                elif "sku" in request:
+                    prod = self._sku_index.get(request["sku"])
+                else:
+                    prod = self._find(request.get("name"))
+
+                if prod is None:
+                    return self._error("Указанный товар не найден")
+
+                return {"ok": True, "sku": prod.sku, "name": prod.name, "description": prod.description,
+                        "price": prod.price, "quantity": prod.stock_quantity}
+            case "price":
+                if not isinstance(request.get("name"), str):
+                    return self._error("Некорректный запрос")
+
+                price = await self.get_price(request["name"])
+
+                if price is None:
+                    return self._error("Указанный товар не найден")
+
+                return {"ok": True, "price": price}
+            case "stats" if self.catalog is not None:
+                return {"ok": True, "categories": [utils.category_stats(item) for item in self.catalog.current]}
+            case "stats" | "order":
+                return utils.execute_operation(self.categories_list, self._index, request, self._sku_index)
+            case _:
+                return self._error("Неизвестная операция")
+
+    async def get_price(self, name: str) -> Optional[float]:
+        """
+        Возвращает цену товара. Запросы, поступившие в пределах batch_window, выполняются одним пакетом.
+        Ошибка поиска одного запроса передается только его ожидающему, остальные запросы пакета получают ответ.
+
+        :param name: Наименование товара.
+        :return: Цена товара или None, если товар не найден.
+        """
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._price_waiters.append((name, future))
+
+        if self._price_flush is None:
+            self._price_flush = loop.call_later(self.batch_window, self._flush_prices)
+
+        return await future
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        """
+        Запускает TCP-сервер, принимающий запросы в формате JSON Lines.
+
+        :param host: Адрес для прослушивания.
+        :param port: Порт для прослушивания. Значение 0 выбирает свободный порт.
+        :return: Запущенный сервер asyncio.
+        """
+
+        return await asyncio.start_server(self._client_connected, host, port)
+
+    async def _client_connected(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                try:
+                    response = await self.handle(json.loads(line))
+                except (json.decoder.JSONDecodeError, AttributeError, TypeError):
+                    response = self._error("Некорректный запрос")
+
+                writer.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def _flush_prices(self) -> None:
+        waiters, self._price_waiters = self._price_waiters, []
+        self._price_flush = None
+        find = self.catalog.current.find if self.catalog is not None else self._find
+        prices = {}
+
+        for name, future in waiters:
+            try:
+                if name not in prices:
+                    prod = find(name)
+                    prices[name] = prod.price if prod is not None else None
+            except Exception as err:
+                if not future.done():
+                    future.set_exception(err)
+
+                continue
+
+            if not future.done():
+                future.set_result(prices[name])
+
+    def _find(self, name: str):
+        return self._index.get(name)
+
+    @staticmethod
+    def _error(message: str) -> dict:
+        return {"ok": False, "error": message}
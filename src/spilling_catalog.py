@@ -0,0 +1,309 @@
+import os
+import pickle
+import shutil
+import tempfile
+import weakref
+from collections import OrderedDict
+from typing import Iterable, Optional, Union
+
+from src.category import Category
+from src.interning import strings
+from src.product import Product, Smartphone, LawnGrass
+
+
+class SpillableCategory(Category):
+    """
+    Категория, список продуктов которой может быть выгружен на диск и загружен обратно при обращении.
+
+    Любое обращение к списку продуктов (свойство prod, в том числе из CategoryIter, __len__, avg_price и поиска по
+    каталогу) и добавление продукта отмечают категорию как недавно использованную в SpillingCatalog и при
+    необходимости загружают ее продукты с диска.
+    """
+
+    catalog: 'SpillingCatalog'
+
+    def __init__(self, name: str, description: str, catalog: 'SpillingCatalog') -> None:
+        """
+        Атрибуты:
+            - catalog (SpillingCatalog): Каталог, управляющий выгрузкой категории.
+            - is_resident (bool): Находятся ли продукты категории в памяти.
+            - is_dirty (bool): Изменялась ли категория после последней записи на диск.
+        """
+
+        self.catalog = catalog
+        self.path = None
+        self.is_dirty = True
+        super().__init__(name, description)
+
+    @property
+    def is_resident(self) -> bool:
+        return self._Category__prod is not None
+
+    @property
+    def prod(self) -> list:
+        """
+        Возвращает список продуктов категории, при необходимости загружая его с диска.
+        """
+
+        self.catalog.touch(self)
+
+        return self._Category__prod
+
+    def add_prod(self, new_product: Union[Product, Smartphone, LawnGrass], allow_zero_quantity: bool = False) -> None:
+        """
+        Добавляет новый продукт в категорию, при необходимости загружая ее продукты с диска.
+        """
+
+        self.catalog.touch(self)
+        super().add_prod(new_product, allow_zero_quantity)
+        self.is_dirty = True
+        self.catalog.enforce_budget(self)
+
+
+class SpillingCatalog:
+    """
+    Каталог с ограничением количества продуктов, одновременно находящихся в памяти.
+
+    Когда общее количество продуктов загруженных категорий превышает budget, продукты давно не использованных
+    категорий (LRU) сериализуются модулем pickle в файлы в папке directory и удаляются из памяти, а при следующем
+    обращении к категории загружаются обратно. Категории остаются в categories_list, поэтому каталог целиком доступен
+    для обхода и поиска. Файл категории перезаписывается при выгрузке, только если после загрузки в нее добавлялись
+    продукты или изменялись цена либо остаток какого-либо продукта, пока категория находилась в памяти. Владелец
+    измененного продукта в памяти не отслеживается, чтобы не хранить индекс всех продуктов, поэтому такое изменение
+    отмечает все загруженные категории.
+
+    Продукты выгруженной категории, на которые остались ссылки вне каталога (например, в индексе по наименованию или
+    в заказе), запоминаются в словаре со слабыми ссылками по sku. При загрузке категории распакованные копии таких
+    продуктов заменяются прежними объектами, поэтому ссылки остаются действительными, а изменения, сделанные через
+    них, пока категория была выгружена, отмечают ее для перезаписи. Такие измененные продукты хранятся по сильной
+    ссылке до загрузки категории, поэтому изменение не теряется, даже если внешняя ссылка освобождена раньше. Строки
+    выгруженных продуктов, на которые больше никто не ссылается, удаляются из таблицы интернирования, а строки
+    загруженных продуктов интернируются заново.
+
+    После вызова close файлы категорий удалены, и обращение к каталогу или его категориям возбуждает ValueError.
+    """
+
+    budget: int
+    directory: str
+    categories_list: list
+
+    def __init__(self, budget: int, directory: Optional[str] = None) -> None:
+        """
+        Атрибуты:
+            - budget (int): Наибольшее количество продуктов в памяти. Категория, к которой выполняется обращение,
+                            загружается целиком, даже если она одна превышает бюджет.
+            - directory (str): Папка для файлов выгруженных категорий. По умолчанию создается временная папка,
+                               удаляемая методом close.
+            - categories_list (list): Список всех категорий каталога.
+
+        Методы:
+            - add_category(self, name, description): Создает категорию каталога.
+            - load(self, categories): Создает категории из данных в формате products.json.
+            - touch(self, category): Отмечает обращение к категории и загружает ее продукты.
+            - spill(self, category): Выгружает продукты категории на диск.
+            - enforce_budget(self, keep): Выгружает давно не использованные категории сверх бюджета.
+            - stats(self): Статистика загрузок и выгрузок.
+            - close(self): Отменяет подписку на изменения продуктов и удаляет файлы выгруженных категорий. После
+                           закрытия каталог использовать нельзя.
+        """
+
+        self.budget = max(1, budget)
+        self._owns_directory = directory is None
+        self.directory = tempfile.mkdtemp(prefix="catalog-") if directory is None else directory
+        os.makedirs(self.directory, exist_ok=True)
+        self.categories_list = []
+        self._resident = OrderedDict()
+        self._resident_products = 0
+        self._loads = 0
+        self._spills = 0
+        self._writes = 0
+        self._spilled = weakref.WeakValueDictionary()
+        self._spilled_owners = weakref.WeakKeyDictionary()
+        self._modified = {}
+        self._closed = False
+        Product.add_change_listener(self._on_product_change)
+
+    @property
+    def resident_products(self) -> int:
+        """
+        Возвращает количество продуктов в памяти.
+        """
+
+        return self._resident_products
+
+    def add_category(self, name: str, description: str) -> SpillableCategory:
+        """
+        Создает пустую категорию каталога.
+        """
+
+        self._check_open()
+        category = SpillableCategory(name, description, self)
+        category.path = os.path.join(self.directory, f"{len(self.categories_list)}.pickle")
+        self.categories_list.append(category)
+        self._resident[category] = 0
+
+        return category
+
+    def load(self, categories: Iterable[dict], errors: Optional[list] = None) -> list:
+        """
+        Создает категории из данных в формате products.json так же, как utils.category_init, соблюдая бюджет по мере
+        загрузки. Вместе с потоковыми импортерами (importers.load_csv, importers.load_binary) это позволяет
+        загрузить каталог, который целиком не помещается в бюджет.
+
+        :param categories: Итерируемый объект словарей категорий.
+        :param errors: Необязательный список для сбора отклоненных записей, как в utils.category_init.
+        :return: Список всех категорий каталога.
+        """
+
+        from src.utils import get_product_class
+
+        for item in categories:
+            category = self.add_category(item["name"], item["description"])
+            product_class = get_product_class(item["name"])
+            valid, rejected = product_class.validate_records(Product.check_unique_items(item["products"]))
+
+            for prod in product_class.create_products(valid):
+                category.add_prod(prod)
+
+            if rejected:
+                if errors is None:
+                    raise rejected[0][1]
+
+                errors.extend((category.name, record, error) for record, error in rejected)
+
+        return self.categories_list
+
+    def touch(self, category: SpillableCategory) -> None:
+        """
+        Отмечает категорию как недавно использованную и загружает ее продукты с диска, если они были выгружены.
+
+        Продукты, на которые остались ссылки вне каталога, заменяются в загруженном списке прежними объектами.
+        """
+
+        self._check_open()
+
+        if category.is_resident:
+            self._resident.move_to_end(category)
+            return
+
+        with open(category.path, "rb") as file:
+            products = pickle.load(file)
+
+        for position, prod in enumerate(products):
+            live = self._modified.pop(prod.sku, None) or self._spilled.pop(prod.sku, None)
+
+            if live is not None:
+                products[position] = live
+                self._spilled.pop(prod.sku, None)
+                self._spilled_owners.pop(live, None)
+
+        category._Category__prod = products
+        self._resident[category] = len(products)
+        self._resident_products += len(products)
+        self._loads += 1
+        self.enforce_budget(category)
+
+    def spill(self, category: SpillableCategory) -> None:
+        """
+        Сериализует продукты категории в файл и удаляет их из памяти. Строки продуктов, на которые больше никто
+        не ссылается, удаляются из таблицы интернирования.
+        """
+
+        self._check_open()
+        strings.release(self._spill(category))
+
+    def _spill(self, category: SpillableCategory) -> set:
+        if not category.is_resident:
+            return set()
+
+        products = category._Category__prod
+
+        if category.is_dirty:
+            with open(category.path, "wb") as file:
+                pickle.dump(products, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            category.is_dirty = False
+            self._writes += 1
+
+        values = set()
+
+        for prod in products:
+            self._spilled[prod.sku] = prod
+            self._spilled_owners[prod] = category
+            values.update(value for value in vars(prod).values() if isinstance(value, str))
+
+        category._Category__prod = None
+        self._resident_products -= self._resident.pop(category)
+        self._spills += 1
+
+        return values
+
+    def enforce_budget(self, keep: SpillableCategory) -> None:
+        """
+        Пересчитывает размер категории keep и выгружает давно не использованные категории, пока количество продуктов
+        в памяти превышает бюджет. Категория keep не выгружается.
+        """
+
+        self._check_open()
+        size = len(keep._Category__prod)
+        self._resident_products += size - self._resident[keep]
+        self._resident[keep] = size
+
+        values = set()
+
+        while self._resident_products > self.budget:
+            victim = next((category for category in self._resident if category is not keep), None)
+
+            if victim is None:
+                break
+
+            values |= self._spill(victim)
+
+        if values:
+            strings.release(values)
+
+    def stats(self) -> dict:
+        """
+        Возвращает статистику каталога: количество загрузок ('loads') и выгрузок ('spills') категорий, записей
+        файлов категорий ('writes'), количество продуктов ('resident_products') и категорий ('resident_categories')
+        в памяти.
+        """
+
+        return {"loads": self._loads, "spills": self._spills, "writes": self._writes,
+                "resident_products": self._resident_products,
+                "resident_categories": len(self._resident)}
+
+    def close(self) -> None:
+        """
+        Отменяет подписку на изменения продуктов и удаляет файлы выгруженных категорий. Временная папка, созданная
+        каталогом, удаляется целиком. Последующие обращения к каталогу и его категориям возбуждают ValueError,
+        повторный вызов close ничего не делает.
+        """
+
+        if self._closed:
+            return
+
+        self._closed = True
+        self._modified.clear()
+        Product.remove_change_listener(self._on_product_change)
+
+        if self._owns_directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+        else:
+            for category in self.categories_list:
+                if os.path.exists(category.path):
+                    os.remove(category.path)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("Каталог закрыт, файлы выгруженных категорий удалены")
+
+    def _on_product_change(self, product: Product, field: str, old_value: float, new_value: float) -> None:
+        owner = self._spilled_owners.get(product)
+
+        if owner is not None:
+            owner.is_dirty = True
+            self._modified[product.sku] = product
+
+        for category in self._resident:
+            category.is_dirty = True
@@ -0,0 +1,376 @@
+import json
+import queue
+import sqlite3
+import threading
+import uuid
+import weakref
+from contextlib import contextmanager
+from typing import Iterator, Optional, Union
+
+from src.category import Category
+from src.product import Product, Smartphone, LawnGrass
+from src.exceptions import AddZeroQuantityException
+
+
+PRODUCT_CLASSES = {cls.__name__: cls for cls in (Product, Smartphone, LawnGrass)}
+BASE_FIELDS = ("sku", "name", "description", "price", "quantity", "color")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    type TEXT NOT NULL,
+    sku INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT,
+    price REAL NOT NULL,
+    quantity INTEGER NOT NULL,
+    color TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS products_category_name ON products (category, name);
+CREATE INDEX IF NOT EXISTS products_category_price ON products (category, price);
+"""
+
+
+class ConnectionPool:
+    """
+    Пул соединений SQLite для одновременного чтения из нескольких потоков.
+
+    Для файловой базы включается режим журнала WAL, при котором читатели не блокируются записью. Если путь
+    не указан, создается именованная база в памяти с общим кэшем, доступная всем соединениям пула.
+    """
+
+    path: str
+    size: int
+
+    def __init__(self, path: Optional[str] = None, size: int = 4) -> None:
+        """
+        Атрибуты:
+            - path (str): Путь к файлу базы данных. Если не указан, база создается в памяти.
+            - size (int): Количество соединений в пуле.
+            - write_lock (threading.Lock): Блокировка, упорядочивающая запись из разных потоков.
+
+        Методы:
+            - connection(self): Контекстный менеджер, выдающий соединение из пула.
+            - close(self): Закрывает все соединения пула.
+        """
+
+        self.size = max(1, size)
+        self._uri = path is None
+
+        if path is None:
+            path = f"file:catalog-{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+        self.path = path
+        self.write_lock = threading.Lock()
+        self._connections = queue.Queue()
+        self._all = []
+
+        for _ in range(self.size):
+            connection = sqlite3.connect(path, uri=self._uri, check_same_thread=False)
+            self._connections.put(connection)
+            self._all.append(connection)
+
+        with self.connection() as connection:
+            if not self._uri:
+                connection.execute("PRAGMA journal_mode=WAL")
+
+            connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Выдает соединение из пула на время блока with. Изменения фиксируются при успешном выходе из блока.
+        """
+
+        connection = self._connections.get()
+
+        try:
+            with connection:
+                yield connection
+        finally:
+            self._connections.put(connection)
+
+    def close(self) -> None:
+        """
+        Закрывает все соединения пула.
+        """
+
+        for connection in self._all:
+            connection.close()
+
+
+class SQLiteCategory(Category):
+    """
+    Категория, хранящая продукты в таблице SQLite вместо списка в памяти.
+
+    Реализует интерфейс Category: add_prod, prod, __len__, avg_price и итерацию. Агрегаты и поиск по наименованию
+    и цене выполняются индексированными SQL-запросами. Продукты создаются из строк таблицы при обращении, изменения
+    их цены и остатка через сеттеры записываются обратно в таблицу. Идентификатор sku хранится в строке таблицы, поэтому
+    продукт, повторно созданный из строки, сохраняет прежний идентификатор.
+
+    Пока на продукт, созданный из строки, есть ссылки, повторные обращения к строке возвращают тот же объект. Создание
+    продукта из строки не пишет лог о создании: продукт уже был залогирован при добавлении в категорию.
+
+    Все категории используют один обработчик изменений продуктов, который подписывается при создании первой
+    категории и находит категорию продукта по слабой ссылке, поэтому неиспользуемые категории освобождаются сборщиком
+    мусора без явного вызова close.
+    """
+
+    pool: ConnectionPool
+    _owners = weakref.WeakKeyDictionary()
+    _listener_lock = threading.Lock()
+    _listener_attached = False
+
+    def __init__(self, name: str, description: str, pool: ConnectionPool, product: dict = None) -> None:
+        """
+        Атрибуты:
+            - pool (ConnectionPool): Пул соединений с базой данных каталога.
+
+        Методы:
+            - add_prod(self, new_product, allow_zero_quantity=False): Добавляет продукт в таблицу.
+            - add_products(self, products): Добавляет список продуктов одним запросом executemany.
+            - find(self, name): Ищет продукт по наименованию.
+            - price_range(self, min_price, max_price): Возвращает продукты в диапазоне цен.
+            - close(self): Отменяет запись изменений продуктов категории в таблицу.
+        """
+
+        self.pool = pool
+        self._rows = weakref.WeakKeyDictionary()
+        self._objects = weakref.WeakValueDictionary()
+        self._prod_cache = None
+        self._attach_listener()
+        super().__init__(name, description)
+
+        if product:
+            self.add_prod(Product(product["name"], product["description"], product["price"], product["quantity"]))
+
+        with self.pool.connection() as connection:
+            self.total_unique_products = connection.execute(
+                "SELECT COUNT(*) FROM products WHERE category = ?", (self.name,)).fetchone()[0]
+
+    def __len__(self) -> int:
+        """
+        Возвращает общее количество продуктов в категории.
+        """
+
+        with self.pool.connection() as connection:
+            return connection.execute("SELECT COALESCE(SUM(quantity), 0) FROM products WHERE category = ?",
+                                      (self.name,)).fetchone()[0]
+
+    def __iter__(self) -> Iterator[Product]:
+        """
+        Возвращает продукты категории. Строки таблицы читаются целиком до начала итерации, и соединение
+        возвращается в пул, поэтому изменение продуктов во время обхода записывается в таблицу без блокировки.
+        """
+
+        if self._prod_cache is not None:
+            yield from self._prod_cache
+            return
+
+        with self.pool.connection() as connection:
+            rows = connection.execute("SELECT * FROM products WHERE category = ? ORDER BY id",
+                                      (self.name,)).fetchall()
+
+        for row in rows:
+            yield self._materialize(row)
+
+    def add_prod(self, new_product: Union[Product, Smartphone, LawnGrass], allow_zero_quantity: bool = False) -> None:
+        """
+        Добавляет новый продукт в категорию.
+        """
+
+        self.add_products([new_product], allow_zero_quantity)
+
+    def add_products(self, products: list, allow_zero_quantity: bool = False) -> None:
+        """
+        Добавляет список продуктов одним запросом executemany.
+
+        Все продукты проверяются до записи, поэтому при ошибке в таблицу не попадает ни один из них. Идентификаторы
+        строк назначает SQLite (столбец INTEGER PRIMARY KEY). Запись выполняется под pool.write_lock в одной
+        транзакции, поэтому вставленные строки получают идущие подряд идентификаторы, которые восстанавливаются по
+        last_insert_rowid().
+
+        :param products: Список объектов Product и его наследников.
+        :param allow_zero_quantity: Разрешает добавление продуктов с нулевым остатком.
+        """
+
+        for new_product in products:
+            if not isinstance(new_product, Product):
+                raise ValueError("Тип добавляемого объекта не соответствует категории")
+
+            if new_product.stock_quantity == 0 and not allow_zero_quantity:
+                raise AddZeroQuantityException()
+
+        with self.pool.write_lock, self.pool.connection() as connection:
+            connection.executemany("INSERT INTO products VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                   (self._to_row(None, new_product) for new_product in products))
+            last_id = connection.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+        for row_id, new_product in enumerate(products, last_id - len(products) + 1):
+            self._bind(new_product, row_id)
+
+        self._prod_cache = None
+        self.total_unique_products += len(products)
+
+        for new_product in products:
+            for listener in Category.change_listeners:
+                listener(self, new_product)
+
+    @property
+    def prod(self) -> list:
+        """
+        Возвращает список продуктов категории. Список кэшируется до следующего добавления продукта.
+        """
+
+        if self._prod_cache is None:
+            self._prod_cache = list(self)
+
+        return self._prod_cache
+
+    def avg_price(self):
+        """
+        Подсчет среднего ценника товаров в категории.
+        """
+
+        with self.pool.connection() as connection:
+            result = connection.execute("SELECT AVG(price) FROM products WHERE category = ?",
+                                        (self.name,)).fetchone()[0]
+
+        return round(result, 2) if result is not None else 0
+
+    def find(self, name: str) -> Optional[Product]:
+        """
+        Ищет продукт по наименованию с использованием индекса.
+
+        :param name: Наименование продукта.
+        :return: Первый найденный продукт или None.
+        """
+
+        for prod in self._query("SELECT * FROM products WHERE category = ? AND name = ? ORDER BY id LIMIT 1",
+                                (self.name, name)):
+            return prod
+
+        return None
+
+    def price_range(self, min_price: float, max_price: float) -> list:
+        """
+        Возвращает продукты с ценой в диапазоне [min_price, max_price] в порядке возрастания цены.
+
+        :param min_price: Нижняя граница цены.
+        :param max_price: Верхняя граница цены.
+        :return: Список продуктов.
+        """
+
+        return self._query("SELECT * FROM products WHERE category = ? AND price BETWEEN ? AND ? ORDER BY price",
+                           (self.name, min_price, max_price))
+
+    def close(self) -> None:
+        """
+        Отменяет запись изменений продуктов категории в таблицу. Повторный вызов ничего не делает.
+        """
+
+        for prod in list(self._rows):
+            SQLiteCategory._owners.pop(prod, None)
+
+        self._rows.clear()
+        self._objects.clear()
+        self._prod_cache = None
+
+    @classmethod
+    def _attach_listener(cls) -> None:
+        with cls._listener_lock:
+            if not cls._listener_attached:
+                Product.add_change_listener(cls._dispatch_change)
+                cls._listener_attached = True
+
+    @staticmethod
+    def _dispatch_change(product: Product, field: str, old_value: float, new_value: float) -> None:
+        owner = SQLiteCategory._owners.get(product)
+        category = owner() if owner is not None else None
+
+        if category is not None:
+            category._on_product_change(product, field, old_value, new_value)
+
+    def _bind(self, prod: Product, row_id: int) -> None:
+        self._rows[prod] = row_id
+        self._objects[row_id] = prod
+        SQLiteCategory._owners[prod] = weakref.ref(self)
+
+    def _query(self, sql: str, parameters: tuple) -> list:
+        with self.pool.connection() as connection:
+            rows = connection.execute(sql, parameters).fetchall()
+
+        return [self._materialize(row) for row in rows]
+
+    def _materialize(self, row: tuple) -> Product:
+        row_id, _, type_name, sku, name, description, price, quantity, color, extra = row
+        prod = self._objects.get(row_id)
+
+        if prod is not None:
+            return prod
+
+        data = {"name": name, "description": description, "price": price, "quantity": quantity, "color": color}
+        data.update(json.loads(extra) if extra else {})
+        product_class = PRODUCT_CLASSES[type_name]
+        prod = product_class.__new__(product_class)
+        prod._init_fields(*map(data.get, product_class.factory_keys), sku=sku)
+        self._bind(prod, row_id)
+
+        return prod
+
+    def _to_row(self, row_id: Optional[int], prod: Product) -> tuple:
+        data = prod.to_dict()
+        extra = {key: value for key, value in data.items() if key not in BASE_FIELDS}
+
+        return (row_id, self.name, type(prod).__name__, prod.sku, prod.name, prod.description, prod.price,
+                prod.stock_quantity, prod.color, json.dumps(extra, ensure_ascii=False) if extra else None)
+
+    def _on_product_change(self, product: Product, field: str, old_value: float, new_value: float) -> None:
+        row_id = self._rows.get(product)
+
+        if row_id is None:
+            return
+
+        column = "price" if field == "price" else "quantity"
+
+        with self.pool.write_lock, self.pool.connection() as connection:
+            connection.execute(f"UPDATE products SET {column} = ? WHERE id = ?", (new_value, row_id))
+
+
+def sqlite_category_init(categories: list, pool: ConnectionPool, errors: Optional[list] = None) -> list:
+    """
+    Создает категории SQLiteCategory из данных в формате products.json.
+
+    Записи продуктов обрабатываются так же, как в utils.category_init: проверяются на уникальность методом
+    check_unique_items, разделяются на корректные и отклоненные методом validate_records, а корректные создаются
+    одним вызовом create_products и записываются одним запросом executemany.
+
+    :param categories: Список словарей категорий с ключами 'name', 'description' и 'products'.
+    :param pool: Пул соединений с базой данных каталога.
+    :param errors: Необязательный список для сбора отклоненных записей (категория, запись, исключение). Если он
+                   не передан, после обработки категории возбуждается исключение первой отклоненной записи.
+    :return: Список объектов SQLiteCategory.
+    """
+
+    from src.utils import get_product_class
+
+    categories_list = []
+
+    for item in categories:
+        category = SQLiteCategory(item["name"], item["description"], pool)
+        categories_list.append(category)
+        product_class = get_product_class(item["name"])
+        valid, rejected = product_class.validate_records(Product.check_unique_items(item["products"]))
+        category.add_products(product_class.create_products(valid))
+
+        print(f"Категория {category.name}: добавлено товаров {len(valid)}")
+
+        if rejected:
+            if errors is None:
+                raise rejected[0][1]
+
+            errors.extend((category.name, record, error) for record, error in rejected)
+
+    return categories_list
@@ -0,0 +1,208 @@
+from array import array
+from typing import Iterable, Optional, Union
+
+from src.category import Category
+from src.product import Product
+
+
+PERCENTILES = (10, 25, 50, 75, 90, 99)
+
+
+def percentile(sorted_values: array, rank: float) -> float:
+    """
+    Возвращает процентиль отсортированной последовательности с линейной интерполяцией между соседними значениями.
+
+    :param sorted_values: Значения в порядке возрастания.
+    :param rank: Процентиль от 0 до 100.
+    :return: Значение процентиля или 0 для пустой последовательности.
+    """
+
+    if not sorted_values:
+        return 0
+
+    position = (len(sorted_values) - 1) * rank / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(products: Iterable[Product], percentiles: tuple = PERCENTILES, bins: int = 10,
+              low_stock: int = 5) -> dict:
+    """
+    Вычисляет статистику по набору товаров за один проход.
+
+    Цены и стоимости остатков собираются в массивы array, после чего цены сортируются один раз, а медиана
+    и процентили берутся по индексам отсортированного массива.
+
+    :param products: Товары.
+    :param percentiles: Вычисляемые процентили цены.
+    :param bins: Количество интервалов гистограммы стоимости остатков.
+    :param low_stock: Остаток, при котором и ниже которого товар считается заканчивающимся.
+    :return: Словарь статистики.
+    """
+
+    prices = array("d")
+    values = array("d")
+    quantity = 0
+    low = 0
+
+    for prod in products:
+        stock = prod.stock_quantity
+        prices.append(prod.price)
+        values.append(prod.price * stock)
+        quantity += stock
+
+        if stock <= low_stock:
+            low += 1
+
+    sorted_prices = array("d", sorted(prices))
+    count = len(prices)
+
+    return {"products": count, "quantity": quantity,
+            "min_price": sorted_prices[0] if count else 0, "max_price": sorted_prices[-1] if count else 0,
+            "avg_price": round(sum(prices) / count, 2) if count else 0,
+            "median_price": percentile(sorted_prices, 50),
+            "percentiles": {rank: percentile(sorted_prices, rank) for rank in percentiles},
+            "stock_value": sum(values), "stock_value_histogram": histogram(values, bins),
+            "low_stock": low}
+
+
+def histogram(values: array, bins: int) -> dict:
+    """
+    Распределяет значения по bins интервалам равной ширины между минимальным и максимальным значением.
+
+    :return: Словарь с границами интервалов в ключе 'edges' и количеством значений в каждом интервале в ключе 'counts'.
+    """
+
+    if not values:
+        return {"edges": [], "counts": []}
+
+    low, high = min(values), max(values)
+    width = (high - low) / bins or 1
+    counts = [0] * bins
+
+    for value in values:
+        counts[min(int((value - low) / width), bins - 1)] += 1
+
+    return {"edges": [low + width * index for index in range(bins + 1)], "counts": counts}
+
+
+class CatalogStatistics:
+    """
+    Статистика цен и остатков по категориям и по всему каталогу с кэшированием результатов.
+
+    Статистика категории вычисляется при первом запросе и хранится до изменения цены или остатка любого товара
+    категории либо добавления в нее нового товара. Об изменениях сообщают обработчики, подписанные методом attach.
+    """
+
+    categories_list: list
+    percentiles: tuple
+    bins: int
+    low_stock: int
+
+    def __init__(self, categories_list: list, percentiles: tuple = PERCENTILES, bins: int = 10,
+                 low_stock: int = 5) -> None:
+        """
+        Атрибуты:
+            - categories_list (list): Список объектов Category.
+            - percentiles (tuple): Вычисляемые процентили цены.
+            - bins (int): Количество интервалов гистограммы стоимости остатков.
+            - low_stock (int): Остаток, при котором и ниже которого товар считается заканчивающимся.
+
+        Методы:
+            - attach(self) / detach(self): Подписывает статистику на изменения товаров и категорий и отменяет подписку.
+            - category(self, category): Статистика категории.
+            - catalog(self): Статистика всего каталога.
+            - categories(self): Статистика всех категорий.
+            - invalidate(self, category=None): Сбрасывает кэш категории или всего каталога.
+        """
+
+        self.categories_list = categories_list
+        self.percentiles = percentiles
+        self.bins = bins
+        self.low_stock = low_stock
+        self._cache = {}
+        self._catalog = None
+        self._product_categories = {}
+
+    def attach(self) -> None:
+        """
+        Подписывает статистику на изменения цены и остатков товаров и на добавление товаров в категории.
+        """
+
+        for category in self.categories_list:
+            for prod in category.prod:
+                self._product_categories[prod] = category
+
+        Product.add_change_listener(self._on_product_change)
+        Category.add_change_listener(self._on_product_added)
+
+    def detach(self) -> None:
+        """
+        Отменяет подписку на изменения товаров и категорий.
+        """
+
+        Product.remove_change_listener(self._on_product_change)
+        Category.remove_change_listener(self._on_product_added)
+
+    def category(self, category: Union[Category, str]) -> Optional[dict]:
+        """
+        Возвращает статистику категории.
+
+        :param category: Объект Category или наименование категории из categories_list.
+        :return: Словарь статистики с наименованием категории в ключе 'name' или None, если категория не найдена.
+        """
+
+        if isinstance(category, str):
+            category = next((item for item in self.categories_list if item.name == category), None)
+
+            if category is None:
+                return None
+
+        if category not in self._cache:
+            self._cache[category] = {"name": category.name, **self._summarize(category.prod)}
+
+        return self._cache[category]
+
+    def categories(self) -> list:
+        """
+        Возвращает статистику всех категорий в порядке categories_list.
+        """
+
+        return [self.category(item) for item in self.categories_list]
+
+    def catalog(self) -> dict:
+        """
+        Возвращает статистику по всем товарам каталога.
+        """
+
+        if self._catalog is None:
+            self._catalog = self._summarize(prod for item in self.categories_list for prod in item.prod)
+
+        return self._catalog
+
+    def invalidate(self, category: Optional[Category] = None) -> None:
+        """
+        Сбрасывает кэшированную статистику категории и каталога. Без аргумента сбрасывается кэш всех категорий.
+        """
+
+        if category is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(category, None)
+
+        self._catalog = None
+
+    def _summarize(self, products: Iterable[Product]) -> dict:
+        return summarize(products, self.percentiles, self.bins, self.low_stock)
+
+    def _on_product_change(self, product: Product, field: str, old_value: float, new_value: float) -> None:
+        category = self._product_categories.get(product)
+
+        if category is not None:
+            self.invalidate(category)
+
+    def _on_product_added(self, category: Category, product: Product) -> None:
+        self._product_categories[product] = category
+        self.invalidate(category)
@@ -0,0 +1,189 @@
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Callable
+
+from src.category import Category
+from src.product import Product
+
+
+class StockAlerts:
+    """
+    Оповещения о снижении остатка товаров ниже порогов подписчиков.
+
+    Товары хранятся в индексе, упорядоченном по остатку: в группах товаров с одинаковым остатком и в отсортированном
+    списке значений остатка, а подписки - в списке, упорядоченном по порогу. При изменении остатка (через сеттер
+    stock_quantity, в том числе при оформлении заказа) товар переносится из группы, в которой он был записан в индекс,
+    в группу нового остатка, а значение остатка добавляется в список двоичным поиском. Поэтому изменения остатка,
+    сделанные без подписки (до attach или после detach), не нарушают индекс. Подписки, порог которых остаток пересек
+    сверху вниз, находятся так же двоичным поиском.
+    Оповещения накапливаются и доставляются подписчику пакетом: при вызове flush или когда у подписчика набралось
+    batch_size оповещений.
+    """
+
+    batch_size: int
+
+    def __init__(self, batch_size: int = 64) -> None:
+        """
+        Атрибуты:
+            - batch_size (int): Количество оповещений подписчика, при котором пакет доставляется без вызова flush.
+
+        Методы:
+            - track(self, categories_list): Добавляет товары категорий в индекс.
+            - attach(self) / detach(self): Подписывает индекс на изменения товаров и категорий и отменяет подписку.
+            - subscribe(self, threshold, callback): Подписывает обработчик на снижение остатка ниже порога.
+            - unsubscribe(self, threshold, callback): Отменяет подписку.
+            - below(self, threshold): Товары с остатком ниже порога.
+            - flush(self): Доставляет накопленные оповещения.
+        """
+
+        self.batch_size = max(1, batch_size)
+        self._lock = threading.Lock()
+        self._levels = []
+        self._groups = {}
+        self._products = {}
+        self._indexed_levels = {}
+        self._thresholds = []
+        self._subscribers = []
+        self._pending = {}
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество товаров в индексе.
+        """
+
+        return len(self._products)
+
+    def track(self, categories_list: list) -> None:
+        """
+        Добавляет в индекс все товары из списка категорий.
+
+        :param categories_list: Список объектов Category.
+        """
+
+        with self._lock:
+            for category in categories_list:
+                for prod in category.prod:
+                    self._add(prod)
+
+    def attach(self) -> None:
+        """
+        Подписывает индекс на изменения остатков товаров и на добавление товаров в категории.
+        """
+
+        Product.add_change_listener(self._on_product_change)
+        Category.add_change_listener(self._on_product_added)
+
+    def detach(self) -> None:
+        """
+        Отменяет подписку индекса на изменения товаров и категорий.
+        """
+
+        Product.remove_change_listener(self._on_product_change)
+        Category.remove_change_listener(self._on_product_added)
+
+    def subscribe(self, threshold: int, callback: Callable[[list], None]) -> None:
+        """
+        Подписывает обработчик на снижение остатка любого товара из индекса ниже порога.
+
+        :param threshold: Порог остатка. Оповещение создается, когда остаток становится меньше порога, будучи
+                          до изменения не меньше него.
+        :param callback: Обработчик, получающий список кортежей (товар, прежний остаток, новый остаток).
+        """
+
+        with self._lock:
+            position = bisect_right(self._thresholds, threshold)
+            self._thresholds.insert(position, threshold)
+            self._subscribers.insert(position, callback)
+
+    def unsubscribe(self, threshold: int, callback: Callable[[list], None]) -> None:
+        """
+        Отменяет подписку обработчика. Недоставленные оповещения обработчика отбрасываются.
+
+        :param threshold: Порог, с которым обработчик был подписан.
+        :param callback: Ранее подписанный обработчик.
+        """
+
+        with self._lock:
+            for position in range(bisect_left(self._thresholds, threshold), bisect_right(self._thresholds, threshold)):
+                if self._subscribers[position] == callback:
+                    del self._thresholds[position]
+                    del self._subscribers[position]
+                    self._pending.pop(callback, None)
+                    return
+
+        raise ValueError("Обработчик не подписан с указанным порогом")
+
+    def below(self, threshold: int) -> list:
+        """
+        Возвращает товары с остатком меньше порога в порядке возрастания остатка.
+
+        :param threshold: Порог остатка.
+        :return: Список товаров.
+        """
+
+        with self._lock:
+            end = bisect_left(self._levels, threshold)
+
+            return [prod for level in self._levels[:end] for prod in self._groups[level].values()]
+
+    def flush(self) -> None:
+        """
+        Доставляет подписчикам все накопленные оповещения.
+        """
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        for callback, alerts in pending.items():
+            callback(alerts)
+
+    def _add(self, prod: Product) -> None:
+        if prod.sku not in self._products:
+            self._products[prod.sku] = prod
+            self._place(prod, prod.stock_quantity)
+
+    def _place(self, prod: Product, level: int) -> None:
+        if level not in self._groups:
+            self._groups[level] = {}
+            insort(self._levels, level)
+
+        self._groups[level][prod.sku] = prod
+        self._indexed_levels[prod.sku] = level
+
+    def _remove(self, prod: Product) -> None:
+        level = self._indexed_levels.pop(prod.sku)
+        group = self._groups[level]
+        del group[prod.sku]
+
+        if not group:
+            del self._groups[level]
+            del self._levels[bisect_left(self._levels, level)]
+
+    def _on_product_change(self, product: Product, field: str, old_value: int, new_value: int) -> None:
+        if field != "stock_quantity" or product.sku not in self._products:
+            return
+
+        ready = []
+
+        with self._lock:
+            self._remove(product)
+            self._place(product, new_value)
+
+            if new_value < old_value:
+                alert = (product, old_value, new_value)
+
+                for position in range(bisect_right(self._thresholds, new_value),
+                                      bisect_right(self._thresholds, old_value)):
+                    callback = self._subscribers[position]
+                    alerts = self._pending.setdefault(callback, [])
+                    alerts.append(alert)
+
+                    if len(alerts) >= self.batch_size:
+                        ready.append((callback, self._pending.pop(callback)))
+
+        for callback, alerts in ready:
+            callback(alerts)
+
+    def _on_product_added(self, category: Category, product: Product) -> None:
+        with self._lock:
+            self._add(product)
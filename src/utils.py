@@ -1,11 +1,30 @@
 import json
 import os
+import sys
+from typing import TYPE_CHECKING, Iterable, Optional, TextIO
 
 from src.category import Category, CategoryIter
 from src.product import Product, Smartphone, LawnGrass
 from src.order import Order
 from src.exceptions import AddZeroQuantityException
 
+if TYPE_CHECKING:
+    from src.change_tracker import ChangeTracker
+
+
+PRODUCT_TYPES = {"Смартфоны": Smartphone, "Трава газонная": LawnGrass}
+
+
+def get_product_class(category_name: str) -> type:
+    """
+    Возвращает класс продукта, соответствующий категории.
+
+    :param category_name: Наименование категории.
+    :return: Smartphone, LawnGrass или Product для остальных категорий.
+    """
+
+    return PRODUCT_TYPES.get(category_name, Product)
+
 
 def load_products(filename: str) -> dict:
     """
@@ -27,12 +46,20 @@ def load_products(filename: str) -> dict:
             преобразовать из формата JSON. Исключение перебрасывается
             далее без изменений.
 
+    Файлы других форматов (.csv, .bin) читаются импортером из модуля importers, выбранным по расширению,
+    и возвращаются как итерируемый объект категорий в том же формате.
+
     Примечание:
     Функция требует, чтобы в той же директории, что и программа, присутствовала папка 'data'.
     """
 
     filepath = os.path.join("src/data", filename)
 
+    if not filename.lower().endswith(".json"):
+        from src import importers
+
+        return importers.load_catalog(filepath)
+
     try:
         with open(filepath) as file:
             result = json.loads(file.read())
@@ -42,7 +69,7 @@ def load_products(filename: str) -> dict:
         raise original_error
 
 
-def category_init(categories: dict) -> list:
+def category_init(categories: dict, pool=None, errors: Optional[list] = None) -> list:
     """
     Инициализирует и возвращает список объектов класса Category, каждый из которых содержит список уникальных продуктов.
 
@@ -58,56 +85,49 @@ def category_init(categories: dict) -> list:
         1. Создаёт объект класса Category.
         2. Проверяет продукты на уникальность в рамках категории с использованием статического метода check_unique_items
            класса Product.
-        3. Определяет тип каждого продукта и создаёт соответствующий продуктовый объект (например, Smartphone
-           или LawnGrass), используя классовый метод create_product.
-        4. Добавляет созданные объекты продуктов в соответствующие категории.
+        3. Определяет класс продуктов категории (например, Smartphone или LawnGrass) и разделяет записи на корректные
+           и отклоненные классовым методом validate_records, не возбуждая исключений.
+        4. Создаёт объекты из корректных записей одним вызовом create_products и добавляет их в категорию.
+        5. Печатает количество добавленных товаров категории.
+
+    Если список errors не передан, после обработки категории возбуждается исключение первой отклоненной записи
+    (AddZeroQuantityException для товара с нулевым количеством, KeyError при отсутствии обязательного поля). Если
+    список передан, отклоненные записи пропускаются, а в список добавляются кортежи (категория, запись, исключение).
 
-    Создание объектов продуктов и добавление их в категории может сопровождаться возникновением исключений ValueError,
-    что приведёт к немедленному прекращению работы функции.
+    Если передан пул соединений pool (ConnectionPool из модуля sqlite_category), категории создаются как
+    SQLiteCategory, а продукты каждой категории записываются в базу одним запросом executemany. Отклоненные записи
+    обрабатываются так же, как для обычных категорий.
 
     :param categories: Список словарей, представляющих категории и их продукты.
+    :param pool: Необязательный пул соединений SQLite.
+    :param errors: Необязательный список для сбора отклоненных записей.
     :return: Список объектов класса Category, каждый из которых содержит уникальные продукты, соответствующие
              его категории.
     """
 
+    if pool is not None:
+        from src.sqlite_category import sqlite_category_init
+
+        return sqlite_category_init(categories, pool, errors)
+
     categories_list = []
 
-    for index, item in enumerate(categories):
-        products = item["products"]
-        categories_list.append(Category(item["name"], item["description"]))
-        products = Product.check_unique_items(products)
-
-        for prod in products:
-            prod_name = prod["name"]
-
-            match item["name"]:
-                case "Смартфоны":
-                    try:
-                        categories_list[index].add_prod(Smartphone.create_product(prod))
-                    except AddZeroQuantityException as err:
-                        exit(err)
-                    else:
-                        print(f"Товар {prod_name} успешно добавлен")
-                    finally:
-                        print("Операция добавления товара завершена")
-                case "Трава газонная":
-                    try:
-                        categories_list[index].add_prod(LawnGrass.create_product(prod))
-                    except AddZeroQuantityException as err:
-                        exit(err)
-                    else:
-                        print(f"Товар {prod_name} успешно добавлен")
-                    finally:
-                        print("Операция добавления товара завершена")
-                case _:
-                    try:
-                        categories_list[index].add_prod(Product.create_product(prod))
-                    except AddZeroQuantityException as err:
-                        exit(err)
-                    else:
-                        print(f"Товар {prod_name} успешно добавлен")
-                    finally:
-                        print("Операция добавления товара завершена")
+    for item in categories:
+        category = Category(item["name"], item["description"])
+        categories_list.append(category)
+        product_class = get_product_class(item["name"])
+        valid, rejected = product_class.validate_records(Product.check_unique_items(item["products"]))
+
+        for prod in product_class.create_products(valid):
+            category.add_prod(prod)
+
+        print(f"Категория {category.name}: добавлено товаров {len(valid)}")
+
+        if rejected:
+            if errors is None:
+                raise rejected[0][1]
+
+            errors.extend((category.name, record, error) for record, error in rejected)
 
     return categories_list
 
@@ -124,7 +144,7 @@ def print_statistics(categories_list: list) -> None:
 
     Процесс работы функции:
     1. Итерирует по каждому элементу `categories_list`, печатая его (предполагается, что это объект категории).
-    2. Использует класс `CategoryIter` для итерации по товарам каждой категории и печатает их.
+    2. Печатает товары каждой категории одним блоком с помощью `write_category_listing`.
     3. Рассчитывает сумму стоимости товаров в каждой категории. Если количество товаров больше одного,
        суммирует значения, предполагая что у объектов товара есть числовые значения, которые можно суммировать.
        Если товар один, просто присваивается значение цены этого товара.
@@ -142,10 +162,7 @@ def print_statistics(categories_list: list) -> None:
     """
 
     for item in categories_list:
-        print(item)
-
-        for prod in CategoryIter(item):
-            print(prod)
+        write_category_listing(item, sys.stdout)
 
         prod_sum = 0
 
@@ -160,6 +177,77 @@ def print_statistics(categories_list: list) -> None:
         print()
 
 
+def write_category_listing(category: Category, stream: TextIO) -> None:
+    """
+    Записывает категорию и список ее продуктов в поток одним вызовом write().
+
+    Используются кэшированные строковые представления продуктов, поэтому повторный вывод неизменившихся продуктов
+    не требует их форматирования.
+
+    :param category: Объект категории.
+    :param stream: Поток для записи, например sys.stdout или открытый файл.
+    """
+
+    lines = [str(category)]
+    lines.extend(str(prod) for prod in CategoryIter(category))
+    stream.write("\n".join(lines) + "\n")
+
+
+def print_statistics_page(categories_list: list, page: int = 1, page_size: int = 20) -> int:
+    """
+    Печатает одну страницу каталога: не более page_size продуктов с заголовками их категорий.
+
+    Категории, целиком лежащие до начала страницы, пропускаются по количеству позиций без обхода их продуктов.
+
+    :param categories_list: Список категорий.
+    :param page: Номер страницы, начиная с 1. Номер вне диапазона заменяется ближайшей существующей страницей.
+    :param page_size: Количество продуктов на странице. Значение меньше 1 возбуждает ValueError.
+    :return: Общее количество страниц.
+    """
+
+    if page_size < 1:
+        raise ValueError("Размер страницы должен быть положительным")
+
+    total = sum(len(item.prod) for item in categories_list)
+    pages = max(1, -(-total // page_size))
+    page = min(max(1, page), pages)
+    start = (page - 1) * page_size
+    end = start + page_size
+    offset = 0
+    lines = []
+
+    for item in categories_list:
+        count = len(item.prod)
+
+        if offset + count > start and offset < end:
+            lines.append(str(item))
+            lines.extend(str(prod) for prod in item.prod[max(0, start - offset):end - offset])
+            lines.append("")
+
+        offset += count
+
+        if offset >= end:
+            break
+
+    lines.append(f"Страница {page} из {pages}")
+    sys.stdout.write("\n".join(lines) + "\n\n")
+
+    return pages
+
+
+def print_changes(tracker: 'ChangeTracker') -> None:
+    """
+    Печатает только продукты, измененные с момента предыдущего вызова, и очищает набор изменений.
+
+    :param tracker: Объект ChangeTracker, подписанный на изменения продуктов.
+    """
+
+    changed = tracker.take()
+
+    if changed:
+        sys.stdout.write("Изменения:\n" + "\n".join(str(prod) for prod in changed) + "\n\n")
+
+
 def change_price(categories_list: list, change_price_name: str) -> None:
     """
     Изменяет цену указанного товара в списках категорий.
@@ -210,6 +298,7 @@ def print_operations() -> str:
     print("\033[34m{}".format("Операции:"))
     print("1. Изменение цены продукта")
     print("2. Подготовка заказа для покупки товара")
+    print("3. Просмотр каталога по страницам")
 
     mode = input("\033[34m{}\033[0m".format("Введите номер операции или оставьте поле пустым для выхода "
                                             "из программы: "))
@@ -232,3 +321,160 @@ def get_order(categories_list: list, buying_product_name: str) -> None:
                     print(err)
                 finally:
                     print()
+
+
+def build_name_index(categories_list: list) -> dict:
+    """
+    Строит словарь для поиска товаров по наименованию.
+
+    При повторении наименования в нескольких категориях в словарь попадает первый найденный товар, как и при
+    последовательном поиске в change_price и get_order.
+
+    :param categories_list: Список категорий.
+    :return: Словарь {наименование: товар}.
+    """
+
+    index = {}
+
+    for item in categories_list:
+        for prod in item.prod:
+            index.setdefault(prod.name, prod)
+
+    return index
+
+
+def build_sku_index(categories_list: list) -> dict:
+    """
+    Строит словарь для поиска товаров по целочисленному идентификатору sku.
+
+    :param categories_list: Список категорий.
+    :return: Словарь {sku: товар}.
+    """
+
+    return {prod.sku: prod for item in categories_list for prod in item.prod}
+
+
+def find_by_sku(categories_list: list, sku: int) -> Optional[Product]:
+    """
+    Возвращает товар по целочисленному идентификатору sku или None, если товар не найден.
+
+    Для многократного поиска следует один раз построить словарь функцией build_sku_index.
+
+    :param categories_list: Список категорий.
+    :param sku: Идентификатор товара.
+    """
+
+    for item in categories_list:
+        for prod in item.prod:
+            if prod.sku == sku:
+                return prod
+
+    return None
+
+
+def category_stats(category: Category) -> dict:
+    """
+    Возвращает статистику категории в виде словаря.
+
+    :param category: Объект категории.
+    :return: Словарь с наименованием категории, количеством позиций, общим остатком и средней ценой.
+    """
+
+    return {"name": category.name, "products": len(category.prod), "quantity": len(category),
+            "avg_price": category.avg_price()}
+
+
+def execute_operation(categories_list: list, index: dict, operation: dict, sku_index: Optional[dict] = None) -> dict:
+    """
+    Выполняет одну операцию пакетного режима и возвращает результат в виде словаря.
+
+    Поддерживаемые операции:
+        - {"op": "reprice", "name": ..., "price": ..., "confirm": ...}: Изменение цены. Понижение цены выполняется
+                                                                       только при "confirm": true.
+        - {"op": "order", "name": ..., "quantity": ...}: Оформление заказа со списанием товара со склада.
+        - {"op": "stats"}: Статистика по категориям.
+
+    Вместо "name" товар можно указать идентификатором "sku".
+
+    :param categories_list: Список категорий.
+    :param index: Словарь товаров по наименованию, построенный build_name_index.
+    :param operation: Словарь операции.
+    :param sku_index: Словарь товаров по идентификатору, построенный build_sku_index. Если не передан, товар
+                      по идентификатору ищется перебором категорий.
+    :return: Словарь с ключом "ok" и результатом либо описанием ошибки в ключе "error".
+    """
+
+    if "sku" in operation:
+        sku = operation["sku"]
+        prod = sku_index.get(sku) if sku_index is not None else find_by_sku(categories_list, sku)
+    else:
+        prod = index.get(operation.get("name"))
+
+    match operation.get("op"):
+        case "reprice":
+            if prod is None:
+                return {"ok": False, "error": "Указанный товар не найден"}
+
+            if not prod.update_price(operation.get("price", 0), bool(operation.get("confirm"))):
+                return {"ok": False, "error": "Цена не изменена", "price": prod.price}
+
+            return {"ok": True, "sku": prod.sku, "name": prod.name, "price": prod.price}
+        case "order":
+            quantity = operation.get("quantity", 0)
+
+            if prod is None:
+                return {"ok": False, "error": "Указанный товар не найден"}
+
+            if not isinstance(quantity, int) or quantity < 0:
+                return {"ok": False, "error": "Некорректное количество товара"}
+
+            try:
+                order = Order(prod, quantity)
+            except AddZeroQuantityException as err:
+                return {"ok": False, "error": str(err)}
+
+            if not order.place():
+                return {"ok": False, "error": "Такого количества товара нет на складе"}
+
+            return {"ok": True, "sku": prod.sku, "name": prod.name, "quantity": order.buying_quantity,
+                    "total_price": order.get_total_price()}
+        case "stats":
+            return {"ok": True, "categories": [category_stats(item) for item in categories_list]}
+        case _:
+            return {"ok": False, "error": "Неизвестная операция"}
+
+
+def run_batch(categories_list: list, lines: Iterable[str], output: TextIO) -> int:
+    """
+    Выполняет операции из источника в формате JSON Lines и записывает результаты в том же формате.
+
+    Пустые строки и строки, начинающиеся с '#', пропускаются. Результаты записываются в output по одной строке
+    на операцию в порядке поступления.
+
+    :param categories_list: Список категорий.
+    :param lines: Строки с операциями, например открытый файл.
+    :param output: Поток для записи результатов.
+    :return: Количество выполненных операций.
+    """
+
+    index = build_name_index(categories_list)
+    sku_index = build_sku_index(categories_list)
+    count = 0
+
+    for line in lines:
+        line = line.strip()
+
+        if not line or line.startswith("#"):
+            continue
+
+        try:
+            result = execute_operation(categories_list, index, json.loads(line), sku_index)
+        except (json.decoder.JSONDecodeError, AttributeError, TypeError):
+            result = {"ok": False, "error": "Некорректная операция"}
+
+        output.write(json.dumps(result, ensure_ascii=False) + "\n")
+        count += 1
+
+    output.flush()
+
+    return count
@@ -0,0 +1,310 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple, Optional, Union
+
+from src.category import Category
+from src.product import Product
+
+
+class ProductSnapshot(NamedTuple):
+    """
+    Неизменяемый снимок товара в версии каталога.
+
+    Строковое представление и сложение совпадают с Product, поэтому снимки можно передавать функциям вывода
+    и статистики вместо товаров.
+    """
+
+    sku: int
+    type: str
+    name: str
+    description: str
+    price: float
+    stock_quantity: int
+    color: Optional[str]
+
+    @classmethod
+    def of(cls, prod: Product) -> 'ProductSnapshot':
+        """
+        Создает снимок текущего состояния товара.
+        """
+
+        return cls(prod.sku, type(prod).__name__, prod.name, prod.description, prod.price, prod.stock_quantity,
+                   prod.color)
+
+    def __str__(self) -> str:
+        """
+        Возвращает строковое представление товара в том же виде, что Product.__str__.
+        """
+
+        return f"{self.name}, {self.price} руб. Остаток: {self.stock_quantity} шт."
+
+    def __add__(self, other: 'ProductSnapshot') -> float:
+        """
+        Возвращает результирующую сумму (с учетом количества на складе) двух снимков товаров одного типа, как
+        Product.__add__. Конкатенация кортежей для снимков не используется.
+        """
+
+        if isinstance(other, ProductSnapshot) and other.type == self.type:
+            return self.stock_quantity * self.price + other.stock_quantity * other.price
+        else:
+            raise ValueError("Типы складываемых объектов не совпадают")
+
+
+class CategorySnapshot:
+    """
+    Неизменяемый снимок категории в версии каталога.
+
+    Поддерживает ту же часть интерфейса Category, что используют функции вывода и статистики: name, description,
+    prod, total_unique_products, __len__ и avg_price.
+    """
+
+    __slots__ = ("name", "description", "prod", "_positions", "_names")
+
+    def __init__(self, name: str, description: str, prod: tuple, positions: dict, names: dict) -> None:
+        """
+        Атрибуты:
+            - name (str): Название категории.
+            - description (str): Описание категории.
+            - prod (tuple): Кортеж снимков товаров ProductSnapshot.
+
+        Методы:
+            - find(self, sku): Снимок товара по идентификатору.
+            - find_by_name(self, name): Снимок первого товара с указанным наименованием.
+        """
+
+        self.name = name
+        self.description = description
+        self.prod = prod
+        self._positions = positions
+        self._names = names
+
+    @classmethod
+    def of(cls, category: Category) -> 'CategorySnapshot':
+        """
+        Создает снимок категории со снимками всех ее товаров.
+        """
+
+        prod = tuple(ProductSnapshot.of(item) for item in category.prod)
+        names = {}
+
+        for index, item in enumerate(prod):
+            names.setdefault(item.name, index)
+
+        return cls(category.name, category.description, prod, {item.sku: index for index, item in enumerate(prod)},
+                   names)
+
+    def replace(self, products: list) -> 'CategorySnapshot':
+        """
+        Возвращает новый снимок категории, в котором обновлены снимки указанных товаров. Снимки остальных товаров
+        и словари поиска по идентификатору и наименованию используются совместно с текущим снимком: изменение цены
+        или остатка не меняет позиций товаров.
+
+        :param products: Измененные товары категории.
+        """
+
+        prod = list(self.prod)
+
+        for item in products:
+            prod[self._positions[item.sku]] = ProductSnapshot.of(item)
+
+        return CategorySnapshot(self.name, self.description, tuple(prod), self._positions, self._names)
+
+    @property
+    def total_unique_products(self) -> int:
+        return len(self.prod)
+
+    def __len__(self) -> int:
+        """
+        Возвращает общее количество товаров в категории.
+        """
+
+        return sum(item.stock_quantity for item in self.prod)
+
+    def __str__(self) -> str:
+        return f"{self.name}, количество продуктов: {len(self)} шт. (Средняя цена: {self.avg_price()} руб.)"
+
+    def avg_price(self):
+        """
+        Подсчет среднего ценника товаров в категории.
+        """
+
+        return round(sum(item.price for item in self.prod) / len(self.prod), 2) if self.prod else 0
+
+    def find(self, sku: int) -> Optional[ProductSnapshot]:
+        """
+        Возвращает снимок товара по идентификатору или None, если товара нет в категории.
+        """
+
+        position = self._positions.get(sku)
+
+        return self.prod[position] if position is not None else None
+
+    def find_by_name(self, name: str) -> Optional[ProductSnapshot]:
+        """
+        Возвращает снимок первого товара с указанным наименованием или None, если товара нет в категории.
+        """
+
+        position = self._names.get(name)
+
+        return self.prod[position] if position is not None else None
+
+
+class CatalogVersion(NamedTuple):
+    """
+    Неизменяемая версия (поколение) каталога.
+    """
+
+    number: int
+    categories: tuple
+
+    def __iter__(self) -> Iterator[CategorySnapshot]:
+        return iter(self.categories)
+
+    def find(self, key: Union[int, str]) -> Optional[ProductSnapshot]:
+        """
+        Ищет товар по идентификатору sku или по наименованию. В каждой категории поиск выполняется по словарю,
+        поэтому время поиска зависит от количества категорий, а не товаров.
+
+        :param key: Идентификатор (int) или наименование товара (str).
+        :return: Снимок товара или None.
+        """
+
+        for category in self.categories:
+            prod = category.find(key) if isinstance(key, int) else category.find_by_name(key)
+
+            if prod is not None:
+                return prod
+
+        return None
+
+
+class VersionedCatalog:
+    """
+    Каталог с версиями по принципу копирования при записи.
+
+    Читатели получают текущую версию свойством current без блокировок: версия и снимки ее категорий и товаров не
+    изменяются, поэтому обход версии всегда дает согласованное состояние, даже если параллельно меняются цены,
+    остатки или состав категорий. Писатели изменяют обычные объекты Category и Product. Изменения отслеживаются
+    через обработчики изменений, и после каждого изменения (или один раз в конце блока update) публикуется новая
+    версия. В ней пересоздаются только снимки измененных категорий, а снимки остальных категорий используются
+    совместно с предыдущей версией. Публикация - это замена одной ссылки, поэтому она атомарна для читателей.
+    """
+
+    categories_list: list
+    auto_publish: bool
+
+    def __init__(self, categories_list: list, auto_publish: bool = True) -> None:
+        """
+        Атрибуты:
+            - categories_list (list): Список изменяемых объектов Category.
+            - auto_publish (bool): Публиковать новую версию после каждого изменения вне блока update.
+            - current (CatalogVersion): Текущая опубликованная версия.
+
+        Методы:
+            - attach(self) / detach(self): Подписывает каталог на изменения товаров и категорий и отменяет подписку.
+            - update(self): Контекстный менеджер, объединяющий изменения в одну версию.
+            - publish(self): Публикует версию с накопленными изменениями.
+        """
+
+        self.categories_list = categories_list
+        self.auto_publish = auto_publish
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._dirty = {}
+        self._product_categories = {}
+        self._snapshots = {category: CategorySnapshot.of(category) for category in categories_list}
+        self._current = CatalogVersion(1, tuple(self._snapshots.values()))
+
+    @property
+    def current(self) -> CatalogVersion:
+        """
+        Возвращает текущую опубликованную версию каталога.
+        """
+
+        return self._current
+
+    def attach(self) -> None:
+        """
+        Подписывает каталог на изменения цены и остатков товаров и на добавление товаров в категории.
+        """
+
+        for category in self.categories_list:
+            for prod in category.prod:
+                self._product_categories[prod] = category
+
+        Product.add_change_listener(self._on_product_change)
+        Category.add_change_listener(self._on_product_added)
+
+    def detach(self) -> None:
+        """
+        Отменяет подписку каталога на изменения товаров и категорий.
+        """
+
+        Product.remove_change_listener(self._on_product_change)
+        Category.remove_change_listener(self._on_product_added)
+
+    @contextmanager
+    def update(self) -> Iterator['VersionedCatalog']:
+        """
+        Объединяет изменения, сделанные в блоке with, в одну версию, публикуемую при выходе из блока.
+
+        Блоки update разных потоков выполняются по очереди, читатели при этом не блокируются.
+        """
+
+        with self._lock:
+            self._depth += 1
+
+            try:
+                yield self
+            finally:
+                self._depth -= 1
+
+                if not self._depth:
+                    self.publish()
+
+    def publish(self) -> CatalogVersion:
+        """
+        Публикует новую версию каталога, если с момента предыдущей публикации были изменения.
+
+        :return: Текущая версия каталога.
+        """
+
+        with self._lock:
+            if not self._dirty and len(self._snapshots) == len(self.categories_list):
+                return self._current
+
+            dirty, self._dirty = self._dirty, {}
+
+            for category in self.categories_list:
+                if category not in self._snapshots:
+                    self._snapshots[category] = CategorySnapshot.of(category)
+                elif category in dirty:
+                    changed = dirty[category]
+                    self._snapshots[category] = (CategorySnapshot.of(category) if changed is None
+                                                 else self._snapshots[category].replace(list(changed)))
+
+            self._current = CatalogVersion(self._current.number + 1,
+                                           tuple(self._snapshots[category] for category in self.categories_list))
+
+            return self._current
+
+    def _mark(self, category: Category, product: Optional[Product]) -> None:
+        with self._lock:
+            if product is None:
+                self._dirty[category] = None
+            elif self._dirty.get(category, {}) is not None:
+                self._dirty.setdefault(category, {})[product] = None
+
+            if self.auto_publish and not self._depth:
+                self.publish()
+
+    def _on_product_change(self, product: Product, field: str, old_value: float, new_value: float) -> None:
+        category = self._product_categories.get(product)
+
+        if category is not None:
+            self._mark(category, product)
+
+    def _on_product_added(self, category: Category, product: Product) -> None:
+        if category in self._snapshots or category in self.categories_list:
+            self._product_categories[product] = category
+            self._mark(category, None)
@@ -0,0 +1,204 @@
+import contextlib
+import copy
+import io
+import random
+
+import pytest
+
+from src import exporters, importers, logger
+from src.order import Order
+from src.order_pipeline import OrderPipeline
+from src.product import Product
+from src.stats import CatalogStatistics
+import src.utils as utils
+
+
+SEEDS = (1, 2, 3)
+PRODUCTS_PER_CATEGORY = 3000
+
+
+def generate_catalog(rnd: random.Random, size: int) -> list:
+    """
+    Генерирует каталог со смешанными типами товаров, повторяющимися наименованиями и нулевыми количествами.
+    """
+
+    catalog = []
+
+    for category_name in ("Смартфоны", "Трава газонная", "Чай"):
+        products = []
+
+        for _ in range(size):
+            name = f"{category_name} {rnd.randrange(size // 2)}"
+            prod = {"name": name, "description": f"Описание {name}", "price": round(rnd.uniform(1, 1000), 2),
+                    "quantity": 0 if rnd.random() < 0.05 else rnd.randint(1, 50),
+                    "color": rnd.choice(("Черный", "Белый"))}
+
+            if category_name == "Смартфоны":
+                prod.update(efficiency=rnd.randint(1, 10), model_name=f"M{rnd.randrange(100)}",
+                            internal_memory=rnd.choice((64, 128)))
+            elif category_name == "Трава газонная":
+                prod.update(origin_country=rnd.choice(("Россия", "США")), germination_period=rnd.randint(5, 30))
+
+            products.append(prod)
+
+        catalog.append({"name": category_name, "description": f"Категория {category_name}", "products": products})
+
+    return catalog
+
+
+def reference_unique(products: list) -> list:
+    """
+    Эталонное объединение товаров с одинаковым наименованием: максимальная цена, сумма количеств, остальные поля
+    первой записи.
+    """
+
+    groups = {}
+
+    for prod in products:
+        groups.setdefault(prod["name"], []).append(prod)
+
+    return [{**group[0], "price": max(prod["price"] for prod in group),
+             "quantity": sum(prod["quantity"] for prod in group)} for group in groups.values()]
+
+
+def load(catalog: list) -> tuple:
+    errors = []
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        categories_list = utils.category_init(copy.deepcopy(catalog), errors=errors)
+
+    return categories_list, errors
+
+
+@pytest.fixture(autouse=True)
+def quiet_logger():
+    previous = logger.set_sink(logger.LogSink(level=logger.WARNING))
+    yield
+    logger.set_sink(previous)
+
+
+@pytest.fixture
+def non_negative_stock():
+    violations = []
+
+    def listener(product, field, old_value, new_value):
+        if field == "stock_quantity" and new_value < 0:
+            violations.append((product.name, old_value, new_value))
+
+    Product.add_change_listener(listener)
+    yield violations
+    Product.remove_change_listener(listener)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_dedup_matches_reference(seed):
+    catalog = generate_catalog(random.Random(seed), PRODUCTS_PER_CATEGORY)
+
+    for item in catalog:
+        expected = reference_unique(copy.deepcopy(item["products"]))
+
+        assert Product.check_unique_items(copy.deepcopy(item["products"])) == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_import_invariants(seed):
+    catalog = generate_catalog(random.Random(seed), PRODUCTS_PER_CATEGORY)
+    categories_list, errors = load(catalog)
+
+    for item, category in zip(catalog, categories_list):
+        expected = reference_unique(copy.deepcopy(item["products"]))
+        valid = [prod for prod in expected if prod["quantity"] != 0]
+        product_class = utils.get_product_class(item["name"])
+
+        assert [{key: value for key, value in prod.to_dict().items() if key != "sku"}
+                for prod in category.prod] == valid
+        assert all(type(prod) is product_class for prod in category.prod)
+        assert len(category) == sum(prod["quantity"] for prod in valid)
+        assert len({prod.sku for prod in category.prod}) == len(category.prod)
+
+    assert sorted(record["name"] for _, record, _ in errors) == sorted(
+        prod["name"] for item in catalog for prod in reference_unique(copy.deepcopy(item["products"]))
+        if prod["quantity"] == 0)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_bulk_workload_invariants(seed, non_negative_stock):
+    rnd = random.Random(seed)
+    categories_list, _ = load(generate_catalog(rnd, PRODUCTS_PER_CATEGORY))
+    products = [prod for item in categories_list for prod in item.prod]
+    expected_stock = {prod: prod.stock_quantity for prod in products}
+    expected_price = {prod: prod.price for prod in products}
+    index = utils.build_name_index(categories_list)
+    sku_index = utils.build_sku_index(categories_list)
+    statistics = CatalogStatistics(categories_list)
+    statistics.attach()
+    pipeline = OrderPipeline(categories_list, batch_size=64)
+
+    try:
+        for _ in range(20):
+            for _ in range(500):
+                prod = rnd.choice(products)
+
+                match rnd.randrange(3):
+                    case 0:
+                        new_price = round(rnd.uniform(-10, 1000), 2)
+                        confirm = rnd.random() < 0.5
+
+                        if prod.update_price(new_price, confirm):
+                            expected_price[prod] = new_price
+                    case 1:
+                        quantity = rnd.randint(1, 30)
+
+                        if Order(prod, quantity).place():
+                            expected_stock[prod] -= quantity
+                    case 2:
+                        quantity = rnd.randint(1, 30)
+                        result = utils.execute_operation(categories_list, index,
+                                                         {"op": "order", "sku": prod.sku, "quantity": quantity},
+                                                         sku_index)
+
+                        if result["ok"]:
+                            expected_stock[prod] -= quantity
+
+            requests = [(rnd.choice(products).name, rnd.randint(1, 30)) for _ in range(300)]
+
+            for result in pipeline.process(requests):
+                if result.fulfilled:
+                    expected_stock[index[result.name]] -= result.quantity
+
+            summary = statistics.catalog()
+
+            assert summary["quantity"] == sum(len(item) for item in categories_list)
+            assert summary["quantity"] == sum(prod.stock_quantity for prod in products)
+            assert summary["stock_value"] == pytest.approx(sum(prod.price * prod.stock_quantity for prod in products))
+            assert summary["products"] == len(products)
+    finally:
+        statistics.detach()
+
+    assert non_negative_stock == []
+    assert {prod: prod.stock_quantity for prod in products} == expected_stock
+    assert {prod: prod.price for prod in products} == expected_price
+    assert all(prod.price > 0 for prod in products)
+
+
+@pytest.mark.parametrize("extension", [".json", ".csv", ".bin"])
+def test_export_import_round_trip(tmp_path, extension):
+    categories_list, _ = load(generate_catalog(random.Random(0), PRODUCTS_PER_CATEGORY))
+    path = str(tmp_path / f"catalog{extension}")
+
+    if extension == ".bin":
+        importers.write_binary([{"name": item.name, "description": item.description,
+                                 "products": [prod.to_dict() for prod in item.prod]} for item in categories_list], path)
+    else:
+        exporters.export_catalog(categories_list, path)
+
+    restored, errors = load(list(importers.load_catalog(path)))
+
+    def without_sku(categories):
+        return [[{key: value for key, value in prod.to_dict().items() if key != "sku"} for prod in item.prod]
+                for item in categories]
+
+    assert errors == []
+    assert without_sku(restored) == without_sku(categories_list)
+    assert not {prod.sku for item in restored for prod in item.prod} & {
+        prod.sku for item in categories_list for prod in item.prod}
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from src import exporters, importers
+from src.product import Product
+import src.utils as utils
+
+
+@pytest.fixture
+def categories_list():
+    catalog = [{"name": "Смартфоны", "description": "Телефоны", "products": [
+        {"name": "S21", "description": "Смартфон", "price": 80000.5, "quantity": 5, "color": "Черный",
+         "efficiency": "Высокая", "model_name": "S21", "internal_memory": 128}]},
+        {"name": "Чай", "description": "Чайные товары", "products": [
+            {"name": "Чайник", "description": "Электрический чайник", "price": 2500, "quantity": 3},
+            {"name": "Заварник", "description": "Фарфоровый", "price": 900, "quantity": 1}]}]
+    categories_list = utils.category_init(catalog)
+    categories_list[1].prod[1].stock_quantity = 0
+
+    return categories_list
+
+
+def test_json_round_trip(tmp_path, categories_list, monkeypatch):
+    monkeypatch.setattr(exporters, "CHUNK_SIZE", 1)
+    path = str(tmp_path / "catalog.json")
+
+    assert exporters.export_catalog(categories_list, path) == 3
+
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+
+    assert data == [{"name": item.name, "description": item.description,
+                     "products": [prod.to_dict() for prod in item.prod]} for item in categories_list]
+
+
+def test_filtered_jsonl(tmp_path, categories_list):
+    path = str(tmp_path / "catalog.jsonl")
+
+    assert exporters.export_catalog(categories_list, path, category="Чай", in_stock=True) == 1
+
+    with open(path, encoding="utf-8") as file:
+        lines = [json.loads(line) for line in file]
+
+    assert lines == [{"category": "Чай", **categories_list[1].prod[0].to_dict()}]
+
+
+def test_csv_is_importable(tmp_path, categories_list):
+    path = str(tmp_path / "catalog.csv")
+    exporters.export_catalog(categories_list, path, in_stock=True)
+    restored = utils.category_init(importers.load_catalog(path))
+
+    assert [[prod.name for prod in item.prod] for item in restored] == [["S21"], ["Чайник"]]
+    assert isinstance(restored[1].prod[0], Product)
@@ -0,0 +1,40 @@
+import json
+
+from src import feeds, importers
+
+
+SUPPLIER_A = [{"name": "Чай", "description": "Чайные товары", "products": [
+    {"name": "Чайник", "description": "Электрический", "price": 2500, "quantity": 3},
+    {"name": "Чайник", "description": "Электрический", "price": 2000, "quantity": 1}]}]
+SUPPLIER_B = [{"name": "Смартфоны", "description": "Телефоны", "products": [
+    {"name": "S21", "description": "Смартфон", "price": 80000, "quantity": 5, "color": "Черный",
+     "efficiency": 95, "model_name": "S21", "internal_memory": 128}]},
+    {"name": "Чай", "description": "Другое описание", "products": [
+        {"name": "Чайник", "description": "Электрический", "price": 2700, "quantity": 2},
+        {"name": "Заварник", "description": "Фарфоровый", "price": 900, "quantity": 4}]}]
+
+
+def test_merge_feeds():
+    merged = feeds.merge_feeds([SUPPLIER_A, SUPPLIER_B])
+
+    assert [item["name"] for item in merged] == ["Чай", "Смартфоны"]
+    assert merged[0]["description"] == "Чайные товары"
+    assert [(prod["name"], prod["price"], prod["quantity"]) for prod in merged[0]["products"]] == [
+        ("Чайник", 2700, 6), ("Заварник", 900, 4)]
+    assert SUPPLIER_A[0]["products"][0]["quantity"] == 3
+
+
+def test_import_feeds_in_process_pool(tmp_path):
+    first = str(tmp_path / "a.json")
+    second = str(tmp_path / "b.csv")
+
+    with open(first, "w", encoding="utf-8") as file:
+        json.dump(SUPPLIER_A, file, ensure_ascii=False)
+
+    importers.write_csv(SUPPLIER_B, second)
+    categories_list = feeds.import_feeds([first, second], workers=2)
+
+    assert [item.name for item in categories_list] == ["Чай", "Смартфоны"]
+    assert [(prod.name, prod.price, prod.stock_quantity) for prod in categories_list[0].prod] == [
+        ("Чайник", 2700, 6), ("Заварник", 900, 4)]
+    assert type(categories_list[1].prod[0]).__name__ == "Smartphone"
@@ -0,0 +1,62 @@
+from unittest import mock
+
+import pytest
+
+from src import importers
+import src.utils as utils
+
+
+@pytest.fixture
+def catalog():
+    return [{"name": "Смартфоны", "description": "Телефоны", "products": [
+        {"name": "S21", "description": "Смартфон", "price": 80000.5, "quantity": 5, "color": "Черный",
+         "efficiency": "Высокая", "model_name": "S21", "internal_memory": 128}]},
+        {"name": "Трава газонная", "description": "Газоны", "products": [
+            {"name": "Газон", "description": "Семена", "price": 500, "quantity": 40, "color": "Зеленый",
+             "origin_country": "Россия", "germination_period": 14}]},
+        {"name": "Чай", "description": "Чайные товары", "products": [
+            {"name": "Чайник", "description": "Электрический чайник", "price": 2500, "quantity": 3}]}]
+
+
+@pytest.mark.parametrize("extension, writer", [(".csv", importers.write_csv), (".bin", importers.write_binary)])
+def test_round_trip(tmp_path, catalog, extension, writer):
+    path = str(tmp_path / f"catalog{extension}")
+    writer(catalog, path)
+
+    assert list(importers.load_catalog(path)) == catalog
+
+
+def test_csv_keeps_empty_required_strings(tmp_path):
+    catalog = [{"name": "Чай", "description": "Чайные товары", "products": [
+        {"name": "Чайник", "description": "", "price": 2500, "quantity": 3}]}]
+    path = str(tmp_path / "catalog.csv")
+    importers.write_csv(catalog, path)
+
+    assert list(importers.load_catalog(path)) == catalog
+    assert utils.category_init(importers.load_catalog(path))[0].prod[0].description == ""
+
+
+def test_binary_long_strings(tmp_path):
+    description = "ж" * 0x8000
+    catalog = [{"name": "Чай", "description": "Чайные товары", "products": [
+        {"name": "Чайник", "description": description, "price": 2500, "quantity": 3}]}]
+    path = str(tmp_path / "catalog.bin")
+    importers.write_binary(catalog, path)
+
+    assert list(importers.load_catalog(path)) == catalog
+
+    with mock.patch.object(importers, "_NONE", 16), pytest.raises(ValueError):
+        importers.write_binary(catalog, path)
+
+
+def test_feeds_category_init(tmp_path, catalog):
+    path = str(tmp_path / "catalog.bin")
+    importers.write_binary(catalog, path)
+    categories_list = utils.category_init(importers.load_catalog(path))
+
+    assert [type(item.prod[0]).__name__ for item in categories_list] == ["Smartphone", "LawnGrass", "Product"]
+
+
+def test_unknown_extension():
+    with pytest.raises(ValueError):
+        importers.load_catalog("catalog.xml")
@@ -0,0 +1,105 @@
+import pytest
+
+from src.category import Category
+from src.inventory import Inventory, get_inventory
+from src.order import Order
+from src.order_pipeline import OrderPipeline
+from src.product import Product
+from src.exceptions import AddZeroQuantityException
+import src.utils as utils
+
+
+@pytest.fixture
+def prod():
+    return Product("Чайник", "Электрический чайник", 2500, 5)
+
+
+@pytest.fixture
+def inventory():
+    inventory = Inventory()
+    inventory.attach()
+    yield inventory
+    inventory.detach()
+
+
+def test_order_can_buy_exact_stock(prod):
+    order = Order(prod, 5)
+
+    assert order.is_can_buy()
+    assert order.place()
+    assert prod.stock_quantity == 0
+
+
+def test_reservations_are_counted(inventory, prod):
+    first = inventory.reserve(prod, 3)
+    second = inventory.reserve(prod, 3)
+
+    assert first.is_fulfilled
+    assert not second.is_fulfilled
+    assert (inventory.on_hand(prod), inventory.reserved(prod), inventory.available(prod)) == (5, 3, 2)
+
+    inventory.commit(first)
+
+    assert (inventory.on_hand(prod), inventory.reserved(prod), inventory.available(prod)) == (2, 0, 2)
+    assert not Order(prod, 3).place(inventory)
+    assert Order(prod, 2).place(inventory)
+
+    with pytest.raises(AddZeroQuantityException):
+        inventory.reserve(prod, 0)
+
+
+def test_partial_fulfilment_and_backorder(inventory, prod):
+    reservation = inventory.reserve(prod, 8, allow_partial=True, backorder=True)
+
+    assert (reservation.reserved, reservation.backordered) == (5, 3)
+
+    prod.stock_quantity += 2
+
+    assert (reservation.reserved, reservation.backordered) == (7, 1)
+
+    inventory.release(reservation)
+
+    assert inventory.available(prod) == 7
+    assert reservation.backordered == 0
+
+
+def test_every_order_path_respects_reservations(prod):
+    category = Category("Чай", "Чайные товары")
+    category.add_prod(prod)
+    reservation = get_inventory().reserve(prod, 4)
+
+    try:
+        index = utils.build_name_index([category])
+        result = utils.execute_operation([category], index, {"op": "order", "name": "Чайник", "quantity": 2})
+        pipeline = OrderPipeline([category])
+        pipeline_results = list(pipeline.process([("Чайник", 2), ("Чайник", 1)]))
+
+        assert not Order(prod, 2).place()
+        assert not result["ok"]
+        assert [item.fulfilled for item in pipeline_results] == [False, True]
+        assert get_inventory().commit(reservation)
+        assert prod.stock_quantity == 0
+    finally:
+        get_inventory().release(reservation)
+
+
+def test_commit_fails_after_external_decrement(inventory, prod):
+    reservation = inventory.reserve(prod, 4)
+    prod.stock_quantity = 2
+
+    assert not inventory.commit(reservation)
+    assert prod.stock_quantity == 2
+    assert reservation.reserved == 4
+
+
+def test_negative_quantities_are_rejected(inventory, prod):
+    with pytest.raises(ValueError):
+        Order(prod, -3).place(inventory)
+
+    with pytest.raises(ValueError):
+        inventory.purchase_many([(prod, 1), (prod, -3)])
+
+    with pytest.raises(AddZeroQuantityException):
+        inventory.purchase(prod, 0)
+
+    assert prod.stock_quantity == 5
@@ -0,0 +1,136 @@
+import pytest
+
+from src.category import Category
+from src.journal import Journal
+from src.order import Order
+from src.product import Product
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+
+        return self.now
+
+
+@pytest.fixture
+def category():
+    category = Category("Чай", "Чайные товары")
+    category.add_prod(Product("Чайник", "Электрический чайник", 2500, 10))
+
+    return category
+
+
+@pytest.fixture
+def journal(category):
+    journal = Journal(compact_every=2, clock=FakeClock())
+    journal.track([category])
+    journal.attach()
+    yield journal
+    journal.detach()
+
+
+def test_price_at(journal, category):
+    prod = category.prod[0]
+    prod.price = 3000
+    prod.price = 3500
+
+    assert journal.price_at("Чайник", 0.5) == 2500
+    assert journal.price_at("Чайник", 1.0) == 3000
+    assert journal.price_at("Чайник", 10.0) == 3500
+    assert journal.price_at("Кружка", 10.0) is None
+
+
+def test_stock_movements_from_orders(journal, category):
+    Order(category.prod[0], 3).place()
+    Order(category.prod[0], 2).place()
+
+    assert journal.stock_movements("Чай", 0, 10) == [(1.0, "Чайник", -3), (2.0, "Чайник", -2)]
+    assert journal.stock_movements("Чай", 1.5, 10) == [(2.0, "Чайник", -2)]
+    assert journal.stock_at("Чайник", 1.5) == 7
+    assert len(journal) == 2
+
+
+def test_products_added_after_track(journal, category):
+    cup = Product("Кружка", "", 300, 5)
+    category.add_prod(cup)
+    Order(cup, 2).place()
+
+    assert journal.stock_movements("Чай", 0, 10) == [(1.0, "Кружка", -2)]
+    assert journal.stock_at("Кружка", 1.5, "Чай") == 3
+
+
+def test_load_from_file(tmp_path):
+    path = str(tmp_path / "journal.bin")
+    journal = Journal(path)
+    journal.record("Чайник", "Чай", 0, 2500, 3000, timestamp=1.0)
+    journal.record("Чайник", "Чай", 1, 10, 7, timestamp=2.0)
+    journal.compact()
+
+    restored = Journal.load(path)
+
+    assert restored.price_at("Чайник", 1.5) == 3000
+    assert restored.stock_movements("Чай", 0, 5) == [(2.0, "Чайник", -3)]
+
+
+def test_same_name_in_different_categories():
+    journal = Journal()
+    journal.record("Чайник", "Чай", 0, 2500, 3000, timestamp=1.0)
+    journal.record("Чайник", "Посуда", 0, 900, 1000, timestamp=2.0)
+
+    assert journal.price_at("Чайник", 5.0, "Чай") == 3000
+    assert journal.price_at("Чайник", 5.0, "Посуда") == 1000
+
+    with pytest.raises(ValueError):
+        journal.price_at("Чайник", 5.0)
+
+
+def test_out_of_order_timestamps():
+    journal = Journal()
+    journal.record("Чайник", "Чай", 1, 10, 7, timestamp=5.0)
+    journal.record("Чайник", "Чай", 1, 7, 6, timestamp=3.0)
+
+    assert journal.stock_movements("Чай", 0, 10) == [(3.0, "Чайник", -1), (5.0, "Чайник", -3)]
+    assert journal.stock_at("Чайник", 4.0) == 6
+
+
+def test_compact_before_rewrites_file(tmp_path):
+    path = str(tmp_path / "journal.bin")
+    journal = Journal(path)
+
+    for index in range(100):
+        journal.record("Чайник", "Чай", 0, 1000 + index, 1001 + index, timestamp=float(index))
+
+    journal.compact()
+    size = (tmp_path / "journal.bin").stat().st_size
+    journal.compact(before=95.0)
+
+    assert (tmp_path / "journal.bin").stat().st_size < size / 10
+    assert journal.price_at("Чайник", 96.5) == 1097
+
+    restored = Journal.load(path)
+
+    assert restored.price_at("Чайник", 95.0) == 1096
+    assert restored.price_at("Чайник", 10.0) == 1095
+    assert len(restored) == 5
+
+
+def test_load_ignores_torn_record(tmp_path):
+    path = str(tmp_path / "journal.bin")
+    journal = Journal(path)
+    journal.record("Чайник", "Чай", 0, 2500, 3000, timestamp=1.0)
+    journal.record("Чайник", "Чай", 0, 3000, 3500, timestamp=2.0)
+    journal.compact()
+
+    with open(path, "r+b") as file:
+        file.truncate(file.seek(0, 2) - 5)
+
+    restored = Journal.load(path)
+    restored.record("Чайник", "Чай", 0, 3000, 4000, timestamp=3.0)
+    restored.compact()
+
+    assert Journal.load(path).price_at("Чайник", 10.0) == 4000
+    assert Journal.load(path).price_at("Чайник", 2.5) == 3000
@@ -0,0 +1,90 @@
+import io
+import asyncio
+
+import pytest
+
+from src import logger
+from src.product import Product
+
+
+class ReprCounter:
+    def __init__(self):
+        self.calls = 0
+
+    def __repr__(self):
+        self.calls += 1
+
+        return "ReprCounter"
+
+
+@pytest.fixture
+def stream():
+    return io.StringIO()
+
+
+def test_disabled_level_is_not_formatted(stream):
+    sink = logger.LogSink(level=logger.WARNING, stream=stream)
+    obj = ReprCounter()
+    sink.log(logger.INFO, obj)
+    sink.flush()
+
+    assert obj.calls == 0
+    assert stream.getvalue() == ""
+
+
+def test_records_are_buffered_until_capacity(stream):
+    sink = logger.LogSink(capacity=3, stream=stream)
+    sink.log(logger.INFO, "first", str)
+    sink.log(logger.INFO, "second", str)
+
+    assert stream.getvalue() == ""
+
+    sink.log(logger.INFO, "third", str)
+
+    assert stream.getvalue() == "first\nsecond\nthird\n"
+
+
+def test_threaded_sink_writes_on_flush(stream):
+    sink = logger.ThreadedLogSink(stream=stream)
+    sink.log(logger.INFO, "message", str)
+    sink.close()
+
+    assert stream.getvalue() == "message\n"
+
+
+def test_asyncio_sink_writes_on_drain(stream):
+    async def scenario():
+        sink = logger.AsyncioLogSink(asyncio.get_running_loop(), stream=stream)
+        task = asyncio.create_task(sink.run())
+        sink.log(logger.INFO, "message", str)
+        await sink.drain()
+        sink.close()
+        await task
+
+    asyncio.run(scenario())
+
+    assert stream.getvalue() == "message\n"
+
+
+def test_product_creation_goes_to_sink(stream):
+    previous = logger.set_sink(logger.LogSink(capacity=1, stream=stream))
+
+    try:
+        Product("Чайник", "Электрический чайник", 2500, 3)
+    finally:
+        logger.set_sink(previous)
+
+    assert "Создан объект: Product(Чайник" in stream.getvalue()
+
+
+def test_record_captures_state_at_creation(stream):
+    previous = logger.set_sink(logger.LogSink(stream=stream))
+
+    try:
+        prod = Product("Чайник", "Электрический чайник", 2500, 3)
+        prod.update_price(3000)
+        logger.get_sink().flush()
+    finally:
+        logger.set_sink(previous)
+
+    assert "Product(Чайник, Электрический чайник, 2500, 3, None)" in stream.getvalue()
@@ -0,0 +1,50 @@
+import threading
+
+import pytest
+
+from src.category import Category
+from src.product import Product
+from src.order_pipeline import OrderPipeline
+
+
+@pytest.fixture
+def categories_list():
+    category = Category("Чай", "Чайные товары")
+    category.add_prod(Product("Чайник", "Электрический чайник", 2500, 10))
+    category.add_prod(Product("Кружка", "Керамическая кружка", 300, 5))
+
+    return [category]
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 100])
+def test_process(categories_list, batch_size):
+    pipeline = OrderPipeline(categories_list, batch_size)
+    requests = [("Чайник", 4), ("Кружка", 2), ("Чайник", 4), ("Чайник", 3), ("Ложка", 1), ("Кружка", 0)]
+    results = list(pipeline.process(requests))
+
+    assert [result.fulfilled for result in results] == [True, True, True, False, False, False]
+    assert results[0].total_price == 10000
+    assert results[4].reason == "Указанный товар не найден"
+    assert [prod.stock_quantity for prod in categories_list[0].prod] == [2, 3]
+
+
+def test_concurrent_pipelines_do_not_oversell(categories_list):
+    kettle = categories_list[0].prod[0]
+    kettle.stock_quantity = 1000
+    fulfilled = []
+
+    def worker():
+        pipeline = OrderPipeline(categories_list, batch_size=16)
+        fulfilled.append(sum(result.quantity for result in pipeline.process([("Чайник", 1)] * 400)
+                             if result.fulfilled))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert sum(fulfilled) == 1000
+    assert kettle.stock_quantity == 0
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from src.exceptions import AddZeroQuantityException
+from src.persistence import CatalogStore
+from src.product import Product
+
+
+@pytest.fixture
+def initial_data():
+    return [{"name": "Смартфоны", "description": "Телефоны", "products": [
+        {"name": "S21", "description": "Смартфон", "price": 80000, "quantity": 5, "color": "Черный",
+         "efficiency": 125, "model_name": "S21", "internal_memory": 128}]},
+        {"name": "Чай", "description": "Чайные товары", "products": [
+            {"name": "Чайник", "description": "Электрический чайник", "price": 2500, "quantity": 3},
+            {"name": "Чайник", "description": "Электрический чайник", "price": 2700, "quantity": 1}]}]
+
+
+def test_changes_survive_restart(tmp_path, initial_data):
+    store = CatalogStore(str(tmp_path), fsync_every=2)
+    categories_list = store.open(initial_data)
+    kettle = categories_list[1].prod[0]
+
+    assert kettle.price == 2700
+    assert kettle.stock_quantity == 4
+
+    kettle.update_price(2000, confirm_decrease=True)
+    kettle.stock_quantity = 0
+    categories_list[1].add_prod(Product("Кружка", "Керамическая кружка", 300, 10))
+    store.close()
+
+    restored = CatalogStore(str(tmp_path)).open()
+    kettle, mug = restored[1].prod
+
+    assert (kettle.price, kettle.stock_quantity) == (2000, 0)
+    assert mug.name == "Кружка"
+    assert restored[0].prod[0].internal_memory == 128
+
+
+def test_checkpoint_truncates_wal(tmp_path, initial_data):
+    store = CatalogStore(str(tmp_path), checkpoint_every=2)
+    categories_list = store.open(initial_data)
+    phone = categories_list[0].prod[0]
+    phone.stock_quantity = 4
+    phone.stock_quantity = 3
+    store.close()
+
+    assert os.path.getsize(store.wal_path) == 0
+
+    store = CatalogStore(str(tmp_path))
+
+    assert store.open()[0].prod[0].stock_quantity == 3
+
+    store.close()
+
+
+def test_torn_tail_is_discarded(tmp_path, initial_data):
+    store = CatalogStore(str(tmp_path))
+    store.open(initial_data)[0].prod[0].stock_quantity = 4
+    store.close()
+
+    with open(store.wal_path, "a", encoding="utf-8") as file:
+        file.write('{"op": "stock", "categ')
+
+    store = CatalogStore(str(tmp_path))
+
+    assert store.open()[0].prod[0].stock_quantity == 4
+
+    store.close()
+
+    with open(store.wal_path, encoding="utf-8") as file:
+        assert file.read().endswith("\n")
+
+
+def test_first_run_rejects_zero_quantity(tmp_path, initial_data):
+    initial_data[1]["products"].append({"name": "Кружка", "description": "Кружка", "price": 300, "quantity": 0})
+
+    with pytest.raises(AddZeroQuantityException):
+        CatalogStore(str(tmp_path)).open(initial_data)
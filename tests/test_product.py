@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import patch
 
+from src.interning import StringTable
 from src.product import Product, Smartphone, LawnGrass
 
 
@@ -176,3 +177,110 @@ def test_product_addition_with_itself(prod1):
     expected_value = 2 * (prod1.stock_quantity * prod1.price)
 
     assert total_value == expected_value
+
+
+def test_update_price_without_input(prod1):
+    assert prod1.update_price(100) is False
+    assert prod1.update_price(-1, confirm_decrease=True) is False
+    assert prod1.update_price(100, confirm_decrease=True) is True
+    assert prod1.price == 100
+
+
+def test_rendering_is_cached_until_setter(prod1):
+    rendered = str(prod1)
+
+    assert str(prod1) is rendered
+    assert repr(prod1) is repr(prod1)
+
+    prod1.stock_quantity = 3
+
+    assert str(prod1) == "Tea Kettle, 120.5 руб. Остаток: 3 шт."
+    assert repr(prod1) == "Product(Tea Kettle, Stainless steel tea kettle, 120.5, 3, None)"
+
+
+def test_smartphone_repr(non_product):
+    assert repr(non_product) == "Smartphone(Coffee Maker, Drip coffee maker, 99.99, 5, 125, Maker, 125, grey)"
+
+
+def test_create_products_matches_create_product():
+    records = [{"name": "Монитор", "description": "4K монитор", "price": 30000, "quantity": 20},
+               {"name": "Мышь", "description": "Игровая мышь", "price": 5000, "quantity": 5, "color": "Красный"}]
+    products = Product.create_products(records)
+
+    assert [repr(item) for item in products] == [repr(Product.create_product(item)) for item in records]
+
+    products[0].stock_quantity = 1
+
+    assert str(products[0]) == "Монитор, 30000 руб. Остаток: 1 шт."
+
+
+def test_create_products_validates_keys_before_building():
+    records = [{"name": "Монитор", "description": "4K монитор", "price": 30000, "quantity": 20},
+               {"name": "Мышь", "price": 5000, "quantity": 5}]
+    sku = Product.next_sku()
+
+    with pytest.raises(KeyError, match="description"):
+        Product.create_products(records)
+
+    assert Product.next_sku() == sku + 1
+
+
+def test_create_products_from_columns():
+    columns = {"name": ["Зеленый ковер"], "description": ["Газонная трава"], "price": [5000], "quantity": [40],
+               "color": ["Зеленый"], "origin_country": ["Нидерланды"], "germination_period": [14]}
+    lawn_grass, = LawnGrass.create_products(columns)
+
+    assert isinstance(lawn_grass, LawnGrass)
+    assert lawn_grass.germination_period == 14
+    assert lawn_grass.price == 5000
+
+    del columns["origin_country"]
+
+    with pytest.raises(KeyError):
+        LawnGrass.create_products(columns)
+
+
+def test_sku_and_interning():
+    first = Product("Чайник", "Электрический " + "чайник", 2500, 3, "Белый")
+    second = LawnGrass("Газон", "Электрический " + "чайник", 100, 1, "Белый", "Россия", 7)
+    third, = Product.create_products([{"name": "Кружка", "description": "Электрический " + "чайник",
+                                       "price": 300, "quantity": 1}])
+
+    assert len({first.sku, second.sku, third.sku}) == 3
+    assert first.description is second.description is third.description
+    assert first.color is second.color
+
+
+def test_sku_survives_to_dict():
+    prod = Smartphone("S21", "Смартфон", 80000, 5, "Черный", 125, "S21", 128)
+    data = prod.to_dict()
+    duplicate, = Smartphone.create_products([data])
+
+    assert duplicate.sku != prod.sku
+
+    sku = prod.sku
+    del prod, duplicate
+
+    assert Smartphone.create_product(data).sku == sku
+    assert Product.next_sku() > sku
+
+
+def test_string_table_collect():
+    table = StringTable(collect_threshold=1000)
+    kept = table.intern("".join(["Зеленый", " чай"]))
+    table.intern("".join(["Черный", " чай"]))
+
+    assert table.collect() == 1
+    assert len(table) == 1
+    assert table.intern("".join(["Зеленый", " чай"])) is kept
+
+
+def test_duplicate_sku_is_reassigned():
+    first, second = Product.create_products([{"sku": 10 ** 9, "name": "Чайник", "description": "", "price": 2500,
+                                              "quantity": 3},
+                                             {"sku": 10 ** 9, "name": "Кружка", "description": "", "price": 300,
+                                              "quantity": 5}])
+
+    assert first.sku == 10 ** 9
+    assert second.sku > first.sku
+    assert Product.next_sku() > second.sku
@@ -0,0 +1,81 @@
+import pytest
+
+from src import quote_cache
+from src.exceptions import AddZeroQuantityException
+from src.order import Order
+from src.product import Product
+from src.quote_cache import QuoteCache
+
+
+@pytest.fixture
+def cache():
+    cache = QuoteCache(maxsize=2)
+    cache.attach()
+    yield cache
+    cache.detach()
+
+
+def test_hits_and_misses(cache):
+    prod = Product("Чайник", "", 2500, 3)
+    first = cache.quote(prod, 2)
+
+    assert first.total_price == 5000 and first.available
+    assert cache.quote(prod, 2) is first
+    assert not cache.quote(prod, 4).available
+    assert cache.stats() == {"hits": 1, "misses": 2, "hit_rate": 0.3333, "evictions": 0, "invalidations": 0,
+                             "size": 2}
+
+
+def test_lru_eviction(cache):
+    prod = Product("Чайник", "", 2500, 3)
+    cache.quote(prod, 1)
+    cache.quote(prod, 2)
+    cache.quote(prod, 1)
+    cache.quote(prod, 3)
+    cache.quote(prod, 1)
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["hits"] == 2
+
+
+def test_invalidated_by_setters(cache):
+    kettle = Product("Чайник", "", 2500, 3)
+    cup = Product("Чашка", "", 300, 10)
+    cache.quote(kettle, 2)
+    cup_quote = cache.quote(cup, 2)
+
+    kettle.stock_quantity = 1
+
+    assert not cache.quote(kettle, 2).available
+    assert cache.quote(cup, 2) is cup_quote
+
+    kettle.update_price(3000)
+
+    assert cache.quote(kettle, 1).total_price == 3000
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_zero_quantity_is_not_cached(cache):
+    with pytest.raises(AddZeroQuantityException):
+        cache.quote(Product("Чайник", "", 2500, 3), 0)
+
+    assert len(cache) == 0
+
+
+def test_change_during_quote_is_not_cached(cache, monkeypatch):
+    prod = Product("Чайник", "", 2500, 3)
+
+    class ConcurrentWriteOrder(Order):
+        def __init__(self, prod, buying_quantity):
+            prod.update_price(3000)
+            super().__init__(prod, buying_quantity)
+
+    monkeypatch.setattr(quote_cache, "Order", ConcurrentWriteOrder)
+    cache.quote(prod, 1)
+
+    assert len(cache) == 0
+
+    monkeypatch.undo()
+
+    assert cache.quote(prod, 1).total_price == 3000
+    assert len(cache) == 1
@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import pytest
+
+from src.category import Category
+from src.product import Product
+from src.service import CatalogService
+from src.versioned_catalog import VersionedCatalog
+
+
+@pytest.fixture
+def service():
+    category = Category("Чай", "Чайные товары")
+    category.add_prod(Product("Чайник", "Электрический чайник", 2500, 3))
+    category.add_prod(Product("Кружка", "Керамическая кружка", 300, 10))
+
+    return CatalogService([category])
+
+
+def test_lookup_and_missing(service):
+    response = asyncio.run(service.handle({"op": "lookup", "name": "Чайник"}))
+    sku = service.categories_list[0].prod[0].sku
+
+    assert response == {"ok": True, "sku": sku, "name": "Чайник", "description": "Электрический чайник", "price": 2500,
+                        "quantity": 3}
+    assert asyncio.run(service.handle({"op": "lookup", "sku": sku}))["name"] == "Чайник"
+    assert asyncio.run(service.handle({"op": "lookup", "name": "Нет"}))["ok"] is False
+
+
+def test_price_requests_are_batched(service):
+    async def scenario():
+        return await asyncio.gather(*(service.handle({"op": "price", "name": name})
+                                      for name in ("Чайник", "Кружка", "Чайник")))
+
+    assert [item["price"] for item in asyncio.run(scenario())] == [2500, 300, 2500]
+
+
+def test_malformed_price_request_does_not_block_batch(service):
+    async def scenario():
+        bad = service.get_price(["Чайник"])
+        return await asyncio.wait_for(asyncio.gather(service.handle({"op": "price", "name": ["Чайник"]}),
+                                                     service.handle({"op": "price", "name": "Кружка"}),
+                                                     bad, return_exceptions=True), 1)
+
+    invalid, valid, error = asyncio.run(scenario())
+
+    assert invalid["ok"] is False
+    assert valid == {"ok": True, "price": 300}
+    assert isinstance(error, TypeError)
+
+
+def test_order_decrements_stock(service):
+    response = asyncio.run(service.handle({"op": "order", "name": "Чайник", "quantity": 2}))
+
+    assert response["total_price"] == 5000
+    assert service.categories_list[0].prod[0].stock_quantity == 1
+    assert asyncio.run(service.handle({"op": "order", "name": "Чайник", "quantity": 0}))["ok"] is False
+
+
+def test_tcp_round_trip(service):
+    async def scenario():
+        server = await service.serve(port=0)
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.sockets[0].getsockname()[1])
+        writer.write(b'{"op": "stats"}\n')
+        await writer.drain()
+        line = await reader.readline()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+        return json.loads(line)
+
+    response = asyncio.run(scenario())
+
+    assert response["categories"][0] == {"name": "Чай", "products": 2, "quantity": 13, "avg_price": 1400.0}
+
+
+def test_reads_from_versioned_catalog(service):
+    catalog = VersionedCatalog(service.categories_list, auto_publish=False)
+    catalog.attach()
+    service.catalog = catalog
+
+    try:
+        service.categories_list[0].prod[0].stock_quantity = 1
+
+        assert asyncio.run(service.handle({"op": "lookup", "name": "Чайник"}))["quantity"] == 3
+        assert asyncio.run(service.handle({"op": "stats"}))["categories"][0]["quantity"] == 13
+
+        catalog.publish()
+
+        assert asyncio.run(service.handle({"op": "lookup", "name": "Чайник"}))["quantity"] == 1
+        assert asyncio.run(service.handle({"op": "price", "name": "Кружка"}))["price"] == 300
+    finally:
+        catalog.detach()
@@ -0,0 +1,146 @@
+import gc
+
+import pytest
+
+from src.category import CategoryIter
+from src.interning import strings
+from src.product import Product
+from src.spilling_catalog import SpillingCatalog
+import src.utils as utils
+
+
+CATALOG = [{"name": name, "description": f"Категория {name}", "products": [
+    {"name": f"{name} {index}", "description": "", "price": 100 + index, "quantity": index + 1, "color": "Черный",
+     "efficiency": 1, "model_name": "M", "internal_memory": 64, "origin_country": "Россия", "germination_period": 7}
+    for index in range(4)]} for name in ("Смартфоны", "Трава газонная", "Чай")]
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = SpillingCatalog(budget=8, directory=str(tmp_path))
+    catalog.load(CATALOG)
+    yield catalog
+    catalog.close()
+
+
+def test_cold_categories_are_spilled(catalog):
+    smartphones, grass, tea = catalog.categories_list
+
+    assert not smartphones.is_resident and grass.is_resident and tea.is_resident
+    assert catalog.resident_products == 8
+
+
+def test_transparent_reload(catalog):
+    smartphones, grass, tea = catalog.categories_list
+    skus = [prod.sku for prod in smartphones.prod]
+
+    assert [prod.name for prod in CategoryIter(smartphones)] == [f"Смартфоны {index}" for index in range(4)]
+    assert [prod.sku for prod in smartphones.prod] == skus
+    assert type(smartphones.prod[0]).__name__ == "Smartphone"
+    assert not grass.is_resident and tea.is_resident
+    assert catalog.stats()["loads"] == 1
+    assert catalog.resident_products <= catalog.budget
+
+
+def test_changes_survive_spill(catalog):
+    smartphones, grass, tea = catalog.categories_list
+    smartphones.prod[0].stock_quantity = 42
+    len(grass), len(tea)
+
+    assert not smartphones.is_resident
+    assert smartphones.prod[0].stock_quantity == 42
+
+
+def test_lookup_and_add_touch_category(catalog):
+    smartphones, grass, tea = catalog.categories_list
+    index = utils.build_name_index(catalog.categories_list)
+
+    assert index["Смартфоны 0"].price == 100
+    assert not smartphones.is_resident
+
+    tea.add_prod(Product("Чай 9", "", 10, 1))
+
+    assert [prod.name for prod in tea.prod][-1] == "Чай 9"
+    assert tea.total_unique_products == 5
+    assert not grass.is_resident
+    assert catalog.resident_products == 5
+
+
+def test_unchanged_category_is_not_rewritten(catalog):
+    smartphones, grass, tea = catalog.categories_list
+
+    for category in (smartphones, grass):
+        assert len(category.prod) == 4
+
+    writes = catalog.stats()["writes"]
+
+    for category in (tea, smartphones):
+        assert len(category.prod) == 4
+
+    assert catalog.stats()["writes"] == writes
+
+    tea.prod[0].price = 500
+    assert len(grass.prod) == 4
+    assert catalog.stats()["writes"] == writes + 1
+    assert tea.prod[0].price == 500
+
+
+def test_external_references_survive_spill(catalog):
+    smartphones, grass, tea = catalog.categories_list
+    index = utils.build_name_index(catalog.categories_list)
+
+    order = {"op": "order", "name": "Чай 3", "quantity": 1}
+
+    assert utils.execute_operation(catalog.categories_list, index, order)["ok"]
+
+    len(smartphones.prod), len(grass.prod)
+
+    assert not tea.is_resident
+    assert utils.execute_operation(catalog.categories_list, index, {**order, "name": "Чай 2", "quantity": 2})["ok"]
+
+    assert tea.prod[2] is index["Чай 2"] and tea.prod[3] is index["Чай 3"]
+    assert [prod.stock_quantity for prod in tea.prod] == [1, 2, 1, 3]
+
+    del index
+    len(smartphones.prod), len(grass.prod)
+
+    assert [prod.stock_quantity for prod in tea.prod] == [1, 2, 1, 3]
+
+
+def test_strings_are_reinterned_and_released(catalog):
+    smartphones, grass, tea = catalog.categories_list
+
+    assert smartphones.prod[0].color is grass.prod[0].color is strings.intern("Черный")
+    assert smartphones.prod[0].model_name is strings.intern("M")
+
+    tea.add_prod(Product(" ".join(["Улун", "особый"]), "", 10, 1))
+    len(smartphones.prod), len(grass.prod)
+
+    assert not tea.is_resident
+    assert " ".join(["Улун", "особый"]) not in strings
+    assert tea.prod[-1].name is strings.intern(" ".join(["Улун", "особый"]))
+
+
+def test_closed_catalog_raises(catalog):
+    smartphones = catalog.categories_list[0]
+    catalog.close()
+
+    with pytest.raises(ValueError):
+        smartphones.prod
+
+    with pytest.raises(ValueError):
+        catalog.add_category("Посуда", "")
+
+
+def test_change_to_spilled_product_survives_dropped_reference(catalog):
+    smartphones, grass, tea = catalog.categories_list
+    prod = tea.prod[0]
+    len(smartphones.prod), len(grass.prod)
+
+    assert not tea.is_resident
+
+    prod.update_price(999)
+    del prod
+    gc.collect()
+
+    assert tea.prod[0].price == 999
@@ -0,0 +1,172 @@
+import io
+import threading
+
+import pytest
+
+from src import logger
+from src.category import CategoryIter
+from src.product import Product, Smartphone
+from src.sqlite_category import ConnectionPool, SQLiteCategory
+from src.exceptions import AddZeroQuantityException
+import src.utils as utils
+
+
+@pytest.fixture
+def pool():
+    pool = ConnectionPool()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def categories_list(pool):
+    categories = utils.category_init([
+        {"name": "Смартфоны", "description": "Телефоны", "products": [
+            {"name": "S21", "description": "Смартфон", "price": 80000, "quantity": 5, "color": "Черный",
+             "efficiency": 125, "model_name": "S21", "internal_memory": 128},
+            {"name": "S21", "description": "Смартфон", "price": 82000, "quantity": 2, "color": "Черный",
+             "efficiency": 125, "model_name": "S21", "internal_memory": 128},
+            {"name": "A52", "description": "Смартфон", "price": 30000, "quantity": 10, "color": "Белый",
+             "efficiency": 90, "model_name": "A52", "internal_memory": 64}]}], pool)
+    yield categories
+
+    for category in categories:
+        category.close()
+
+
+def test_aggregates(categories_list):
+    category = categories_list[0]
+
+    assert isinstance(category, SQLiteCategory)
+    assert len(category) == 17
+    assert category.avg_price() == 56000
+    assert category.total_unique_products == 2
+    assert [prod.name for prod in CategoryIter(category)] == ["S21", "A52"]
+
+
+def test_lookups_and_write_back(categories_list, pool):
+    category = categories_list[0]
+    phone = category.find("S21")
+
+    assert isinstance(phone, Smartphone)
+    assert phone.internal_memory == 128
+    assert [prod.name for prod in category.price_range(0, 50000)] == ["A52"]
+
+    phone.stock_quantity = 1
+
+    assert len(category) == 11
+
+
+def test_add_prod_validation(categories_list):
+    category = categories_list[0]
+
+    with pytest.raises(AddZeroQuantityException):
+        category.add_prod(Product("Чехол", "Чехол", 500, 0))
+
+    with pytest.raises(ValueError):
+        category.add_prod("не продукт")
+
+    category.add_prod(Product("Чехол", "Чехол", 500, 3))
+
+    assert category.find("Чехол").price == 500
+    assert len(category.prod) == 3
+
+
+def test_concurrent_readers(categories_list):
+    category = categories_list[0]
+    results = []
+
+    def reader():
+        results.append((len(category), category.avg_price()))
+
+    threads = [threading.Thread(target=reader) for _ in range(8)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert results == [(17, 56000)] * 8
+
+
+def test_sku_is_stable(categories_list):
+    category = categories_list[0]
+    sku = category.find("A52").sku
+
+    assert category.find("A52").sku == sku
+    assert [prod.sku for prod in category] == [prod.sku for prod in category]
+    assert utils.find_by_sku(categories_list, sku).name == "A52"
+
+
+def test_materialized_products_keep_identity_and_are_not_logged(categories_list, pool):
+    category = categories_list[0]
+    stream = io.StringIO()
+    previous = logger.set_sink(logger.LogSink(capacity=1, stream=stream))
+
+    try:
+        phone = category.find("A52")
+
+        assert category.find("A52") is phone
+        assert category.price_range(0, 50000) == [phone]
+    finally:
+        logger.set_sink(previous)
+
+    assert stream.getvalue() == ""
+
+    category.add_prod(Product("Чехол", "Чехол", 500, 3))
+
+    with pool.connection() as connection:
+        row_ids = [row[0] for row in connection.execute("SELECT id FROM products ORDER BY id")]
+
+    assert len(set(row_ids)) == 3
+
+
+def test_close_detaches_category(categories_list):
+    category = categories_list[0]
+    phone = category.find("A52")
+    listeners = list(Product.change_listeners)
+
+    category.close()
+    category.close()
+    phone.stock_quantity = 1
+
+    assert Product.change_listeners == listeners
+    assert category.find("A52").stock_quantity == 10
+
+
+def test_rejected_records(pool):
+    catalog = [{"name": "Чай", "description": "Чайные товары", "products": [
+        {"name": "Чайник", "description": "Чайник", "price": 2500, "quantity": 3},
+        {"name": "Кружка", "description": "Кружка", "price": 300, "quantity": 0},
+        {"name": "Блюдце", "price": 150, "quantity": 2}]}]
+    errors = []
+    category, = utils.category_init(catalog, pool, errors)
+
+    assert [prod.name for prod in category.prod] == ["Чайник"]
+    assert [(name, record["name"], type(error)) for name, record, error in errors] == [
+        ("Чай", "Кружка", AddZeroQuantityException), ("Чай", "Блюдце", KeyError)]
+
+    category.close()
+
+    with pytest.raises(AddZeroQuantityException):
+        utils.category_init([{**catalog[0], "name": "Посуда"}], pool)
+
+
+def test_write_back_during_iteration():
+    pool = ConnectionPool(size=1)
+    category, = utils.category_init([{"name": "Чай", "description": "", "products": [
+        {"name": "Чайник", "description": "", "price": 2500, "quantity": 3},
+        {"name": "Кружка", "description": "", "price": 300, "quantity": 5}]}], pool)
+
+    for prod in category:
+        prod.stock_quantity -= 1
+
+    partial = iter(category)
+    next(partial)
+
+    assert len(category) == 6
+    assert category.find("Кружка").stock_quantity == 4
+
+    category.close()
+    pool.close()
@@ -0,0 +1,53 @@
+import pytest
+
+from src.category import Category
+from src.product import Product
+from src.stats import CatalogStatistics, percentile
+
+
+@pytest.fixture
+def statistics():
+    category = Category("Чай", "Чайные товары")
+
+    for name, price, quantity in (("Чайник", 1000, 2), ("Заварник", 2000, 10), ("Чашка", 3000, 4),
+                                  ("Ложка", 4000, 20)):
+        category.add_prod(Product(name, "", price, quantity))
+
+    statistics = CatalogStatistics([category], percentiles=(25, 50), bins=2, low_stock=4)
+    statistics.attach()
+    yield statistics
+    statistics.detach()
+
+
+def test_percentile():
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile([1, 2, 3, 4], 100) == 4
+    assert percentile([], 50) == 0
+
+
+def test_category(statistics):
+    result = statistics.category("Чай")
+
+    assert result["min_price"] == 1000 and result["max_price"] == 4000
+    assert result["median_price"] == 2500
+    assert result["percentiles"] == {25: 1750, 50: 2500}
+    assert result["stock_value"] == 2000 + 20000 + 12000 + 80000
+    assert result["stock_value_histogram"]["counts"] == [3, 1]
+    assert result["low_stock"] == 2
+    assert statistics.catalog()["quantity"] == 36
+
+
+def test_cached_until_mutation(statistics):
+    category = statistics.categories_list[0]
+    first = statistics.category(category)
+
+    assert statistics.category(category) is first
+
+    category.prod[0].stock_quantity = 10
+
+    assert statistics.category(category)["low_stock"] == 1
+
+    category.add_prod(Product("Сито", "", 500, 1))
+
+    assert statistics.category(category)["min_price"] == 500
+    assert statistics.catalog()["products"] == 5
@@ -0,0 +1,81 @@
+import pytest
+
+from src.category import Category
+from src.order import Order
+from src.product import Product
+from src.stock_alerts import StockAlerts
+
+
+@pytest.fixture
+def category():
+    category = Category("Чай", "Чайные товары")
+
+    for name, quantity in (("Чайник", 10), ("Заварник", 3), ("Чашка", 6)):
+        category.add_prod(Product(name, "", 1000, quantity))
+
+    return category
+
+
+@pytest.fixture
+def alerts(category):
+    alerts = StockAlerts(batch_size=2)
+    alerts.track([category])
+    alerts.attach()
+    yield alerts
+    alerts.detach()
+
+
+def test_below(alerts, category):
+    assert [prod.name for prod in alerts.below(7)] == ["Заварник", "Чашка"]
+
+    category.prod[0].stock_quantity = 1
+    category.add_prod(Product("Ложка", "", 100, 2))
+
+    assert [prod.name for prod in alerts.below(3)] == ["Чайник", "Ложка"]
+    assert len(alerts) == 4
+
+
+def test_batched_delivery(alerts, category):
+    received = []
+    alerts.subscribe(5, received.append)
+    alerts.subscribe(2, received.append)
+
+    Order(category.prod[0], 6).place()
+    category.prod[2].stock_quantity = 5
+    category.prod[1].stock_quantity = 4
+
+    assert received == []
+
+    category.prod[2].stock_quantity = 4
+
+    assert received == [[(category.prod[0], 10, 4), (category.prod[2], 5, 4)]]
+
+    category.prod[1].stock_quantity = 0
+    alerts.flush()
+
+    assert received[1:] == [[(category.prod[1], 4, 0)]]
+
+
+def test_unsubscribe(alerts, category):
+    received = []
+    alerts.subscribe(5, received.append)
+    category.prod[0].stock_quantity = 1
+    alerts.unsubscribe(5, received.append)
+    alerts.flush()
+
+    assert received == []
+
+    with pytest.raises(ValueError):
+        alerts.unsubscribe(5, received.append)
+
+
+def test_change_while_detached(alerts, category):
+    kettle = category.prod[0]
+    alerts.detach()
+    kettle.stock_quantity = 8
+    alerts.attach()
+    kettle.stock_quantity = 2
+
+    assert kettle.stock_quantity == 2
+    assert [prod.name for prod in alerts.below(3)] == ["Чайник"]
+    assert [prod.name for prod in alerts.below(9)] == ["Чайник", "Заварник", "Чашка"]
@@ -1,10 +1,14 @@
 import pytest
+import io
 import json
 import os
+import subprocess
+import sys
 from unittest import mock
 
 
 import src.utils as utils
+from src.exceptions import AddZeroQuantityException
 
 
 def test_load_products_success():
@@ -35,3 +39,111 @@ def test_load_products_json_decode_error():
     with pytest.raises(json.decoder.JSONDecodeError):
         with mock.patch('builtins.open', mock.mock_open(read_data=file_content)):
             utils.load_products(filename)
+
+
+@pytest.fixture
+def categories_list():
+    from src.category import Category
+    from src.product import Product
+
+    category = Category("Чай", "Чайные товары")
+    category.add_prod(Product("Чайник", "Электрический чайник", 2500, 3))
+
+    return [category]
+
+
+def test_run_batch(categories_list):
+    lines = ['{"op": "reprice", "name": "Чайник", "price": 2000}',
+             '{"op": "reprice", "name": "Чайник", "price": 2000, "confirm": true}',
+             '',
+             '{"op": "order", "name": "Чайник", "quantity": 3}',
+             '{"op": "order", "name": "Кружка", "quantity": 1}',
+             'not json']
+    output = io.StringIO()
+
+    assert utils.run_batch(categories_list, lines, output) == 5
+
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+
+    assert [item["ok"] for item in results] == [False, True, True, False, False]
+    assert categories_list[0].prod[0].price == 2000
+
+
+def test_name_and_sku_indexes_are_separate(categories_list):
+    prod = categories_list[0].prod[0]
+
+    assert utils.build_name_index(categories_list) == {"Чайник": prod}
+    assert utils.build_sku_index(categories_list) == {prod.sku: prod}
+    assert utils.execute_operation(categories_list, {}, {"op": "order", "sku": prod.sku, "quantity": 1})["ok"]
+    assert prod.stock_quantity == 2
+
+
+def test_write_category_listing(categories_list):
+    stream = io.StringIO()
+    utils.write_category_listing(categories_list[0], stream)
+
+    assert stream.getvalue() == ("Чай, количество продуктов: 3 шт. (Средняя цена: 2500.0 руб.)\n"
+                                 "Чайник, 2500 руб. Остаток: 3 шт.\n")
+
+
+def test_print_statistics_page(categories_list, capsys):
+    from src.product import Product
+
+    categories_list[0].add_prod(Product("Кружка", "Керамическая кружка", 300, 10))
+
+    assert utils.print_statistics_page(categories_list, 2, 1) == 2
+
+    output = capsys.readouterr().out
+
+    assert "Кружка, 300 руб." in output
+    assert "Чайник" not in output
+    assert "Страница 2 из 2" in output
+
+    with pytest.raises(ValueError):
+        utils.print_statistics_page(categories_list, 1, 0)
+
+
+def test_print_changes(categories_list, capsys):
+    from src.change_tracker import ChangeTracker
+
+    tracker = ChangeTracker()
+    tracker.attach()
+
+    try:
+        categories_list[0].prod[0].stock_quantity = 1
+        utils.print_changes(tracker)
+        utils.print_changes(tracker)
+    finally:
+        tracker.detach()
+
+    assert capsys.readouterr().out == "Изменения:\nЧайник, 2500 руб. Остаток: 1 шт.\n\n"
+
+
+def test_category_init_collects_rejected_records():
+    errors = []
+    categories = utils.category_init([{"name": "Чай", "description": "Чайные товары", "products": [
+        {"name": "Чайник", "description": "", "price": 2500, "quantity": 3},
+        {"name": "Заварник", "description": "", "price": 900, "quantity": 0},
+        {"name": "Ложка", "price": 100, "quantity": 1}]}], errors=errors)
+
+    assert [prod.name for prod in categories[0].prod] == ["Чайник"]
+    assert [(name, record["name"], type(error)) for name, record, error in errors] == [
+        ("Чай", "Заварник", AddZeroQuantityException), ("Чай", "Ложка", KeyError)]
+
+
+def test_category_init_raises_first_rejection():
+    with pytest.raises(AddZeroQuantityException):
+        utils.category_init([{"name": "Чай", "description": "", "products": [
+            {"name": "Заварник", "description": "", "price": 900, "quantity": 0}]}])
+
+
+def test_optional_subsystems_are_loaded_lazily():
+    modules = "('asyncio', 'src.importers', 'src.exporters', 'src.sqlite_category', 'src.stats', 'pkgutil')"
+    code = ("import sys, src, src.utils as utils; "
+            f"print(sorted(name for name in {modules} if name in sys.modules)); "
+            "src.stats, src.importers; "
+            f"print(sorted(name for name in {modules} if name in sys.modules)); "
+            "print(hasattr(src, 'missing'), 'sqlite_category' in dir(src))")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.split("\n")[:3] == ["[]", "['src.importers', 'src.stats']", "False True"]
@@ -0,0 +1,126 @@
+import io
+import threading
+
+import pytest
+
+from src import logger
+from src.category import Category
+from src.product import Product
+import src.utils as utils
+from src.versioned_catalog import VersionedCatalog
+
+
+@pytest.fixture
+def catalog():
+    tea = Category("Чай", "Чайные товары")
+    tea.add_prod(Product("Чайник", "", 2500, 10))
+    tea.add_prod(Product("Заварник", "", 900, 10))
+    cups = Category("Посуда", "Кружки")
+    cups.add_prod(Product("Кружка", "", 300, 5))
+    catalog = VersionedCatalog([tea, cups])
+    catalog.attach()
+    yield catalog
+    catalog.detach()
+
+
+def test_snapshot_is_immutable(catalog):
+    version = catalog.current
+    kettle = catalog.categories_list[0].prod[0]
+    kettle.update_price(3000)
+
+    assert version.find(kettle.sku).price == 2500
+    assert catalog.current.find(kettle.sku).price == 3000
+    assert catalog.current.find("Чайник").price == 3000
+    assert catalog.current.number == version.number + 1
+
+
+def test_unchanged_categories_are_shared(catalog):
+    version = catalog.current
+    catalog.categories_list[0].prod[1].stock_quantity = 4
+
+    assert catalog.current.categories[1] is version.categories[1]
+    assert catalog.current.categories[0].prod[0] is version.categories[0].prod[0]
+    assert len(catalog.current.categories[0]) == 14
+
+
+def test_update_publishes_once(catalog):
+    version = catalog.current
+
+    with catalog.update():
+        catalog.categories_list[0].prod[0].stock_quantity = 1
+        catalog.categories_list[1].add_prod(Product("Блюдце", "", 150, 2))
+
+        assert catalog.current is version
+
+    assert catalog.current.number == version.number + 1
+    assert [prod.name for prod in catalog.current.categories[1].prod] == ["Кружка", "Блюдце"]
+
+
+def test_readers_see_consistent_totals(catalog):
+    first, second = catalog.categories_list[0].prod
+    done = threading.Event()
+    totals = set()
+
+    def writer():
+        for _ in range(500):
+            with catalog.update():
+                first.stock_quantity -= 1
+                second.stock_quantity += 1
+            with catalog.update():
+                first.stock_quantity += 1
+                second.stock_quantity -= 1
+
+        done.set()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+
+    while not done.is_set():
+        totals.add(len(catalog.current.categories[0]))
+
+    thread.join()
+
+    assert totals <= {20}
+
+
+def test_readers_accept_snapshots(catalog, capsys):
+    version = catalog.current
+    stream = io.StringIO()
+    logger.get_sink().flush()
+    capsys.readouterr()
+
+    utils.print_statistics(version.categories)
+    statistics = capsys.readouterr().out
+    utils.print_statistics(catalog.categories_list)
+
+    assert statistics == capsys.readouterr().out
+    assert "Всего товаров на сумму: 34000" in statistics
+
+    utils.print_statistics_page(version.categories, 1, 2)
+    page = capsys.readouterr().out
+    utils.print_statistics_page(catalog.categories_list, 1, 2)
+
+    assert page == capsys.readouterr().out
+    assert "Чайник, 2500 руб. Остаток: 10 шт." in page
+
+    utils.write_category_listing(version.categories[1], stream)
+
+    assert stream.getvalue() == ("Посуда, количество продуктов: 5 шт. (Средняя цена: 300.0 руб.)\n"
+                                 "Кружка, 300 руб. Остаток: 5 шт.\n")
+    assert [utils.category_stats(item) for item in version] == [utils.category_stats(item)
+                                                                  for item in catalog.categories_list]
+
+
+def test_find_uses_category_indexes(catalog):
+    version = catalog.current
+    catalog.categories_list[0].prod[1].stock_quantity = 1
+    current = catalog.current
+
+    assert current.categories[0]._names is version.categories[0]._names
+    assert current.find("Заварник").stock_quantity == 1
+    assert current.categories[1].find_by_name("Кружка").price == 300
+    assert current.find("Блюдце") is None
+
+    catalog.categories_list[1].add_prod(Product("Блюдце", "", 150, 2))
+
+    assert catalog.current.find("Блюдце").price == 150